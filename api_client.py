@@ -1,10 +1,1631 @@
 import tkinter as tk
 from tkinter import scrolledtext
 from tkinter import messagebox
+from tkinter import filedialog
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.connection import HTTPConnection, HTTPSConnection
+from urllib3.connectionpool import HTTPConnectionPool, HTTPSConnectionPool
+from urllib3.exceptions import NewConnectionError
 import json
+from urllib.parse import urlsplit
 from ttkbootstrap import Style, Window, ttk
 import os
+import re
+import io
+import csv
+import atexit
+import itertools
+import time
+import shutil
+import tempfile
+import queue
+import zlib
+import socket
+import random
+import base64
+import hashlib
+import http.server
+import sqlite3
+from email.utils import parsedate_to_datetime
+from requests.structures import CaseInsensitiveDict
+import threading
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, FIRST_COMPLETED, wait
+
+try:
+    import keyring
+except ImportError:
+    keyring = None
+
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:
+    pa = pq = None
+
+BODY_METHODS = ("POST", "PUT", "PATCH")
+STREAM_CHUNK_SIZE = 256 * 1024
+INLINE_BODY_LIMIT = 2 * 1024 * 1024
+PREVIEW_PAGE_SIZE = 64 * 1024
+JSON_TREE_PAGE = 500
+PROGRESS_INTERVAL = 0.2
+HISTORY_PAGE_SIZE = 200
+KEYRING_SERVICE = "api_client"
+CACHE_MAX_BYTES = 256 * 1024 * 1024
+EXPORT_BATCH_SIZE = 50000
+RETRY_STATUSES = (429, 500, 502, 503, 504)
+RESULT_BODY_LIMIT = 64 * 1024
+RUNNER_TREE_LIMIT = 1000
+TIMING_HISTORY = 50
+REDACTED_HEADERS = ("authorization", "proxy-authorization", "cookie", "set-cookie", "x-api-key")
+HOP_BY_HOP_HEADERS = ("connection", "keep-alive", "transfer-encoding", "content-encoding", "content-length")
+
+def parse_key_value_text(raw_text):
+    parsed_dict = {}
+    malformed = []
+    for line in raw_text.splitlines():
+        line = line.strip()
+        if line:
+            parts = line.split(':', 1)
+            if len(parts) == 2:
+                parsed_dict[parts[0].strip()] = parts[1].strip()
+            else:
+                malformed.append(line)
+    return parsed_dict, malformed
+
+def build_request_kwargs(req_data, timeout=10.0, allow_redirects=True, verify=True):
+    # Turns a saved-request dict (the same shape _save_current_request stores)
+    # into keyword arguments for requests. Safe to call off the Tk thread.
+    method = req_data.get("method", "GET")
+    url = req_data.get("url", "").strip()
+    if not url:
+        raise ValueError("URL cannot be empty.")
+
+    headers, _ = parse_key_value_text(req_data.get("headers", ""))
+    query_params, _ = parse_key_value_text(req_data.get("query_params", ""))
+    body_type = req_data.get("body_type", "Raw (JSON)")
+    request_body_raw = req_data.get("body", "")
+
+    request_data = None
+    json_data = None
+    if method in BODY_METHODS:
+        if body_type == "Raw (JSON)":
+            if request_body_raw:
+                try:
+                    json_data = json.loads(request_body_raw)
+                except json.JSONDecodeError as e:
+                    raise ValueError(f"Invalid JSON in request body: {e}")
+            else:
+                json_data = {}
+        elif body_type == "Form Data (x-www-form-urlencoded)":
+            request_data = request_body_raw
+            if "Content-Type" not in headers:
+                headers["Content-Type"] = "application/x-www-form-urlencoded"
+        elif body_type != "None":
+            request_data = request_body_raw
+
+    auth_username = req_data.get("auth_username", "")
+    auth_password = req_data.get("auth_password", "")
+    return {
+        "method": method,
+        "url": url,
+        "headers": headers,
+        "params": query_params,
+        "json": json_data,
+        "data": request_data,
+        "auth": (auth_username, auth_password) if auth_username or auth_password else None,
+        "timeout": timeout,
+        "allow_redirects": allow_redirects,
+        "verify": verify,
+    }
+
+_connection_timing = threading.local()
+
+class _TimedConnectionMixin:
+    # Records DNS, socket connect and full connect (incl. TLS handshake) times
+    # for the calling thread whenever urllib3 opens a new connection. The host
+    # is resolved here and urllib3 is pointed at the address for the duration
+    # of the connect, so name resolution is timed apart from the TCP connect.
+    def _new_conn(self):
+        host = self._dns_host
+        started = time.perf_counter()
+        try:
+            addresses = socket.getaddrinfo(host, self.port, 0, socket.SOCK_STREAM)
+        except (socket.gaierror, UnicodeError):
+            addresses = []
+        resolved = time.perf_counter()
+        _connection_timing.dns_ms = (resolved - started) * 1000 if addresses else None
+        try:
+            if addresses:
+                self._dns_host = addresses[0][4][0]
+            sock = super()._new_conn()
+        except NewConnectionError:
+            if len(addresses) < 2:
+                raise
+            # Let urllib3 walk every resolved address as it normally would.
+            self._dns_host = host
+            sock = super()._new_conn()
+        finally:
+            self._dns_host = host
+        _connection_timing.connect_ms = (time.perf_counter() - resolved) * 1000
+        return sock
+
+    def connect(self):
+        started = time.perf_counter()
+        super().connect()
+        _connection_timing.handshake_ms = (time.perf_counter() - started) * 1000
+
+class TimedHTTPConnection(_TimedConnectionMixin, HTTPConnection):
+    pass
+
+class TimedHTTPSConnection(_TimedConnectionMixin, HTTPSConnection):
+    pass
+
+class TimedHTTPConnectionPool(HTTPConnectionPool):
+    ConnectionCls = TimedHTTPConnection
+
+class TimedHTTPSConnectionPool(HTTPSConnectionPool):
+    ConnectionCls = TimedHTTPSConnection
+
+class TimedHTTPAdapter(HTTPAdapter):
+    def init_poolmanager(self, *args, **kwargs):
+        super().init_poolmanager(*args, **kwargs)
+        self.poolmanager.pool_classes_by_scheme = {"http": TimedHTTPConnectionPool, "https": TimedHTTPSConnectionPool}
+
+class SessionPool:
+    # Keep-alive sessions shared by every request the app sends, keyed by the
+    # settings that change how connections are made.
+    def __init__(self, pool_size=10):
+        self.pool_size = pool_size
+        self._sessions = {}
+        self._lock = threading.Lock()
+
+    def get(self, verify=True, pool_size=None):
+        key = (verify, max(self.pool_size, pool_size or 0))
+        with self._lock:
+            session = self._sessions.get(key)
+            if session is None:
+                session = requests.Session()
+                session.verify = verify
+                adapter = TimedHTTPAdapter(pool_connections=key[1], pool_maxsize=key[1])
+                session.mount("http://", adapter)
+                session.mount("https://", adapter)
+                self._sessions[key] = session
+            return session
+
+    def close(self):
+        with self._lock:
+            for session in self._sessions.values():
+                session.close()
+            self._sessions.clear()
+
+class _BodyDecoder:
+    # gzip/deflate bodies are decompressed here rather than by urllib3 so the
+    # time spent in zlib can be reported apart from the download.
+    def __init__(self):
+        self._decompressor = zlib.decompressobj(32 + zlib.MAX_WBITS)
+        self._first = True
+        self.elapsed = 0.0
+
+    def decompress(self, data):
+        started = time.perf_counter()
+        try:
+            try:
+                out = self._decompressor.decompress(data)
+            except zlib.error:
+                if not self._first:
+                    raise
+                # "deflate" is sometimes sent without the zlib header.
+                self._decompressor = zlib.decompressobj(-zlib.MAX_WBITS)
+                out = self._decompressor.decompress(data)
+            self._first = False
+            return out
+        except zlib.error as e:
+            raise requests.exceptions.ContentDecodingError(e)
+        finally:
+            self.elapsed += time.perf_counter() - started
+
+    def flush(self):
+        started = time.perf_counter()
+        out = self._decompressor.flush()
+        self.elapsed += time.perf_counter() - started
+        return out
+
+def perform_request(session, kwargs, sink=None, on_progress=None, cancel=None):
+    # Streams so the time to response headers (TTFB) and the body transfer
+    # can be measured separately. DNS/connect/TLS are None on a reused
+    # connection. With a sink the body is written to it chunk by chunk
+    # instead of being held in memory.
+    _connection_timing.__dict__.clear()
+    started = time.perf_counter()
+    response = (session or requests).request(stream=True, **kwargs)
+    ttfb = time.perf_counter() - started
+    encoding = response.headers.get("Content-Encoding", "").strip().lower()
+    decoder = _BodyDecoder() if encoding in ("gzip", "x-gzip", "deflate") else None
+    if decoder:
+        chunks = response.raw.stream(STREAM_CHUNK_SIZE, decode_content=False)
+    else:
+        # Other encodings (br, zstd, ...) are left to urllib3; their
+        # decompression time is part of the download.
+        chunks = response.iter_content(STREAM_CHUNK_SIZE)
+    body = []
+    received = 0
+    expected = int(response.headers.get("Content-Length") or 0) or None
+    last_report = time.perf_counter()
+    with response:
+        for chunk in chunks:
+            if cancel is not None and cancel.is_set():
+                break
+            if decoder:
+                chunk = decoder.decompress(chunk)
+            if sink is None:
+                body.append(chunk)
+            else:
+                sink.write(chunk)
+            received += len(chunk)
+            now = time.perf_counter()
+            if on_progress and now - last_report >= PROGRESS_INTERVAL:
+                last_report = now
+                on_progress(received, expected, now - started)
+        if decoder:
+            tail = decoder.flush()
+            received += len(tail)
+            if sink is None:
+                body.append(tail)
+            else:
+                sink.write(tail)
+        wire_bytes = response.raw.tell()
+    if sink is None:
+        response._content = b"".join(body)
+        response._content_consumed = True
+    total = time.perf_counter() - started
+    dns_ms = getattr(_connection_timing, "dns_ms", None)
+    connect_ms = getattr(_connection_timing, "connect_ms", None)
+    handshake_ms = getattr(_connection_timing, "handshake_ms", None)
+    tls_ms = None
+    if handshake_ms is not None and connect_ms is not None and kwargs["url"].lower().startswith("https"):
+        tls_ms = max(0.0, handshake_ms - connect_ms - (dns_ms or 0))
+    decompress_ms = decoder.elapsed * 1000 if decoder else None
+    timing = {
+        "reused_connection": connect_ms is None,
+        "dns_ms": dns_ms,
+        "connect_ms": connect_ms,
+        "tls_ms": tls_ms,
+        "ttfb_ms": ttfb * 1000,
+        "transfer_ms": (total - ttfb) * 1000 - (decompress_ms or 0),
+        "decompress_ms": decompress_ms,
+        "total_ms": total * 1000,
+        "bytes": received,
+        "wire_bytes": wire_bytes,
+    }
+    return response, timing
+
+def parse_cache_control(value):
+    directives = {}
+    for part in (value or "").split(","):
+        name, _, arg = part.strip().partition("=")
+        if name:
+            directives[name.lower()] = arg.strip('"') or None
+    return directives
+
+class _TeeWriter:
+    def __init__(self, *files):
+        self.files = files
+
+    def write(self, data):
+        for f in self.files:
+            f.write(data)
+
+class HttpCache:
+    # Private on-disk cache for GET requests. Bodies are stored as files next
+    # to a small SQLite index; entries past their freshness lifetime are
+    # revalidated with If-None-Match/If-Modified-Since, and the least
+    # recently used ones are evicted once the cache exceeds max_bytes.
+
+    def __init__(self, cache_dir="api_client_cache", max_bytes=CACHE_MAX_BYTES):
+        self.cache_dir = cache_dir
+        self.max_bytes = max_bytes
+        os.makedirs(cache_dir, exist_ok=True)
+        self._lock = threading.Lock()
+        self.conn = sqlite3.connect(os.path.join(cache_dir, "index.db"), check_same_thread=False)
+        self.conn.execute("""
+            CREATE TABLE IF NOT EXISTS entries (
+                key TEXT PRIMARY KEY, url TEXT, status INTEGER, reason TEXT, headers TEXT,
+                fresh_until REAL, size INTEGER, last_access REAL)""")
+        self.conn.commit()
+        self.total_bytes = self.conn.execute("SELECT COALESCE(SUM(size), 0) FROM entries").fetchone()[0]
+
+    def close(self):
+        self.conn.close()
+
+    def _key(self, kwargs):
+        prepared = requests.Request(kwargs["method"], kwargs["url"], params=kwargs.get("params")).prepare()
+        auth_user = kwargs["auth"][0] if kwargs.get("auth") else ""
+        # Every request header is part of the key, which covers any Vary.
+        parts = [prepared.method, prepared.url, sorted((k.lower(), v) for k, v in kwargs["headers"].items()), auth_user]
+        return hashlib.sha256(json.dumps(parts).encode("utf-8")).hexdigest()
+
+    def _body_path(self, key):
+        return os.path.join(self.cache_dir, key + ".body")
+
+    def _lookup(self, key):
+        with self._lock:
+            row = self.conn.execute("SELECT url, status, reason, headers, fresh_until, size FROM entries WHERE key = ?",
+                                    (key,)).fetchone()
+        if row is None or not os.path.exists(self._body_path(key)):
+            return None
+        url, status, reason, headers, fresh_until, size = row
+        return {"key": key, "url": url, "status": status, "reason": reason,
+                "headers": CaseInsensitiveDict(json.loads(headers)), "fresh_until": fresh_until, "size": size}
+
+    @staticmethod
+    def _fresh_until(headers, now):
+        # None means the response must not be stored at all.
+        directives = parse_cache_control(headers.get("Cache-Control"))
+        if "no-store" in directives or headers.get("Vary", "").strip() == "*":
+            return None
+        if "no-cache" in directives:
+            return 0
+        if directives.get("max-age", "").isdigit():
+            age = headers.get("Age", "0")
+            return now + int(directives["max-age"]) - (int(age) if age.isdigit() else 0)
+        if headers.get("Expires"):
+            try:
+                return parsedate_to_datetime(headers["Expires"]).timestamp()
+            except (TypeError, ValueError):
+                return 0
+        return 0
+
+    def request(self, session, kwargs, sink=None, on_progress=None, cancel=None):
+        # Returns (response, timing, cache_state) where cache_state is
+        # "cached", "revalidated" or None; timing is None for cache hits.
+        headers = CaseInsensitiveDict(kwargs["headers"])
+        request_directives = parse_cache_control(headers.get("Cache-Control"))
+        if kwargs["method"] != "GET" or "no-store" in request_directives:
+            return (*perform_request(session, kwargs, sink, on_progress, cancel), None)
+
+        key = self._key(kwargs)
+        entry = self._lookup(key)
+        now = time.time()
+        if entry and entry["fresh_until"] > now and "no-cache" not in request_directives:
+            return self._cached_response(entry, sink), None, "cached"
+
+        if entry:
+            conditional = dict(kwargs["headers"])
+            if entry["headers"].get("ETag"):
+                conditional["If-None-Match"] = entry["headers"]["ETag"]
+            if entry["headers"].get("Last-Modified"):
+                conditional["If-Modified-Since"] = entry["headers"]["Last-Modified"]
+            kwargs = dict(kwargs, headers=conditional)
+
+        fd, tmp_path = tempfile.mkstemp(dir=self.cache_dir, suffix=".part")
+        try:
+            with os.fdopen(fd, "wb") as body_file:
+                writer = _TeeWriter(sink, body_file) if sink is not None else None
+                response, timing = perform_request(session, kwargs, writer, on_progress, cancel)
+                if sink is None:
+                    body_file.write(response.content)
+
+            if response.status_code == 304 and entry:
+                self._update(entry, response.headers)
+                timing["bytes"] = entry["size"]
+                return self._cached_response(entry, sink), timing, "revalidated"
+
+            cancelled = cancel is not None and cancel.is_set()
+            if response.status_code == 200 and not cancelled:
+                self._store(key, response, tmp_path, timing["bytes"])
+            return response, timing, None
+        finally:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+
+    def _cached_response(self, entry, sink):
+        response = requests.Response()
+        response.status_code = entry["status"]
+        response.reason = entry["reason"]
+        response.headers = entry["headers"]
+        response.url = entry["url"]
+        response.encoding = requests.utils.get_encoding_from_headers(entry["headers"])
+        with open(self._body_path(entry["key"]), "rb") as f:
+            if sink is not None:
+                shutil.copyfileobj(f, sink, STREAM_CHUNK_SIZE)
+                response._content = b""
+            else:
+                response._content = f.read()
+        with self._lock:
+            self.conn.execute("UPDATE entries SET last_access = ? WHERE key = ?", (time.time(), entry["key"]))
+            self.conn.commit()
+        return response
+
+    def _update(self, entry, headers):
+        # A 304 carries fresh validators and lifetime but no body.
+        for name in ("Cache-Control", "Expires", "ETag", "Last-Modified", "Date", "Age"):
+            if name in headers:
+                entry["headers"][name] = headers[name]
+        entry["fresh_until"] = self._fresh_until(entry["headers"], time.time()) or 0
+        with self._lock:
+            self.conn.execute("UPDATE entries SET headers = ?, fresh_until = ?, last_access = ? WHERE key = ?",
+                              (json.dumps(dict(entry["headers"])), entry["fresh_until"], time.time(), entry["key"]))
+            self.conn.commit()
+
+    def _store(self, key, response, tmp_path, size):
+        now = time.time()
+        fresh_until = self._fresh_until(response.headers, now)
+        validators = response.headers.get("ETag") or response.headers.get("Last-Modified")
+        if fresh_until is None or (fresh_until <= now and not validators) or size > self.max_bytes:
+            return
+        with self._lock:
+            old = self.conn.execute("SELECT size FROM entries WHERE key = ?", (key,)).fetchone()
+            os.replace(tmp_path, self._body_path(key))
+            self.conn.execute("INSERT OR REPLACE INTO entries VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                              (key, response.url, response.status_code, response.reason,
+                               json.dumps(dict(response.headers)), fresh_until, size, now))
+            self.total_bytes += size - (old[0] if old else 0)
+            self._evict()
+            self.conn.commit()
+
+    def _evict(self):
+        rows = self.conn.execute("SELECT key, size FROM entries ORDER BY last_access").fetchall()
+        for key, size in rows:
+            if self.total_bytes <= self.max_bytes:
+                break
+            self.conn.execute("DELETE FROM entries WHERE key = ?", (key,))
+            if os.path.exists(self._body_path(key)):
+                os.remove(self._body_path(key))
+            self.total_bytes -= size
+
+    def clear(self):
+        with self._lock:
+            for (key,) in self.conn.execute("SELECT key FROM entries").fetchall():
+                if os.path.exists(self._body_path(key)):
+                    os.remove(self._body_path(key))
+            self.conn.execute("DELETE FROM entries")
+            self.conn.commit()
+            self.total_bytes = 0
+
+TIMING_PHASES = (
+    ("dns_ms", "DNS", "#9c27b0"),
+    ("connect_ms", "Connect", "#ff9800"),
+    ("tls_ms", "TLS", "#ffeb3b"),
+    ("server_ms", "Server (TTFB)", "#2196f3"),
+    ("transfer_ms", "Download", "#4caf50"),
+    ("decompress_ms", "Decompress", "#00bcd4"),
+)
+
+def timing_phases(timing):
+    # TTFB includes DNS/connect/TLS on a new connection; the remainder is the
+    # time the server took to start answering.
+    setup = sum(timing[key] or 0 for key in ("dns_ms", "connect_ms", "tls_ms"))
+    return dict(timing, server_ms=max(0.0, timing["ttfb_ms"] - setup))
+
+def format_timing(timing):
+    fmt = lambda value: "-" if value is None else f"{value:.1f} ms"
+    connection = "reused connection" if timing["reused_connection"] else "new connection"
+    size = f"{timing['bytes']} bytes"
+    if timing.get("wire_bytes") is not None and timing["wire_bytes"] != timing["bytes"]:
+        size += f" ({timing['wire_bytes']} on the wire)"
+    return (f"{connection} | DNS {fmt(timing.get('dns_ms'))} | connect {fmt(timing['connect_ms'])} | "
+            f"TLS {fmt(timing['tls_ms'])} | TTFB {fmt(timing['ttfb_ms'])} | download {fmt(timing['transfer_ms'])} | "
+            f"decompress {fmt(timing.get('decompress_ms'))} | total {fmt(timing['total_ms'])} | {size}")
+
+def timed_request(kwargs, session=None):
+    started = time.perf_counter()
+    try:
+        response, _ = perform_request(session, kwargs)
+        return {
+            "status": response.status_code,
+            "latency_ms": (time.perf_counter() - started) * 1000,
+            "bytes": len(response.content),
+            "error": None,
+        }
+    except Exception as e:
+        # Not only RequestException: a malformed Content-Length raises
+        # ValueError, and every job must still come back as a result.
+        return {
+            "status": None,
+            "latency_ms": (time.perf_counter() - started) * 1000,
+            "bytes": 0,
+            "error": str(e),
+        }
+
+class RequestRunner:
+    # Sends a list of prepared requests on a bounded worker pool. Results are
+    # handed to on_result from worker threads; callers marshal them to Tk.
+    def __init__(self, concurrency, on_result, on_done, session=None):
+        self.concurrency = max(1, concurrency)
+        self.on_result = on_result
+        self.on_done = on_done
+        self.session = session
+        self._stop = threading.Event()
+
+    def start(self, jobs):
+        threading.Thread(target=self._run, args=(jobs,), daemon=True).start()
+
+    def stop(self):
+        self._stop.set()
+
+    def _run(self, jobs):
+        slots = threading.BoundedSemaphore(self.concurrency)
+        started = time.perf_counter()
+
+        def call(index, label, kwargs):
+            try:
+                if not self._stop.is_set():
+                    result = timed_request(kwargs, self.session)
+                    result.update(index=index, label=label)
+                    self.on_result(result)
+            finally:
+                slots.release()
+
+        with ThreadPoolExecutor(max_workers=self.concurrency) as pool:
+            for index, (label, kwargs) in enumerate(jobs, start=1):
+                slots.acquire()
+                if self._stop.is_set():
+                    slots.release()
+                    break
+                pool.submit(call, index, label, kwargs)
+        self.on_done(time.perf_counter() - started, self._stop.is_set())
+
+TEMPLATE_VARIABLE = re.compile(r"\{\{\s*([\w.-]+)\s*\}\}")
+TEMPLATE_FIELDS = ("url", "headers", "query_params", "body", "auth_username", "auth_password")
+
+def render_template(req_data, variables):
+    # Substitutes {{name}} placeholders from one data row. Values going into
+    # a raw JSON body are JSON-escaped so quotes in the data can't break it.
+    json_body = req_data.get("body_type", "Raw (JSON)") == "Raw (JSON)"
+
+    def substitute(text, escape_json):
+        def value(match):
+            name = match.group(1)
+            if name not in variables:
+                raise ValueError(f"No value for template variable '{name}'.")
+            raw = variables[name]
+            raw = "" if raw is None else raw if isinstance(raw, str) else json.dumps(raw)
+            return json.dumps(raw)[1:-1] if escape_json else raw
+        return TEMPLATE_VARIABLE.sub(value, text or "")
+
+    rendered = dict(req_data)
+    for field in TEMPLATE_FIELDS:
+        rendered[field] = substitute(req_data.get(field, ""), json_body and field == "body")
+    return rendered
+
+def iter_variable_rows(data_path):
+    if data_path.lower().endswith((".jsonl", ".ndjson")):
+        with open(data_path, "r", encoding="utf-8") as f:
+            for line in f:
+                if line.strip():
+                    yield json.loads(line)
+    else:
+        with open(data_path, "r", newline="", encoding="utf-8-sig") as f:
+            yield from csv.DictReader(f)
+
+def retry_after_seconds(response):
+    value = response.headers.get("Retry-After") if response is not None else None
+    if not value:
+        return None
+    if value.strip().isdigit():
+        return int(value)
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
+
+def send_with_retry(session, kwargs, retries=3, backoff=0.5, max_delay=30.0, stop=None):
+    # Retries connection errors, timeouts and 429/5xx responses with
+    # exponential backoff (full jitter), preferring the server's Retry-After.
+    # Returns (response, attempts, error).
+    stop = stop or threading.Event()
+    for attempt in range(retries + 1):
+        response, error = None, None
+        try:
+            response = (session or requests).request(**kwargs)
+            if response.status_code not in RETRY_STATUSES:
+                return response, attempt + 1, None
+        except (requests.exceptions.ConnectionError, requests.exceptions.Timeout) as e:
+            error = e
+        except requests.exceptions.RequestException as e:
+            return None, attempt + 1, e
+        if attempt == retries:
+            break
+        delay = retry_after_seconds(response)
+        if delay is None:
+            delay = random.uniform(0, backoff * 2 ** attempt)
+        if stop.wait(min(delay, max_delay)):
+            break
+    return response, attempt + 1, error
+
+class BatchRun:
+    # Runs one request template once per row of a CSV / JSON-lines data file.
+    # Rows are read lazily and at most `concurrency` are in flight; every
+    # row's outcome is appended to a JSON-lines results file and a summary is
+    # written next to it when the run ends.
+    def __init__(self, template, data_path, results_path, build_kwargs, concurrency=4, retries=3,
+                 on_result=None, on_done=None, session=None):
+        self.template = template
+        self.data_path = data_path
+        self.results_path = results_path
+        self.build_kwargs = build_kwargs
+        self.concurrency = max(1, concurrency)
+        self.retries = retries
+        self.on_result = on_result
+        self.on_done = on_done
+        self.session = session
+        self._stop = threading.Event()
+        self._lock = threading.Lock()
+
+    def start(self):
+        threading.Thread(target=self._run, daemon=True).start()
+
+    def stop(self):
+        self._stop.set()
+
+    def _call(self, index, variables):
+        started = time.perf_counter()
+        result = {"row": index, "variables": variables, "status": None, "attempts": 0,
+                  "latency_ms": None, "bytes": 0, "error": None, "response": None}
+        try:
+            req_data = render_template(self.template, variables)
+            kwargs = self.build_kwargs(req_data)
+            result["label"] = f"{req_data.get('method', 'GET')} {req_data.get('url', '')}"
+            response, result["attempts"], error = send_with_retry(self.session, kwargs, self.retries, stop=self._stop)
+            if response is not None:
+                result["status"] = response.status_code
+                result["bytes"] = len(response.content)
+                result["response"] = response.content[:RESULT_BODY_LIMIT].decode("utf-8", errors="replace")
+            if error is not None:
+                result["error"] = str(error)
+        except ValueError as e:
+            result["label"] = f"row {index}"
+            result["error"] = str(e)
+        result["latency_ms"] = (time.perf_counter() - started) * 1000
+        return result
+
+    def _run(self):
+        slots = threading.BoundedSemaphore(self.concurrency)
+        started = time.perf_counter()
+        histogram = LatencyHistogram()
+        summary = {"rows": 0, "succeeded": 0, "failed": 0, "retried_rows": 0, "retries": 0, "statuses": {}}
+        error = None
+
+        def call(index, variables):
+            try:
+                result = self._call(index, variables)
+                with self._lock:
+                    results_file.write(json.dumps(result) + "\n")
+                    summary["rows"] += 1
+                    ok = result["status"] is not None and result["status"] < 400 and not result["error"]
+                    summary["succeeded" if ok else "failed"] += 1
+                    summary["retries"] += max(0, result["attempts"] - 1)
+                    summary["retried_rows"] += result["attempts"] > 1
+                    status = str(result["status"] or "error")
+                    summary["statuses"][status] = summary["statuses"].get(status, 0) + 1
+                    histogram.record(result["latency_ms"])
+                if self.on_result:
+                    self.on_result(result)
+            finally:
+                slots.release()
+
+        try:
+            with open(self.results_path, "w", encoding="utf-8") as results_file:
+                with ThreadPoolExecutor(max_workers=self.concurrency) as pool:
+                    for index, variables in enumerate(iter_variable_rows(self.data_path), start=1):
+                        slots.acquire()
+                        if self._stop.is_set():
+                            slots.release()
+                            break
+                        pool.submit(call, index, variables)
+        except (OSError, ValueError, csv.Error) as e:
+            error = e
+        elapsed = time.perf_counter() - started
+        summary.update(
+            data_file=self.data_path,
+            results_file=self.results_path,
+            stopped=self._stop.is_set(),
+            duration_sec=round(elapsed, 3),
+            rows_per_sec=round(summary["rows"] / elapsed, 1) if elapsed > 0 else 0.0,
+            latency_ms=histogram.summary() if summary["rows"] else None,
+            error=str(error) if error else None,
+        )
+        try:
+            with open(os.path.splitext(self.results_path)[0] + ".summary.json", "w") as f:
+                json.dump(summary, f, indent=4)
+        except OSError:
+            pass
+        if self.on_done:
+            self.on_done(summary)
+
+class LatencyHistogram:
+    # HDR-style log-linear buckets: values are kept to SUB_BUCKET_BITS of
+    # precision (under 1% error) in a sparse dict, so recording is O(1) and
+    # memory does not grow with the number of samples.
+    SUB_BUCKET_BITS = 7
+
+    def __init__(self):
+        self.counts = {}
+        self.total = 0
+        self.max_us = 0
+
+    def record(self, latency_ms):
+        value = max(0, int(latency_ms * 1000))
+        shift = max(0, value.bit_length() - self.SUB_BUCKET_BITS)
+        key = (shift, value >> shift)
+        self.counts[key] = self.counts.get(key, 0) + 1
+        self.total += 1
+        self.max_us = max(self.max_us, value)
+
+    def merge(self, other):
+        for key, count in other.counts.items():
+            self.counts[key] = self.counts.get(key, 0) + count
+        self.total += other.total
+        self.max_us = max(self.max_us, other.max_us)
+
+    def percentile(self, pct):
+        if not self.total:
+            return 0.0
+        target = max(1, int(round(pct / 100 * self.total)))
+        seen = 0
+        for shift, sub in sorted(self.counts):
+            seen += self.counts[(shift, sub)]
+            if seen >= target:
+                highest_equivalent = ((sub + 1) << shift) - 1
+                return min(highest_equivalent, self.max_us) / 1000
+        return self.max_us / 1000
+
+    def summary(self):
+        return {
+            "count": self.total,
+            "p50_ms": self.percentile(50),
+            "p90_ms": self.percentile(90),
+            "p99_ms": self.percentile(99),
+            "max_ms": self.max_us / 1000,
+        }
+
+class LoadTest:
+    # Runs one prepared request either with a fixed number of closed-loop
+    # workers or open-loop at a target rate. In rate mode latency is measured
+    # from the scheduled send time so a stalled server cannot hide queueing
+    # delay (coordinated omission). Samples inside the warm-up are discarded.
+    def __init__(self, kwargs, mode, target, duration, warmup, on_tick, on_done, max_in_flight=256, session=None):
+        self.kwargs = kwargs
+        self.session = session
+        self.mode = mode
+        self.target = max(1, target)
+        self.duration = duration
+        self.warmup = warmup
+        self.on_tick = on_tick
+        self.on_done = on_done
+        self.max_in_flight = max_in_flight
+        self.overall = LatencyHistogram()
+        self.timeline = []
+        self._interval = LatencyHistogram()
+        self._interval_errors = 0
+        self.errors = 0
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+
+    def start(self):
+        threading.Thread(target=self._run, daemon=True).start()
+
+    def stop(self):
+        self._stop.set()
+
+    def _record(self, scheduled, result):
+        latency_ms = (time.perf_counter() - scheduled) * 1000
+        failed = result["error"] is not None or result["status"] >= 400
+        if scheduled < self._measure_from:
+            return
+        with self._lock:
+            self._interval.record(latency_ms)
+            if failed:
+                self._interval_errors += 1
+
+    def _closed_loop_worker(self):
+        while not self._stop.is_set() and time.perf_counter() < self._end:
+            scheduled = time.perf_counter()
+            self._record(scheduled, timed_request(self.kwargs, self.session))
+
+    def _open_loop(self, pool):
+        period = 1 / self.target
+        slots = threading.BoundedSemaphore(self.max_in_flight)
+        next_send = time.perf_counter()
+
+        def call(scheduled):
+            try:
+                self._record(scheduled, timed_request(self.kwargs, self.session))
+            finally:
+                slots.release()
+
+        while not self._stop.is_set() and next_send < self._end:
+            delay = next_send - time.perf_counter()
+            if delay > 0:
+                self._stop.wait(delay)
+            slots.acquire()
+            # Stop may have been pressed while waiting above; _run shuts the
+            # pool down once this thread has returned.
+            if self._stop.is_set():
+                slots.release()
+                break
+            pool.submit(call, next_send)
+            next_send += period
+
+    def _tick(self, elapsed, final=False):
+        with self._lock:
+            interval, errors = self._interval, self._interval_errors
+            self._interval, self._interval_errors = LatencyHistogram(), 0
+        self.overall.merge(interval)
+        self.errors += errors
+        if elapsed <= self.warmup or (final and not interval.total):
+            return
+        point = interval.summary()
+        point.update(second=round(elapsed - self.warmup, 1), errors=errors,
+                     error_rate=errors / interval.total if interval.total else 0.0, rps=interval.total)
+        self.timeline.append(point)
+        self.on_tick(point, self.summary())
+
+    def summary(self):
+        measured = max(1e-9, min(time.perf_counter(), self._end) - self._measure_from)
+        summary = self.overall.summary()
+        summary.update(errors=self.errors,
+                       error_rate=self.errors / self.overall.total if self.overall.total else 0.0,
+                       throughput_rps=self.overall.total / measured)
+        return summary
+
+    def _run(self):
+        started = time.perf_counter()
+        self._measure_from = started + self.warmup
+        self._end = self._measure_from + self.duration
+        workers = self.target if self.mode == "concurrency" else min(self.max_in_flight, self.target * 2)
+        pool = ThreadPoolExecutor(max_workers=workers)
+        scheduler = None
+        if self.mode == "concurrency":
+            for _ in range(self.target):
+                pool.submit(self._closed_loop_worker)
+        else:
+            scheduler = threading.Thread(target=self._open_loop, args=(pool,), daemon=True)
+            scheduler.start()
+
+        next_tick = started + 1
+        while not self._stop.is_set() and time.perf_counter() < self._end:
+            self._stop.wait(max(0, next_tick - time.perf_counter()))
+            self._tick(next_tick - started)
+            next_tick += 1
+        self._stop.set()
+        if scheduler is not None:
+            scheduler.join()
+        pool.shutdown(wait=True)
+        self._tick(time.perf_counter() - started, final=True)
+        self.on_done(self.summary(), self.timeline)
+
+PAGINATION_SCHEMES = {
+    "Offset / limit": "offset",
+    "Page number": "page",
+    "Cursor": "cursor",
+    "Link header": "link",
+}
+
+# Presets fill in the request and pagination settings; credentials are always
+# taken from the Request tab's auth fields.
+PAGINATION_PRESETS = {
+    "Virtualstock orders": {
+        "url": "https://api.virtualstock.com/restapi/v4/orders/",
+        "query_params": "status: ORDER",
+        "headers": "Accept: application/json",
+        "scheme": "Offset / limit",
+        "records_path": "$.orders",
+        "position_param": "offset",
+        "limit_param": "limit",
+        "start": 0,
+        "page_size": 100,
+    },
+}
+
+def extract_records(data, records_path):
+    if not records_path:
+        return data if isinstance(data, list) else [data]
+    matches = [value for _, value in json_path_query(data, records_path)]
+    if len(matches) == 1 and isinstance(matches[0], list):
+        return matches[0]
+    return matches
+
+def flatten_record(record, prefix=""):
+    if not isinstance(record, dict):
+        return {prefix or "value": json.dumps(record) if isinstance(record, list) else record}
+    flat = {}
+    for key, value in record.items():
+        name = f"{prefix}.{key}" if prefix else str(key)
+        if isinstance(value, dict):
+            flat.update(flatten_record(value, name))
+        else:
+            flat[name] = json.dumps(value) if isinstance(value, list) else value
+    return flat
+
+def _ijson_prefix(records_path):
+    # Maps the streamable part of the JSONPath subset ($, .key, ['key'], [*])
+    # onto an ijson prefix; None when the path needs the parsed document.
+    expr = records_path.strip()
+    if expr.startswith("$"):
+        expr = expr[1:]
+    parts = []
+    pos = 0
+    while pos < len(expr):
+        m = JSON_PATH_TOKEN.match(expr, pos)
+        if not m:
+            return None
+        pos = m.end()
+        recursive, dotted, single_quoted, double_quoted, slice_, index, star = m.groups()
+        key = next((k for k in (dotted, single_quoted, double_quoted) if k is not None), None)
+        if dotted == "*" or star is not None:
+            parts.append("item")
+        elif key is not None and "." not in key:
+            parts.append(key)
+        else:
+            return None
+    return ".".join(parts)
+
+def iter_json_records(records_path="", data=None, body_path=None):
+    # Yields the records selected by records_path, either from an already
+    # parsed document or from a JSON file. With ijson installed a file is
+    # walked incrementally instead of being loaded whole.
+    prefix = _ijson_prefix(records_path or "$") if body_path else None
+    if prefix is None:
+        if body_path:
+            with open(body_path, "rb") as f:
+                data = json.load(f)
+        yield from extract_records(data, records_path)
+        return
+    if ijson is None:
+        with open(body_path, "rb") as f:
+            yield from extract_records(json.load(f), records_path)
+        return
+    with open(body_path, "rb") as f:
+        kind = next((event for path, event, _ in ijson.parse(f) if path == prefix), None)
+    if kind is None:
+        return
+    if kind == "start_array":
+        # Same as extract_records: a single matched array is its records.
+        prefix = f"{prefix}.item" if prefix else "item"
+    with open(body_path, "rb") as f:
+        yield from ijson.items(f, prefix, use_float=True)
+
+def export_records(records, output_path, columns=None):
+    # `records` is called once per pass and must return a fresh iterator, so
+    # columns can be discovered in a first pass without holding the records
+    # in memory. Rows are written as they are flattened.
+    if not columns:
+        discovered = {}
+        for record in records():
+            for key in flatten_record(record):
+                discovered.setdefault(key)
+        columns = list(discovered)
+    count = 0
+    if output_path.lower().endswith(".parquet"):
+        if pq is None:
+            raise ValueError("Parquet export needs pyarrow installed.")
+        # Every column is written as a nullable string so batches always share
+        # one schema, matching what the CSV export produces.
+        schema = pa.schema([(column, pa.string()) for column in columns])
+        with pq.ParquetWriter(output_path, schema) as writer:
+            batch = {column: [] for column in columns}
+            for record in records():
+                row = flatten_record(record)
+                for column in columns:
+                    value = row.get(column)
+                    batch[column].append(None if value is None else str(value))
+                count += 1
+                if count % EXPORT_BATCH_SIZE == 0:
+                    writer.write_table(pa.Table.from_pydict(batch, schema=schema))
+                    batch = {column: [] for column in columns}
+            if count % EXPORT_BATCH_SIZE:
+                writer.write_table(pa.Table.from_pydict(batch, schema=schema))
+        return count, columns
+    with open(output_path, "w", newline="", encoding="utf-8") as f:
+        writer = csv.DictWriter(f, fieldnames=columns, extrasaction="ignore")
+        writer.writeheader()
+        for record in records():
+            writer.writerow(flatten_record(record))
+            count += 1
+    return count, columns
+
+class PaginatedFetch:
+    # Pulls every page of a paginated endpoint into a JSON-lines or CSV file.
+    # Offset and page-number pages are addressable, so up to `concurrency`
+    # of them are in flight at once; cursor and Link-header pagination have
+    # to follow the chain one page at a time. Pages are written in order and
+    # a checkpoint next to the output records how much of the file is
+    # complete, so an interrupted run can resume where it stopped.
+
+    def __init__(self, kwargs, scheme, output_path, records_path="", page_size=100, position_param="offset",
+                 limit_param="limit", start=0, cursor_path="", total_path="", concurrency=4,
+                 on_progress=None, on_done=None, session=None):
+        self.kwargs = kwargs
+        self.scheme = scheme
+        self.output_path = output_path
+        self.checkpoint_path = output_path + ".checkpoint.json"
+        self.fmt = "csv" if output_path.lower().endswith(".csv") else "jsonl"
+        self.records_path = records_path
+        self.page_size = page_size
+        self.position_param = position_param
+        self.limit_param = limit_param
+        self.start_at = start
+        self.cursor_path = cursor_path
+        self.total_path = total_path
+        self.concurrency = concurrency if scheme in ("offset", "page") else 1
+        self.on_progress = on_progress
+        self.on_done = on_done
+        self.session = session or requests.Session()
+        self.stop_event = threading.Event()
+        self.thread = None
+
+    def start(self, resume=False):
+        self.thread = threading.Thread(target=self._run, args=(resume,), daemon=True)
+        self.thread.start()
+
+    def stop(self):
+        self.stop_event.set()
+
+    def _signature(self):
+        # Everything that decides which records a page holds. Credential
+        # headers are left out so a refreshed token can still resume; the
+        # rest of the request is hashed rather than stored in the checkpoint.
+        request = {
+            "method": self.kwargs.get("method"),
+            "params": self.kwargs.get("params") or {},
+            "headers": {k.lower(): v for k, v in (self.kwargs.get("headers") or {}).items()
+                        if k.lower() not in REDACTED_HEADERS},
+            "json": self.kwargs.get("json"),
+            "data": self.kwargs.get("data"),
+        }
+        digest = hashlib.sha256(json.dumps(request, sort_keys=True, default=str).encode("utf-8")).hexdigest()
+        return [self.kwargs["url"], self.scheme, self.page_size, self.records_path, self.fmt, self.position_param,
+                self.limit_param, self.start_at, self.cursor_path, digest]
+
+    def _load_checkpoint(self):
+        with open(self.checkpoint_path, "r") as f:
+            state = json.load(f)
+        if state.get("signature") != self._signature():
+            raise ValueError("The checkpoint was written by a fetch with different settings.")
+        return state
+
+    def _save_checkpoint(self, out, state):
+        out.flush()
+        state["bytes"] = out.tell()
+        tmp_path = self.checkpoint_path + ".tmp"
+        with open(tmp_path, "w") as f:
+            json.dump(state, f)
+        os.replace(tmp_path, self.checkpoint_path)
+
+    def _run(self, resume):
+        started = time.perf_counter()
+        state = None
+        error = None
+        try:
+            state = self._load_checkpoint() if resume and os.path.exists(self.checkpoint_path) else None
+            if state is None:
+                state = {"signature": self._signature(), "next": 0, "cursor": None, "done": False,
+                         "pages": 0, "records": 0, "bytes": 0, "columns": None}
+                out = open(self.output_path, "wb")
+            else:
+                # Anything written after the last checkpoint is discarded and
+                # fetched again.
+                out = open(self.output_path, "r+b")
+                out.truncate(state["bytes"])
+                out.seek(state["bytes"])
+            with out:
+                self._save_checkpoint(out, state)
+                if self.scheme in ("offset", "page"):
+                    self._run_addressable(out, state, started)
+                else:
+                    self._run_sequential(out, state, started)
+            if state["done"]:
+                os.remove(self.checkpoint_path)
+        except (requests.exceptions.RequestException, ValueError, OSError) as e:
+            error = e
+        if self.on_done:
+            elapsed = time.perf_counter() - started
+            summary = {
+                "output": self.output_path,
+                "pages": state["pages"] if state else 0,
+                "records": state["records"] if state else 0,
+                "complete": bool(state and state["done"]),
+                "duration_sec": round(elapsed, 3),
+                "records_per_sec": round(state["records"] / elapsed, 1) if state and elapsed > 0 else 0.0,
+            }
+            self.on_done(summary, error)
+
+    def _get(self, kwargs):
+        response = self.session.request(**kwargs)
+        response.raise_for_status()
+        try:
+            return response, response.json()
+        except ValueError:
+            raise ValueError(f"Page at {response.url} is not valid JSON.")
+
+    def _fetch_page(self, index):
+        params = dict(self.kwargs.get("params") or {})
+        if self.scheme == "offset":
+            params[self.position_param] = self.start_at + index * self.page_size
+        else:
+            params[self.position_param] = self.start_at + index
+        if self.limit_param:
+            params[self.limit_param] = self.page_size
+        _, data = self._get(dict(self.kwargs, params=params))
+        total = None
+        if self.total_path:
+            matches = json_path_query(data, self.total_path)
+            if matches and str(matches[0][1]).isdigit():
+                total = int(matches[0][1])
+        return extract_records(data, self.records_path), total
+
+    def _run_addressable(self, out, state, started):
+        last_page = None
+        total_known = False
+        short_page = None
+        last_filled = -1
+        pending = {}
+        futures = {}
+        next_submit = state["next"]
+        with ThreadPoolExecutor(max_workers=self.concurrency) as pool:
+            try:
+                while not self.stop_event.is_set():
+                    while len(futures) < self.concurrency and (last_page is None or next_submit <= last_page):
+                        futures[pool.submit(self._fetch_page, next_submit)] = next_submit
+                        next_submit += 1
+                    if not futures:
+                        break
+                    done, _ = wait(futures, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        index = futures.pop(future)
+                        records, total = future.result()
+                        if total is not None:
+                            last_page = max(0, -(-total // self.page_size) - 1)
+                            total_known = True
+                        if len(records) < self.page_size:
+                            short_page = index if short_page is None else min(short_page, index)
+                        if records:
+                            last_filled = max(last_filled, index)
+                        if short_page is not None and last_filled > short_page:
+                            # Records after a short page mean the server
+                            # returns fewer than asked for, not that the data
+                            # ran out; offsets computed from page_size would
+                            # skip records.
+                            position = self.start_at + short_page * (self.page_size if self.scheme == "offset" else 1)
+                            raise ValueError(
+                                f"The page at {self.position_param}={position} returned fewer than {self.page_size} "
+                                f"records but later pages are not empty; the server probably caps the page size. "
+                                f"Lower the page size and start again.")
+                        if short_page is not None and not total_known:
+                            # Without a total, a short page is the last one;
+                            # anything fetched speculatively past it is empty
+                            # and dropped.
+                            last_page = short_page if last_page is None else min(last_page, short_page)
+                        pending[index] = records
+                    while state["next"] in pending and (last_page is None or state["next"] <= last_page):
+                        records = pending.pop(state["next"])
+                        state["next"] += 1
+                        self._write_page(out, state, records, started)
+                    # Pages already in flight are still checked for records
+                    # past a short page before the run counts as complete.
+                    if last_page is not None and state["next"] > last_page and not futures:
+                        state["done"] = True
+                        self._save_checkpoint(out, state)
+                        break
+            finally:
+                for future in futures:
+                    future.cancel()
+
+    def _run_sequential(self, out, state, started):
+        while not self.stop_event.is_set() and not state["done"]:
+            kwargs = self.kwargs
+            if self.scheme == "cursor" and state["cursor"]:
+                kwargs = dict(kwargs, params=dict(kwargs.get("params") or {}, **{self.position_param: state["cursor"]}))
+            elif self.scheme == "link" and state["cursor"]:
+                kwargs = dict(kwargs, url=state["cursor"], params=None)
+            response, data = self._get(kwargs)
+            records = extract_records(data, self.records_path)
+            if self.scheme == "cursor":
+                matches = json_path_query(data, self.cursor_path) if self.cursor_path else []
+                next_cursor = matches[0][1] if matches else None
+            else:
+                next_cursor = response.links.get("next", {}).get("url")
+            state["cursor"] = next_cursor
+            state["done"] = not next_cursor or not records
+            self._write_page(out, state, records, started)
+
+    def _write_page(self, out, state, records, started):
+        if self.fmt == "csv":
+            buffer = io.StringIO()
+            rows = [flatten_record(record) for record in records]
+            if state["columns"] is None and rows:
+                # Columns come from the first page; fields that only appear
+                # later are not added to the header.
+                state["columns"] = list(dict.fromkeys(key for row in rows for key in row))
+                csv.writer(buffer).writerow(state["columns"])
+            if rows:
+                csv.DictWriter(buffer, fieldnames=state["columns"], extrasaction="ignore").writerows(rows)
+            out.write(buffer.getvalue().encode("utf-8"))
+        else:
+            out.write("".join(json.dumps(record) + "\n" for record in records).encode("utf-8"))
+        state["pages"] += 1
+        state["records"] += len(records)
+        self._save_checkpoint(out, state)
+        if self.on_progress:
+            self.on_progress(state["pages"], state["records"], time.perf_counter() - started)
+
+def _encode_body(body):
+    if body is None:
+        return "", "utf8"
+    if isinstance(body, str):
+        return body, "utf8"
+    try:
+        return body.decode("utf-8"), "utf8"
+    except UnicodeDecodeError:
+        return base64.b64encode(body).decode("ascii"), "base64"
+
+def _decode_body(text, encoding):
+    return base64.b64decode(text) if encoding == "base64" else text.encode("utf-8")
+
+class CassetteRecorder:
+    # Appends request/response pairs to a JSON-lines cassette. Credentials in
+    # request and response headers are redacted; response bodies are stored
+    # decoded.
+    def __init__(self, path):
+        self.path = path
+        self._lock = threading.Lock()
+
+    def record(self, response, body=None, elapsed_ms=None):
+        request = response.request
+        request_body, request_encoding = _encode_body(request.body)
+        response_body, response_encoding = _encode_body(response.content if body is None else body)
+        interaction = {
+            "recorded": time.time(),
+            "elapsed_ms": elapsed_ms,
+            "request": {
+                "method": request.method,
+                "url": request.url,
+                "headers": {k: "<redacted>" if k.lower() in REDACTED_HEADERS else v for k, v in request.headers.items()},
+                "body": request_body,
+                "body_encoding": request_encoding,
+            },
+            "response": {
+                "status": response.status_code,
+                "reason": response.reason,
+                "headers": {k: "<redacted>" if k.lower() in REDACTED_HEADERS else v for k, v in response.headers.items()},
+                "body": response_body,
+                "body_encoding": response_encoding,
+            },
+        }
+        with self._lock:
+            with open(self.path, "a", encoding="utf-8") as f:
+                f.write(json.dumps(interaction) + "\n")
+
+class CassetteServer:
+    # Local HTTP stub that replays a cassette. Requests are matched on method,
+    # path and query (falling back to method and path); several recordings of
+    # the same request are served round-robin. Every reply is delayed by
+    # latency_ms plus up to jitter_ms to mimic the real upstream.
+    def __init__(self, cassette_path, port=8899, latency_ms=0.0, jitter_ms=0.0, host="127.0.0.1"):
+        self.interactions = {}
+        with open(cassette_path, "r", encoding="utf-8") as f:
+            for line in f:
+                if not line.strip():
+                    continue
+                interaction = json.loads(line)
+                parts = urlsplit(interaction["request"]["url"])
+                method = interaction["request"]["method"].upper()
+                self.interactions.setdefault((method, parts.path, parts.query), []).append(interaction["response"])
+                self.interactions.setdefault((method, parts.path, None), []).append(interaction["response"])
+        self.count = sum(len(v) for k, v in self.interactions.items() if k[2] is not None)
+        self.latency_ms = latency_ms
+        self.jitter_ms = jitter_ms
+        self._next = {}
+        self._lock = threading.Lock()
+        self.server = http.server.ThreadingHTTPServer((host, port), self._handler())
+        self.server.daemon_threads = True
+        self.url = f"http://{host}:{self.server.server_address[1]}"
+
+    def _match(self, method, target):
+        parts = urlsplit(target)
+        for key in ((method, parts.path, parts.query), (method, parts.path, None)):
+            responses = self.interactions.get(key)
+            if responses:
+                with self._lock:
+                    index = self._next.get(key, 0)
+                    self._next[key] = index + 1
+                return responses[index % len(responses)]
+        return None
+
+    def _handler(self):
+        stub = self
+
+        class Handler(http.server.BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def log_message(self, format, *args):
+                pass
+
+            def _replay(self):
+                length = int(self.headers.get("Content-Length") or 0)
+                if length:
+                    self.rfile.read(length)
+                delay = stub.latency_ms + random.uniform(0, stub.jitter_ms)
+                if delay > 0:
+                    time.sleep(delay / 1000)
+                recorded = stub._match(self.command, self.path)
+                if recorded is None:
+                    body = json.dumps({"error": f"No recorded interaction for {self.command} {self.path}"}).encode("utf-8")
+                    self.send_response(404)
+                    self.send_header("Content-Type", "application/json")
+                else:
+                    body = _decode_body(recorded["body"], recorded["body_encoding"])
+                    self.send_response(recorded["status"], recorded.get("reason"))
+                    for name, value in recorded["headers"].items():
+                        if name.lower() not in HOP_BY_HOP_HEADERS and value != "<redacted>":
+                            self.send_header(name, value)
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                if self.command != "HEAD":
+                    self.wfile.write(body)
+
+            do_GET = do_POST = do_PUT = do_PATCH = do_DELETE = do_HEAD = do_OPTIONS = _replay
+
+        return Handler
+
+    def start(self):
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+
+    def stop(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+REQUEST_FIELDS = ("method", "url", "headers", "query_params", "body_type", "body", "auth_username")
+
+class RequestStore:
+    # Saved requests live in SQLite: each save is a single INSERT and each
+    # delete a single UPDATE, so nothing is rewritten as the collection grows.
+    # Passwords go to the OS keyring when available and are never written to
+    # the database.
+
+    def __init__(self, db_path="api_client_collections.db"):
+        self.db_path = db_path
+        self.conn = sqlite3.connect(db_path)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.executescript("""
+            CREATE TABLE IF NOT EXISTS requests (
+                id INTEGER PRIMARY KEY,
+                name TEXT NOT NULL DEFAULT '',
+                folder TEXT NOT NULL DEFAULT '',
+                tags TEXT NOT NULL DEFAULT '',
+                method TEXT, url TEXT, headers TEXT, query_params TEXT,
+                body_type TEXT, body TEXT, auth_username TEXT,
+                has_secret INTEGER NOT NULL DEFAULT 0,
+                created REAL NOT NULL,
+                deleted INTEGER NOT NULL DEFAULT 0
+            );
+            CREATE INDEX IF NOT EXISTS requests_folder ON requests (folder, deleted);
+        """)
+        self.full_text = self._create_fts()
+        self.conn.commit()
+
+    def _create_fts(self):
+        try:
+            self.conn.executescript("""
+                CREATE VIRTUAL TABLE IF NOT EXISTS requests_fts USING fts5(
+                    url, headers, body, content='requests', content_rowid='id');
+                CREATE TRIGGER IF NOT EXISTS requests_fts_insert AFTER INSERT ON requests BEGIN
+                    INSERT INTO requests_fts (rowid, url, headers, body)
+                    VALUES (new.id, new.url, new.headers, new.body);
+                END;
+            """)
+            return True
+        except sqlite3.OperationalError:
+            # SQLite built without FTS5; search falls back to LIKE scans.
+            return False
+
+    def close(self):
+        self.conn.close()
+
+    def save(self, req_data, name="", folder="", tags=()):
+        password = req_data.get("auth_password", "")
+        tag_text = "".join(f",{t}" for t in tags) + "," if tags else ""
+        cur = self.conn.execute(
+            f"INSERT INTO requests (name, folder, tags, {', '.join(REQUEST_FIELDS)}, created) "
+            f"VALUES (?, ?, ?, {', '.join('?' * len(REQUEST_FIELDS))}, ?)",
+            (name, folder, tag_text, *(req_data.get(f, "") for f in REQUEST_FIELDS), time.time()))
+        request_id = cur.lastrowid
+        if password and self._set_secret(request_id, password):
+            self.conn.execute("UPDATE requests SET has_secret = 1 WHERE id = ?", (request_id,))
+        self.conn.commit()
+        return request_id
+
+    def delete(self, request_ids):
+        for request_id in request_ids:
+            self._delete_secret(request_id)
+        self.conn.executemany("UPDATE requests SET deleted = 1 WHERE id = ?", [(i,) for i in request_ids])
+        self.conn.commit()
+
+    def get(self, request_id):
+        row = self.conn.execute(
+            f"SELECT {', '.join(REQUEST_FIELDS)}, has_secret FROM requests WHERE id = ?", (request_id,)).fetchone()
+        if row is None:
+            return None
+        req_data = {f: v or "" for f, v in zip(REQUEST_FIELDS, row)}
+        req_data["auth_password"] = self._get_secret(request_id) if row[-1] else ""
+        return req_data
+
+    def _where(self, query="", folder=None, tag=""):
+        clauses, params = ["r.deleted = 0"], []
+        if folder is not None:
+            clauses.append("r.folder = ?")
+            params.append(folder)
+        if tag:
+            clauses.append("r.tags LIKE ?")
+            params.append(f"%,{tag.strip()},%")
+        terms = query.split()
+        if terms and self.full_text:
+            clauses.append("r.id IN (SELECT rowid FROM requests_fts WHERE requests_fts MATCH ?)")
+            params.append(" ".join('"' + t.replace('"', '""') + '"*' for t in terms))
+        for term in terms if not self.full_text else ():
+            clauses.append("(r.url || ' ' || r.headers || ' ' || r.body) LIKE ?")
+            params.append(f"%{term}%")
+        return " AND ".join(clauses), params
+
+    def count(self, query="", folder=None, tag=""):
+        where, params = self._where(query, folder, tag)
+        return self.conn.execute(f"SELECT COUNT(*) FROM requests r WHERE {where}", params).fetchone()[0]
+
+    def page(self, query="", folder=None, tag="", offset=0, limit=HISTORY_PAGE_SIZE):
+        where, params = self._where(query, folder, tag)
+        return self.conn.execute(
+            f"SELECT r.id, r.name, r.method, r.url, r.folder, trim(r.tags, ',') FROM requests r "
+            f"WHERE {where} ORDER BY r.id DESC LIMIT ? OFFSET ?", (*params, limit, offset)).fetchall()
+
+    def ids(self, query="", folder=None, tag=""):
+        where, params = self._where(query, folder, tag)
+        return [row[0] for row in self.conn.execute(
+            f"SELECT r.id FROM requests r WHERE {where} ORDER BY r.id", params)]
+
+    def folders(self):
+        return [row[0] for row in self.conn.execute(
+            "SELECT DISTINCT folder FROM requests WHERE deleted = 0 ORDER BY folder")]
+
+    def migrate_json(self, history_file):
+        # One-off import of the old api_client_history.json. Returns
+        # (imported, passwords_not_stored). When every password made it into
+        # the keyring the file is replaced by a copy without passwords so none
+        # stay on disk in plaintext; otherwise the original is only renamed,
+        # as it is then the sole copy of those passwords.
+        if not os.path.exists(history_file):
+            return 0, 0
+        try:
+            with open(history_file, "r") as f:
+                saved = json.load(f)
+        except (OSError, json.JSONDecodeError):
+            return 0, 0
+        lost = 0
+        for req_data in saved:
+            request_id = self.save(req_data, folder="Imported")
+            if req_data.get("auth_password") and not self.conn.execute(
+                    "SELECT has_secret FROM requests WHERE id = ?", (request_id,)).fetchone()[0]:
+                lost += 1
+        if lost:
+            os.replace(history_file, history_file + ".migrated")
+            return len(saved), lost
+        with open(history_file + ".migrated", "w") as f:
+            json.dump([{k: v for k, v in r.items() if k != "auth_password"} for r in saved], f, indent=4)
+        os.remove(history_file)
+        return len(saved), 0
+
+    def _set_secret(self, request_id, password):
+        if keyring is None:
+            return False
+        try:
+            keyring.set_password(KEYRING_SERVICE, f"request-{request_id}", password)
+            return True
+        except Exception:
+            return False
+
+    def _get_secret(self, request_id):
+        if keyring is None:
+            return ""
+        try:
+            return keyring.get_password(KEYRING_SERVICE, f"request-{request_id}") or ""
+        except Exception:
+            return ""
+
+    def _delete_secret(self, request_id):
+        if keyring is None:
+            return
+        try:
+            keyring.delete_password(KEYRING_SERVICE, f"request-{request_id}")
+        except Exception:
+            pass
+
+JSON_PATH_TOKEN = re.compile(r"""\.\.(\w+|\*)|\.(\w+|\*)|\[\s*(?:'([^']*)'|"([^"]*)"|(-?\d*:-?\d*)|(-?\d+)|(\*))\s*\]""")
+
+def parse_response_body(body_path, body):
+    # Reads a response body kept on disk or in memory as JSON. Raises
+    # ValueError when it is not valid JSON.
+    if body_path:
+        with open(body_path, "rb") as f:
+            return json.load(f)
+    if body is not None:
+        return json.loads(body)
+    return None
+
+def _json_children(value):
+    if isinstance(value, dict):
+        return list(value.items())
+    if isinstance(value, list):
+        return list(enumerate(value))
+    return []
+
+def _json_descendants(path, value):
+    yield path, value
+    for key, child in _json_children(value):
+        yield from _json_descendants(_json_path_join(path, key), child)
+
+def _json_path_join(path, key):
+    if isinstance(key, int):
+        return f"{path}[{key}]"
+    return f"{path}.{key}" if re.fullmatch(r"\w+", key) else f"{path}['{key}']"
+
+def json_path_query(data, expr):
+    # Subset of JSONPath: $, .key, ['key'], [n], [a:b], [*], .* and ..key
+    # (recursive descent). Returns (path, value) pairs.
+    expr = expr.strip()
+    if expr.startswith("$"):
+        expr = expr[1:]
+    matches = [("$", data)]
+    pos = 0
+    while pos < len(expr):
+        m = JSON_PATH_TOKEN.match(expr, pos)
+        if not m:
+            raise ValueError(f"Unsupported JSONPath syntax at: {expr[pos:]}")
+        pos = m.end()
+        recursive, dotted, single_quoted, double_quoted, slice_, index, star = m.groups()
+        step = []
+        if recursive is not None:
+            for path, value in matches:
+                for sub_path, sub_value in _json_descendants(path, value):
+                    for key, child in _json_children(sub_value):
+                        if recursive == "*" or key == recursive:
+                            step.append((_json_path_join(sub_path, key), child))
+        elif dotted == "*" or star is not None:
+            for path, value in matches:
+                step.extend((_json_path_join(path, key), child) for key, child in _json_children(value))
+        elif slice_ is not None:
+            start, _, stop = slice_.partition(":")
+            bounds = slice(int(start) if start else None, int(stop) if stop else None)
+            for path, value in matches:
+                if isinstance(value, list):
+                    indices = range(len(value))[bounds]
+                    step.extend((_json_path_join(path, i), value[i]) for i in indices)
+        elif index is not None:
+            i = int(index)
+            for path, value in matches:
+                if isinstance(value, list) and -len(value) <= i < len(value):
+                    step.append((_json_path_join(path, i % len(value)), value[i]))
+        else:
+            key = next(k for k in (dotted, single_quoted, double_quoted) if k is not None)
+            for path, value in matches:
+                if isinstance(value, dict) and key in value:
+                    step.append((_json_path_join(path, key), value[key]))
+        matches = step
+    return matches
+
+def json_summary(value):
+    if isinstance(value, dict):
+        return "object", f"{{{len(value)} keys}}"
+    if isinstance(value, list):
+        return "array", f"[{len(value)} items]"
+    text = json.dumps(value)
+    return type(value).__name__ if value is not None else "null", text if len(text) <= 200 else text[:200] + "…"
 
 class ApiClientApp:
     def __init__(self, root, style=None):
@@ -14,7 +1635,30 @@ class ApiClientApp:
         self.root.geometry("500x1000")
 
         self.history_file = "api_client_history.json"
-        self.saved_requests = self._load_requests_history()
+        self.request_store = RequestStore()
+        atexit.register(self.request_store.close)
+        self._history_loaded = 0
+        self._history_total = 0
+        self._last_response_json = None
+        self._response_body_path = None
+        self._response_body = None
+        self._response_is_json = False
+        self._response_size = 0
+        self._preview_page = 0
+        self._cancel_event = threading.Event()
+        self._request_token = 0
+        atexit.register(self._discard_response_body)
+        self._json_tree_nodes = {}
+        self._json_tree_loaded = False
+        self.runner = None
+        self.load_test = None
+        self.load_test_results = None
+        self.bulk_fetch = None
+        self.timing_history = {}
+        self.stub_server = None
+        self.session_pool = SessionPool()
+        self.http_cache = None
+        self.ui_queue = queue.Queue()
 
         self.root.grid_columnconfigure(0, weight=1)
         self.root.grid_rowconfigure(0, weight=1)
@@ -27,10 +1671,20 @@ class ApiClientApp:
         self.response_tab = ttk.Frame(self.notebook, padding="10")
         self.history_tab = ttk.Frame(self.notebook, padding="10")
         self.settings_tab = ttk.Frame(self.notebook, padding="10")
+        self.runner_tab = ttk.Frame(self.notebook, padding="10")
+        self.load_test_tab = ttk.Frame(self.notebook, padding="10")
+        self.bulk_fetch_tab = ttk.Frame(self.notebook, padding="10")
+        self.timing_tab = ttk.Frame(self.notebook, padding="10")
+        self.json_tree_tab = ttk.Frame(self.notebook, padding="10")
 
         self.notebook.add(self.request_tab, text="Request")
         self.notebook.add(self.response_tab, text="Response")
+        self.notebook.add(self.json_tree_tab, text="JSON Tree")
+        self.notebook.add(self.timing_tab, text="Timing")
         self.notebook.add(self.history_tab, text="History")
+        self.notebook.add(self.runner_tab, text="Runner")
+        self.notebook.add(self.load_test_tab, text="Load Test")
+        self.notebook.add(self.bulk_fetch_tab, text="Bulk Fetch")
         self.notebook.add(self.settings_tab, text="Settings")
 
         self.request_tab.grid_columnconfigure(0, weight=1)
@@ -55,12 +1709,6 @@ class ApiClientApp:
         self.settings_tab.grid_rowconfigure(2, weight=0)
         self.settings_tab.grid_rowconfigure(3, weight=0)
 
-        # self.virtualstock_tab = ttk.Frame(self.notebook, padding="10")
-        # self.notebook.add(self.virtualstock_tab, text="Virtualstock Orders")
-        # self.virtualstock_tab.grid_columnconfigure(0, weight=1)
-        # self.virtualstock_tab.grid_rowconfigure(1, weight=1)
-
-
         self.request_config_frame = ttk.LabelFrame(self.request_tab, text="Request Configuration", padding="10")
         self.request_config_frame.grid(row=0, column=0, sticky="ew", pady=(0, 10))
         self.request_config_frame.grid_columnconfigure(1, weight=1)
@@ -155,16 +1803,6 @@ class ApiClientApp:
         self.theme_selector_frame.grid(row=0, column=0, sticky="ew", pady=(0, 10))
         self.theme_selector_frame.grid_columnconfigure(1, weight=1)
 
-        # self.fetch_vs_button = ttk.Button(
-        #     self.virtualstock_tab, text="Fetch Orders", command=self._fetch_virtualstock_orders, bootstyle="primary"
-        # )
-        # self.fetch_vs_button.grid(row=0, column=0, sticky="ew", padx=5, pady=5)
-
-        # self.orders_output = scrolledtext.ScrolledText(self.virtualstock_tab, wrap="word", height=20)
-        # self.orders_output.grid(row=1, column=0, sticky="nsew", padx=5, pady=5)
-
-
-
         ttk.Label(self.theme_selector_frame, text="Select Theme:").grid(row=0, column=0, sticky="w", padx=5, pady=5)
         self.theme_combobox = ttk.Combobox(self.theme_selector_frame,
                                            values=self.style.theme_names(),
@@ -192,18 +1830,126 @@ class ApiClientApp:
                                                variable=self.ssl_verify_var, bootstyle="round-toggle")
         self.ssl_verify_check.grid(row=2, column=0, columnspan=2, sticky="w", padx=5, pady=5)
 
+        self.stream_to_disk_var = tk.BooleanVar(value=True)
+        self.stream_to_disk_check = ttk.Checkbutton(self.request_settings_frame, text="Stream Response Body to Disk",
+                                                    variable=self.stream_to_disk_var, bootstyle="round-toggle")
+        self.stream_to_disk_check.grid(row=5, column=0, columnspan=2, sticky="w", padx=5, pady=5)
+
+        ttk.Label(self.request_settings_frame, text="Connection Pool Size:").grid(row=3, column=0, sticky="w", padx=5, pady=5)
+        self.pool_size_var = tk.IntVar(value=self.session_pool.pool_size)
+        self.pool_size_entry = ttk.Entry(self.request_settings_frame, textvariable=self.pool_size_var, bootstyle="info")
+        self.pool_size_entry.grid(row=3, column=1, sticky="ew", padx=5, pady=5)
+
+        self.reset_connections_button = ttk.Button(self.request_settings_frame, text="Reset Connections",
+                                                   command=self._reset_connections, bootstyle="secondary-outline")
+        self.reset_connections_button.grid(row=4, column=0, columnspan=2, sticky="w", padx=5, pady=5)
+
+        self.http_cache_var = tk.BooleanVar(value=False)
+        self.http_cache_check = ttk.Checkbutton(self.request_settings_frame, text="Cache GET Responses on Disk",
+                                                variable=self.http_cache_var, bootstyle="round-toggle")
+        self.http_cache_check.grid(row=6, column=0, columnspan=2, sticky="w", padx=5, pady=5)
+
+        ttk.Label(self.request_settings_frame, text="Cache Size (MB):").grid(row=7, column=0, sticky="w", padx=5, pady=5)
+        self.cache_size_var = tk.IntVar(value=CACHE_MAX_BYTES // (1024 * 1024))
+        self.cache_size_entry = ttk.Entry(self.request_settings_frame, textvariable=self.cache_size_var, bootstyle="info")
+        self.cache_size_entry.grid(row=7, column=1, sticky="ew", padx=5, pady=5)
+
+        self.clear_cache_button = ttk.Button(self.request_settings_frame, text="Clear Cache",
+                                             command=self._clear_http_cache, bootstyle="secondary-outline")
+        self.clear_cache_button.grid(row=8, column=0, columnspan=2, sticky="w", padx=5, pady=5)
+
+        self.export_settings_frame = ttk.LabelFrame(self.settings_tab, text="CSV / Parquet Export", padding="10")
+        self.export_settings_frame.grid(row=2, column=0, sticky="ew", pady=(0, 10))
+        self.export_settings_frame.grid_columnconfigure(1, weight=1)
+
+        ttk.Label(self.export_settings_frame, text="Records JSONPath:").grid(row=0, column=0, sticky="w", padx=5, pady=5)
+        self.export_records_path_var = tk.StringVar(value="$")
+        ttk.Entry(self.export_settings_frame, textvariable=self.export_records_path_var, bootstyle="info").grid(row=0, column=1, sticky="ew", padx=5, pady=5)
+
+        ttk.Label(self.export_settings_frame, text="Columns (blank = discover):").grid(row=1, column=0, sticky="w", padx=5, pady=5)
+        self.export_columns_var = tk.StringVar()
+        ttk.Entry(self.export_settings_frame, textvariable=self.export_columns_var, bootstyle="info").grid(row=1, column=1, sticky="ew", padx=5, pady=5)
+
+        self.replay_frame = ttk.LabelFrame(self.settings_tab, text="Record / Replay", padding="10")
+        self.replay_frame.grid(row=3, column=0, sticky="ew", pady=(0, 10))
+        self.replay_frame.grid_columnconfigure(1, weight=1)
+
+        self.record_var = tk.BooleanVar(value=False)
+        ttk.Checkbutton(self.replay_frame, text="Record Requests to Cassette", variable=self.record_var,
+                        bootstyle="round-toggle").grid(row=0, column=0, columnspan=2, sticky="w", padx=5, pady=5)
+
+        self.cassette_path_var = tk.StringVar(value="api_client_cassette.jsonl")
+        self.stub_port_var = tk.IntVar(value=8899)
+        self.stub_latency_var = tk.DoubleVar(value=0.0)
+        self.stub_jitter_var = tk.DoubleVar(value=0.0)
+        for row, (label, var) in enumerate((("Cassette file:", self.cassette_path_var),
+                                            ("Stub port:", self.stub_port_var),
+                                            ("Injected latency (ms):", self.stub_latency_var),
+                                            ("Latency jitter (ms):", self.stub_jitter_var)), start=1):
+            ttk.Label(self.replay_frame, text=label).grid(row=row, column=0, sticky="w", padx=5, pady=5)
+            ttk.Entry(self.replay_frame, textvariable=var, bootstyle="info").grid(row=row, column=1, sticky="ew", padx=5, pady=5)
+
+        self.stub_buttons_frame = ttk.Frame(self.replay_frame)
+        self.stub_buttons_frame.grid(row=5, column=0, columnspan=2, sticky="ew")
+        self.stub_buttons_frame.grid_columnconfigure(0, weight=1)
+        self.stub_buttons_frame.grid_columnconfigure(1, weight=1)
+        self.stub_button = ttk.Button(self.stub_buttons_frame, text="Start Stub Server", command=self._toggle_stub_server, bootstyle="primary-outline")
+        self.stub_button.grid(row=0, column=0, sticky="ew", padx=2, pady=5)
+        ttk.Button(self.stub_buttons_frame, text="Point Request at Stub", command=self._point_at_stub,
+                   bootstyle="secondary-outline").grid(row=0, column=1, sticky="ew", padx=2, pady=5)
+
+        self.stub_status_label = ttk.Label(self.replay_frame, text="Stub server stopped.", bootstyle="secondary")
+        self.stub_status_label.grid(row=6, column=0, columnspan=2, sticky="w", padx=5, pady=5)
+
         self.history_frame = ttk.LabelFrame(self.history_tab, text="Saved Requests", padding="10")
         self.history_frame.grid(row=0, column=0, sticky="nsew", pady=(0, 10))
         self.history_frame.grid_columnconfigure(0, weight=1)
-        self.history_frame.grid_rowconfigure(0, weight=1)
-
-        self.history_listbox = tk.Listbox(self.history_frame, selectmode=tk.SINGLE)
-        self.history_listbox.grid(row=0, column=0, sticky="nsew", padx=5, pady=5)
-        self.history_listbox.bind("<<ListboxSelect>>", self._on_history_select)
-        self._populate_history_listbox()
+        self.history_frame.grid_rowconfigure(1, weight=1)
+
+        self.history_filter_frame = ttk.Frame(self.history_frame)
+        self.history_filter_frame.grid(row=0, column=0, columnspan=2, sticky="ew")
+        self.history_filter_frame.grid_columnconfigure(1, weight=1)
+        ttk.Label(self.history_filter_frame, text="Search:").grid(row=0, column=0, sticky="w", padx=5, pady=2)
+        self.history_search_entry = ttk.Entry(self.history_filter_frame, bootstyle="info")
+        self.history_search_entry.grid(row=0, column=1, columnspan=3, sticky="ew", padx=5, pady=2)
+        self.history_search_entry.bind("<Return>", lambda event: self._populate_history_listbox())
+        ttk.Label(self.history_filter_frame, text="Folder:").grid(row=1, column=0, sticky="w", padx=5, pady=2)
+        self.history_folder_combobox = ttk.Combobox(self.history_filter_frame, state="readonly", bootstyle="info")
+        self.history_folder_combobox.grid(row=1, column=1, sticky="ew", padx=5, pady=2)
+        self.history_folder_combobox.bind("<<ComboboxSelected>>", lambda event: self._populate_history_listbox())
+        ttk.Label(self.history_filter_frame, text="Tag:").grid(row=1, column=2, sticky="w", padx=5, pady=2)
+        self.history_tag_entry = ttk.Entry(self.history_filter_frame, width=12, bootstyle="info")
+        self.history_tag_entry.grid(row=1, column=3, sticky="ew", padx=5, pady=2)
+        self.history_tag_entry.bind("<Return>", lambda event: self._populate_history_listbox())
+
+        # Rows are fetched from the store a page at a time as the list is
+        # scrolled, so large collections don't have to be loaded up front.
+        self.history_listbox = ttk.Treeview(self.history_frame, columns=("method", "url", "folder", "tags"),
+                                            show="headings", selectmode="extended")
+        for column, heading, width in (("method", "Method", 60), ("url", "URL", 220),
+                                       ("folder", "Folder", 80), ("tags", "Tags", 80)):
+            self.history_listbox.heading(column, text=heading)
+            self.history_listbox.column(column, width=width, stretch=column == "url")
+        self.history_listbox.grid(row=1, column=0, sticky="nsew", padx=5, pady=5)
+        self.history_scrollbar = ttk.Scrollbar(self.history_frame, orient=tk.VERTICAL, command=self.history_listbox.yview)
+        self.history_scrollbar.grid(row=1, column=1, sticky="ns", pady=5)
+        self.history_listbox.configure(yscrollcommand=self._on_history_scroll)
+        self.history_listbox.bind("<<TreeviewSelect>>", self._on_history_select)
+        self.history_listbox.bind("<Double-1>", lambda event: self._load_selected_request())
+
+        self.history_save_frame = ttk.Frame(self.history_frame)
+        self.history_save_frame.grid(row=2, column=0, columnspan=2, sticky="ew")
+        self.history_save_frame.grid_columnconfigure(1, weight=1)
+        self.history_save_frame.grid_columnconfigure(3, weight=1)
+        ttk.Label(self.history_save_frame, text="Save to folder:").grid(row=0, column=0, sticky="w", padx=5, pady=2)
+        self.save_folder_combobox = ttk.Combobox(self.history_save_frame, bootstyle="info")
+        self.save_folder_combobox.grid(row=0, column=1, sticky="ew", padx=5, pady=2)
+        ttk.Label(self.history_save_frame, text="Tags:").grid(row=0, column=2, sticky="w", padx=5, pady=2)
+        self.save_tags_entry = ttk.Entry(self.history_save_frame, bootstyle="info")
+        self.save_tags_entry.grid(row=0, column=3, sticky="ew", padx=5, pady=2)
 
         self.history_buttons_frame = ttk.Frame(self.history_frame, padding="5")
-        self.history_buttons_frame.grid(row=1, column=0, sticky="ew")
+        self.history_buttons_frame.grid(row=3, column=0, columnspan=2, sticky="ew")
         self.history_buttons_frame.grid_columnconfigure(0, weight=1)
         self.history_buttons_frame.grid_columnconfigure(1, weight=1)
         self.history_buttons_frame.grid_columnconfigure(2, weight=1)
@@ -217,6 +1963,16 @@ class ApiClientApp:
         self.delete_request_button = ttk.Button(self.history_buttons_frame, text="Delete Selected", command=self._delete_selected_request, bootstyle="danger")
         self.delete_request_button.grid(row=0, column=2, sticky="ew", padx=2, pady=5)
 
+        migrated, lost = self.request_store.migrate_json(self.history_file)
+        self._refresh_history_folders()
+        self._populate_history_listbox()
+        if lost:
+            self._update_status(
+                f"Imported {migrated} saved requests, but {lost} passwords could not be stored (no keyring). "
+                f"They are kept in plaintext in {self.history_file}.migrated.", bootstyle="warning")
+        elif migrated:
+            self._update_status(f"Imported {migrated} saved requests from {self.history_file}.", bootstyle="info")
+
         self.export_buttons_frame = ttk.Frame(self.response_tab)
         self.export_buttons_frame.grid(row=5, column=0, columnspan=2, sticky="ew", padx=5, pady=5)
 
@@ -226,58 +1982,289 @@ class ApiClientApp:
         self.export_csv_button = ttk.Button(self.export_buttons_frame, text="Export CSV", command=self._export_response_csv, bootstyle="info")
         self.export_csv_button.grid(row=0, column=1, sticky="ew", padx=2)
 
+        self.prev_page_button = ttk.Button(self.export_buttons_frame, text="◀", command=lambda: self._show_body_page(self._preview_page - 1), bootstyle="secondary-outline", state=tk.DISABLED)
+        self.prev_page_button.grid(row=0, column=2, sticky="ew", padx=2)
+        self.next_page_button = ttk.Button(self.export_buttons_frame, text="▶", command=lambda: self._show_body_page(self._preview_page + 1), bootstyle="secondary-outline", state=tk.DISABLED)
+        self.next_page_button.grid(row=0, column=3, sticky="ew", padx=2)
+        self.preview_label = ttk.Label(self.export_buttons_frame, text="", bootstyle="secondary")
+        self.preview_label.grid(row=0, column=4, sticky="w", padx=5)
+
         self.export_json_button.config(state=tk.DISABLED)
         self.export_csv_button.config(state=tk.DISABLED)
 
+        self.timing_label = ttk.Label(self.response_tab, text="", wraplength=460, bootstyle="secondary")
+        self.timing_label.grid(row=6, column=0, columnspan=2, sticky="ew", padx=5, pady=5)
+
+        self.runner_tab.grid_columnconfigure(0, weight=1)
+        self.runner_tab.grid_rowconfigure(1, weight=1)
+
+        self.runner_config_frame = ttk.LabelFrame(self.runner_tab, text="Parallel Runner", padding="10")
+        self.runner_config_frame.grid(row=0, column=0, sticky="ew", pady=(0, 10))
+        self.runner_config_frame.grid_columnconfigure(1, weight=1)
+
+        ttk.Label(self.runner_config_frame, text="Source:").grid(row=0, column=0, sticky="w", padx=5, pady=5)
+        self.runner_source_combobox = ttk.Combobox(self.runner_config_frame,
+                                                   values=["Current request", "Selected saved requests", "All saved requests",
+                                                           "Current request + data file", "Selected saved request + data file"],
+                                                   state="readonly", bootstyle="info")
+        self.runner_source_combobox.set("Current request")
+        self.runner_source_combobox.grid(row=0, column=1, sticky="ew", padx=5, pady=5)
+
+        ttk.Label(self.runner_config_frame, text="Iterations:").grid(row=1, column=0, sticky="w", padx=5, pady=5)
+        self.runner_iterations_var = tk.IntVar(value=10)
+        ttk.Entry(self.runner_config_frame, textvariable=self.runner_iterations_var, bootstyle="info").grid(row=1, column=1, sticky="ew", padx=5, pady=5)
+
+        ttk.Label(self.runner_config_frame, text="Concurrency:").grid(row=2, column=0, sticky="w", padx=5, pady=5)
+        self.runner_concurrency_var = tk.IntVar(value=4)
+        ttk.Entry(self.runner_config_frame, textvariable=self.runner_concurrency_var, bootstyle="info").grid(row=2, column=1, sticky="ew", padx=5, pady=5)
+
+        ttk.Label(self.runner_config_frame, text="Data file (.csv / .jsonl):").grid(row=3, column=0, sticky="w", padx=5, pady=5)
+        self.runner_data_frame = ttk.Frame(self.runner_config_frame)
+        self.runner_data_frame.grid(row=3, column=1, sticky="ew")
+        self.runner_data_frame.grid_columnconfigure(0, weight=1)
+        self.runner_data_var = tk.StringVar()
+        ttk.Entry(self.runner_data_frame, textvariable=self.runner_data_var, bootstyle="info").grid(row=0, column=0, sticky="ew", padx=5, pady=5)
+        ttk.Button(self.runner_data_frame, text="Browse", command=self._choose_runner_data, bootstyle="secondary-outline").grid(row=0, column=1, padx=2)
+
+        ttk.Label(self.runner_config_frame, text="Results file (.jsonl):").grid(row=4, column=0, sticky="w", padx=5, pady=5)
+        self.runner_results_var = tk.StringVar(value="batch_results.jsonl")
+        ttk.Entry(self.runner_config_frame, textvariable=self.runner_results_var, bootstyle="info").grid(row=4, column=1, sticky="ew", padx=5, pady=5)
+
+        ttk.Label(self.runner_config_frame, text="Retries (429 / 5xx):").grid(row=5, column=0, sticky="w", padx=5, pady=5)
+        self.runner_retries_var = tk.IntVar(value=3)
+        ttk.Entry(self.runner_config_frame, textvariable=self.runner_retries_var, bootstyle="info").grid(row=5, column=1, sticky="ew", padx=5, pady=5)
+
+        self.runner_buttons_frame = ttk.Frame(self.runner_config_frame)
+        self.runner_buttons_frame.grid(row=6, column=0, columnspan=2, sticky="ew")
+        self.runner_buttons_frame.grid_columnconfigure(0, weight=1)
+        self.runner_buttons_frame.grid_columnconfigure(1, weight=1)
+        self.runner_start_button = ttk.Button(self.runner_buttons_frame, text="Run", command=self.start_runner, bootstyle="primary")
+        self.runner_start_button.grid(row=0, column=0, sticky="ew", padx=2, pady=5)
+        self.runner_stop_button = ttk.Button(self.runner_buttons_frame, text="Stop", command=self.stop_runner, bootstyle="danger-outline", state=tk.DISABLED)
+        self.runner_stop_button.grid(row=0, column=1, sticky="ew", padx=2, pady=5)
+
+        self.runner_results_tree = ttk.Treeview(self.runner_tab, columns=("n", "request", "status", "latency", "bytes"), show="headings")
+        for col, heading, width in (("n", "#", 40), ("request", "Request", 200), ("status", "Status", 60),
+                                    ("latency", "Latency (ms)", 90), ("bytes", "Bytes", 70)):
+            self.runner_results_tree.heading(col, text=heading)
+            self.runner_results_tree.column(col, width=width, stretch=col == "request")
+        self.runner_results_tree.grid(row=1, column=0, sticky="nsew", padx=5, pady=5)
+
+        self.runner_summary_label = ttk.Label(self.runner_tab, text="", wraplength=460, bootstyle="secondary")
+        self.runner_summary_label.grid(row=2, column=0, sticky="ew", padx=5, pady=5)
+
+        self.load_test_tab.grid_columnconfigure(0, weight=1)
+        self.load_test_tab.grid_rowconfigure(2, weight=1)
+
+        self.load_config_frame = ttk.LabelFrame(self.load_test_tab, text="Load Test (current request)", padding="10")
+        self.load_config_frame.grid(row=0, column=0, sticky="ew", pady=(0, 10))
+        self.load_config_frame.grid_columnconfigure(1, weight=1)
+
+        ttk.Label(self.load_config_frame, text="Mode:").grid(row=0, column=0, sticky="w", padx=5, pady=5)
+        self.load_mode_combobox = ttk.Combobox(self.load_config_frame, values=["Fixed concurrency", "Target RPS"],
+                                               state="readonly", bootstyle="info")
+        self.load_mode_combobox.set("Fixed concurrency")
+        self.load_mode_combobox.grid(row=0, column=1, sticky="ew", padx=5, pady=5)
+
+        self.load_target_var = tk.IntVar(value=10)
+        self.load_duration_var = tk.DoubleVar(value=30.0)
+        self.load_warmup_var = tk.DoubleVar(value=5.0)
+        for row, (label, var) in enumerate((("Concurrency / RPS:", self.load_target_var),
+                                            ("Duration (seconds):", self.load_duration_var),
+                                            ("Warm-up (seconds):", self.load_warmup_var)), start=1):
+            ttk.Label(self.load_config_frame, text=label).grid(row=row, column=0, sticky="w", padx=5, pady=5)
+            ttk.Entry(self.load_config_frame, textvariable=var, bootstyle="info").grid(row=row, column=1, sticky="ew", padx=5, pady=5)
+
+        self.load_buttons_frame = ttk.Frame(self.load_config_frame)
+        self.load_buttons_frame.grid(row=4, column=0, columnspan=2, sticky="ew")
+        for col in range(4):
+            self.load_buttons_frame.grid_columnconfigure(col, weight=1)
+        self.load_start_button = ttk.Button(self.load_buttons_frame, text="Start", command=self.start_load_test, bootstyle="primary")
+        self.load_start_button.grid(row=0, column=0, sticky="ew", padx=2, pady=5)
+        self.load_stop_button = ttk.Button(self.load_buttons_frame, text="Stop", command=self.stop_load_test, bootstyle="danger-outline", state=tk.DISABLED)
+        self.load_stop_button.grid(row=0, column=1, sticky="ew", padx=2, pady=5)
+        self.load_export_json_button = ttk.Button(self.load_buttons_frame, text="Export JSON", command=lambda: self._export_load_test("json"), bootstyle="success-outline", state=tk.DISABLED)
+        self.load_export_json_button.grid(row=0, column=2, sticky="ew", padx=2, pady=5)
+        self.load_export_csv_button = ttk.Button(self.load_buttons_frame, text="Export CSV", command=lambda: self._export_load_test("csv"), bootstyle="info-outline", state=tk.DISABLED)
+        self.load_export_csv_button.grid(row=0, column=3, sticky="ew", padx=2, pady=5)
+
+        self.load_stats_label = ttk.Label(self.load_test_tab, text="Idle", font=("TkFixedFont", 9), bootstyle="secondary")
+        self.load_stats_label.grid(row=1, column=0, sticky="ew", padx=5, pady=5)
+
+        self.load_chart = tk.Canvas(self.load_test_tab, height=260, background="#1e1e1e", highlightthickness=0)
+        self.load_chart.grid(row=2, column=0, sticky="nsew", padx=5, pady=5)
+
+        self.timing_tab.grid_columnconfigure(0, weight=1)
+        self.timing_tab.grid_rowconfigure(2, weight=1)
+
+        self.timing_endpoint_frame = ttk.Frame(self.timing_tab)
+        self.timing_endpoint_frame.grid(row=0, column=0, sticky="ew", pady=(0, 5))
+        self.timing_endpoint_frame.grid_columnconfigure(1, weight=1)
+        ttk.Label(self.timing_endpoint_frame, text="Endpoint:").grid(row=0, column=0, sticky="w", padx=5)
+        self.timing_endpoint_combobox = ttk.Combobox(self.timing_endpoint_frame, state="readonly", bootstyle="info")
+        self.timing_endpoint_combobox.grid(row=0, column=1, sticky="ew", padx=5)
+        self.timing_endpoint_combobox.bind("<<ComboboxSelected>>", lambda event: self._draw_timing_panel())
+
+        self.timing_tree = ttk.Treeview(self.timing_tab, columns=("phase", "last", "median"), show="headings", height=8)
+        for col, heading, width in (("phase", "Phase", 140), ("last", "Last call", 100), ("median", f"Median (last {TIMING_HISTORY})", 140)):
+            self.timing_tree.heading(col, text=heading)
+            self.timing_tree.column(col, width=width, stretch=col == "phase")
+        self.timing_tree.grid(row=1, column=0, sticky="ew", padx=5, pady=5)
+
+        self.timing_chart = tk.Canvas(self.timing_tab, height=260, background="#1e1e1e", highlightthickness=0)
+        self.timing_chart.grid(row=2, column=0, sticky="nsew", padx=5, pady=5)
+
+        self.bulk_fetch_tab.grid_columnconfigure(0, weight=1)
+
+        self.bulk_config_frame = ttk.LabelFrame(self.bulk_fetch_tab, text="Paginated Fetch (current request)", padding="10")
+        self.bulk_config_frame.grid(row=0, column=0, sticky="ew", pady=(0, 10))
+        self.bulk_config_frame.grid_columnconfigure(1, weight=1)
+
+        ttk.Label(self.bulk_config_frame, text="Preset:").grid(row=0, column=0, sticky="w", padx=5, pady=5)
+        self.bulk_preset_combobox = ttk.Combobox(self.bulk_config_frame, values=["Custom"] + list(PAGINATION_PRESETS),
+                                                 state="readonly", bootstyle="info")
+        self.bulk_preset_combobox.set("Custom")
+        self.bulk_preset_combobox.grid(row=0, column=1, sticky="ew", padx=5, pady=5)
+        self.bulk_preset_combobox.bind("<<ComboboxSelected>>", self._apply_pagination_preset)
+
+        ttk.Label(self.bulk_config_frame, text="Pagination:").grid(row=1, column=0, sticky="w", padx=5, pady=5)
+        self.bulk_scheme_combobox = ttk.Combobox(self.bulk_config_frame, values=list(PAGINATION_SCHEMES),
+                                                 state="readonly", bootstyle="info")
+        self.bulk_scheme_combobox.set("Offset / limit")
+        self.bulk_scheme_combobox.grid(row=1, column=1, sticky="ew", padx=5, pady=5)
+
+        self.bulk_records_path_var = tk.StringVar(value="$")
+        self.bulk_position_param_var = tk.StringVar(value="offset")
+        self.bulk_limit_param_var = tk.StringVar(value="limit")
+        self.bulk_start_var = tk.IntVar(value=0)
+        self.bulk_page_size_var = tk.IntVar(value=100)
+        self.bulk_cursor_path_var = tk.StringVar()
+        self.bulk_total_path_var = tk.StringVar()
+        self.bulk_concurrency_var = tk.IntVar(value=4)
+        for row, (label, var) in enumerate((("Records JSONPath:", self.bulk_records_path_var),
+                                            ("Offset / page / cursor parameter:", self.bulk_position_param_var),
+                                            ("Limit parameter:", self.bulk_limit_param_var),
+                                            ("Start at:", self.bulk_start_var),
+                                            ("Page size:", self.bulk_page_size_var),
+                                            ("Next cursor JSONPath:", self.bulk_cursor_path_var),
+                                            ("Total count JSONPath:", self.bulk_total_path_var),
+                                            ("Concurrent pages:", self.bulk_concurrency_var)), start=2):
+            ttk.Label(self.bulk_config_frame, text=label).grid(row=row, column=0, sticky="w", padx=5, pady=5)
+            ttk.Entry(self.bulk_config_frame, textvariable=var, bootstyle="info").grid(row=row, column=1, sticky="ew", padx=5, pady=5)
+
+        ttk.Label(self.bulk_config_frame, text="Output (.jsonl / .csv):").grid(row=10, column=0, sticky="w", padx=5, pady=5)
+        self.bulk_output_frame = ttk.Frame(self.bulk_config_frame)
+        self.bulk_output_frame.grid(row=10, column=1, sticky="ew")
+        self.bulk_output_frame.grid_columnconfigure(0, weight=1)
+        self.bulk_output_var = tk.StringVar(value="records.jsonl")
+        ttk.Entry(self.bulk_output_frame, textvariable=self.bulk_output_var, bootstyle="info").grid(row=0, column=0, sticky="ew", padx=5, pady=5)
+        ttk.Button(self.bulk_output_frame, text="Browse", command=self._choose_bulk_output, bootstyle="secondary-outline").grid(row=0, column=1, padx=2)
+
+        self.bulk_buttons_frame = ttk.Frame(self.bulk_config_frame)
+        self.bulk_buttons_frame.grid(row=11, column=0, columnspan=2, sticky="ew")
+        for col in range(2):
+            self.bulk_buttons_frame.grid_columnconfigure(col, weight=1)
+        self.bulk_start_button = ttk.Button(self.bulk_buttons_frame, text="Start", command=self.start_bulk_fetch, bootstyle="primary")
+        self.bulk_start_button.grid(row=0, column=0, sticky="ew", padx=2, pady=5)
+        self.bulk_stop_button = ttk.Button(self.bulk_buttons_frame, text="Stop", command=self.stop_bulk_fetch, bootstyle="danger-outline", state=tk.DISABLED)
+        self.bulk_stop_button.grid(row=0, column=1, sticky="ew", padx=2, pady=5)
+
+        self.bulk_stats_label = ttk.Label(self.bulk_fetch_tab, text="Idle", font=("TkFixedFont", 9), bootstyle="secondary")
+        self.bulk_stats_label.grid(row=1, column=0, sticky="ew", padx=5, pady=5)
+
+        self.json_tree_tab.grid_columnconfigure(0, weight=1)
+        self.json_tree_tab.grid_rowconfigure(1, weight=1)
+
+        self.json_filter_frame = ttk.Frame(self.json_tree_tab)
+        self.json_filter_frame.grid(row=0, column=0, sticky="ew", pady=(0, 5))
+        self.json_filter_frame.grid_columnconfigure(1, weight=1)
+        ttk.Label(self.json_filter_frame, text="JSONPath:").grid(row=0, column=0, sticky="w", padx=5)
+        self.json_filter_entry = ttk.Entry(self.json_filter_frame, bootstyle="info")
+        self.json_filter_entry.insert(0, "$")
+        self.json_filter_entry.grid(row=0, column=1, sticky="ew", padx=5)
+        self.json_filter_entry.bind("<Return>", lambda event: self._apply_json_filter())
+        ttk.Button(self.json_filter_frame, text="Filter", command=self._apply_json_filter, bootstyle="info").grid(row=0, column=2, padx=2)
+        ttk.Button(self.json_filter_frame, text="Reset", command=self._reset_json_filter, bootstyle="secondary-outline").grid(row=0, column=3, padx=2)
+
+        self.json_tree = ttk.Treeview(self.json_tree_tab, columns=("type", "value"), show="tree headings")
+        self.json_tree.heading("#0", text="Key")
+        self.json_tree.heading("type", text="Type")
+        self.json_tree.heading("value", text="Value")
+        self.json_tree.column("#0", width=180)
+        self.json_tree.column("type", width=60, stretch=False)
+        self.json_tree.column("value", width=240)
+        self.json_tree.grid(row=1, column=0, sticky="nsew", padx=5, pady=5)
+        self.json_tree_scrollbar = ttk.Scrollbar(self.json_tree_tab, orient=tk.VERTICAL, command=self.json_tree.yview)
+        self.json_tree_scrollbar.grid(row=1, column=1, sticky="ns")
+        self.json_tree.configure(yscrollcommand=self.json_tree_scrollbar.set)
+        self.json_tree.bind("<<TreeviewOpen>>", self._on_json_tree_open)
+        self.json_tree.bind("<Double-1>", self._on_json_tree_open)
+        self.notebook.bind("<<NotebookTabChanged>>", self._on_tab_changed)
+
+        self.root.after(100, self._process_ui_queue)
+
+    def _history_filter(self):
+        folder = self.history_folder_combobox.get()
+        return {
+            "query": self.history_search_entry.get(),
+            "folder": None if folder in ("", "All folders") else folder,
+            "tag": self.history_tag_entry.get(),
+        }
 
-    def _load_requests_history(self):
-        if os.path.exists(self.history_file):
-            try:
-                with open(self.history_file, 'r') as f:
-                    return json.load(f)
-            except json.JSONDecodeError:
-                return []
-        return []
-
-    def _save_requests_history(self):
-        with open(self.history_file, 'w') as f:
-            json.dump(self.saved_requests, f, indent=4)
+    def _refresh_history_folders(self):
+        folders = self.request_store.folders()
+        self.history_folder_combobox.config(values=["All folders"] + folders)
+        if not self.history_folder_combobox.get():
+            self.history_folder_combobox.set("All folders")
+        self.save_folder_combobox.config(values=folders)
 
     def _populate_history_listbox(self):
-        self.history_listbox.delete(0, tk.END)
-        for idx, req in enumerate(self.saved_requests):
-            display_text = f"{req.get('method', 'N/A')} {req.get('url', 'N/A')}"
-            self.history_listbox.insert(tk.END, display_text)
+        self.history_listbox.delete(*self.history_listbox.get_children())
+        self._history_loaded = 0
+        try:
+            self._history_total = self.request_store.count(**self._history_filter())
+        except sqlite3.OperationalError as e:
+            self._history_total = 0
+            self._update_status(f"Invalid search: {e}", bootstyle="warning")
+            return
+        self._load_history_page()
+
+    def _load_history_page(self):
+        rows = self.request_store.page(offset=self._history_loaded, **self._history_filter())
+        for request_id, name, method, url, folder, tags in rows:
+            self.history_listbox.insert("", tk.END, iid=str(request_id), values=(method, name or url, folder, tags))
+        self._history_loaded += len(rows)
+        self.history_frame.config(text=f"Saved Requests ({self._history_total})")
+
+    def _on_history_scroll(self, first, last):
+        self.history_scrollbar.set(first, last)
+        if float(last) > 0.9 and self._history_loaded < self._history_total:
+            self._load_history_page()
+
+    def _selected_request_ids(self):
+        return [int(iid) for iid in self.history_listbox.selection()]
 
     def _on_history_select(self, event):
-        selected_indices = self.history_listbox.curselection()
-        if selected_indices:
-            idx = selected_indices[0]
-            request_data = self.saved_requests[idx]
-            self._update_status(f"Selected: {request_data.get('method')} {request_data.get('url')}", bootstyle="info")
+        selected_ids = self._selected_request_ids()
+        if selected_ids:
+            values = self.history_listbox.item(str(selected_ids[0]), "values")
+            self._update_status(f"Selected: {values[0]} {values[1]}", bootstyle="info")
 
     def _save_current_request(self):
-        req_data = {
-            "method": self.method_combobox.get(),
-            "url": self.url_entry.get(),
-            "headers": self.headers_text.get(1.0, tk.END).strip(),
-            "query_params": self.query_params_text.get(1.0, tk.END).strip(),
-            "body_type": self.body_type_combobox.get(),
-            "body": self.body_text.get(1.0, tk.END).strip(),
-            "auth_username": self.auth_username_entry.get(),
-            "auth_password": self.auth_password_entry.get()
-        }
-        self.saved_requests.append(req_data)
-        self._save_requests_history()
+        req_data = self._current_request_data()
+        tags = [t.strip() for t in self.save_tags_entry.get().split(",") if t.strip()]
+        self.request_store.save(req_data, folder=self.save_folder_combobox.get().strip(), tags=tags)
+        self._refresh_history_folders()
         self._populate_history_listbox()
-        self._update_status("Current request saved.", bootstyle="success")
+        if req_data.get("auth_password") and keyring is None:
+            self._update_status("Request saved without its password (install keyring to store it).", bootstyle="warning")
+        else:
+            self._update_status("Current request saved.", bootstyle="success")
 
     def _load_selected_request(self):
-        selected_indices = self.history_listbox.curselection()
-        if selected_indices:
-            idx = selected_indices[0]
-            request_data = self.saved_requests[idx]
-
+        selected_ids = self._selected_request_ids()
+        request_data = self.request_store.get(selected_ids[0]) if selected_ids else None
+        if request_data:
             self.method_combobox.set(request_data.get("method", "GET"))
             self.url_entry.delete(0, tk.END)
             self.url_entry.insert(0, request_data.get("url", ""))
@@ -299,13 +2286,12 @@ class ApiClientApp:
             self._update_status("No request selected for loading.", bootstyle="warning")
 
     def _delete_selected_request(self):
-        selected_indices = self.history_listbox.curselection()
-        if selected_indices:
-            idx = selected_indices[0]
-            del self.saved_requests[idx]
-            self._save_requests_history()
+        selected_ids = self._selected_request_ids()
+        if selected_ids:
+            self.request_store.delete(selected_ids)
+            self._refresh_history_folders()
             self._populate_history_listbox()
-            self._update_status("Selected request deleted.", bootstyle="success")
+            self._update_status(f"{len(selected_ids)} saved request(s) deleted.", bootstyle="success")
         else:
             messagebox.showwarning("Delete Request", "Please select a request to delete from history.")
             self._update_status("No request selected for deletion.", bootstyle="warning")
@@ -334,37 +2320,110 @@ class ApiClientApp:
         self.response_body_text.config(state=tk.DISABLED)
         self.export_json_button.config(state=tk.DISABLED)
         self.export_csv_button.config(state=tk.DISABLED)
+        self.timing_label.config(text="")
+        self.preview_label.config(text="")
+        self.prev_page_button.config(state=tk.DISABLED)
+        self.next_page_button.config(state=tk.DISABLED)
         self._last_response_json = None
+        self._discard_response_body()
+        self._clear_json_tree()
 
         self._update_status("Response fields cleared.", bootstyle="info")
 
+    def _discard_response_body(self):
+        if self._response_body_path and os.path.exists(self._response_body_path):
+            try:
+                os.remove(self._response_body_path)
+            except OSError:
+                pass
+        self._response_body_path = None
+        self._response_body = None
+        self._response_is_json = False
+        self._response_size = 0
+
+    def _response_json(self):
+        # Parsed at most once, and only when something actually needs the
+        # structure (tree view, CSV export).
+        if self._last_response_json is None and self._response_is_json:
+            try:
+                self._last_response_json = parse_response_body(self._response_body_path, self._response_body)
+            except ValueError:
+                self._response_is_json = False
+        return self._last_response_json
+
+    def _read_body_page(self, page):
+        offset = page * PREVIEW_PAGE_SIZE
+        if self._response_body_path:
+            with open(self._response_body_path, "rb") as f:
+                f.seek(offset)
+                chunk = f.read(PREVIEW_PAGE_SIZE)
+        else:
+            chunk = (self._response_body or b"")[offset:offset + PREVIEW_PAGE_SIZE]
+        return chunk.decode("utf-8", errors="replace")
+
+    def _show_body_page(self, page):
+        pages = max(1, -(-self._response_size // PREVIEW_PAGE_SIZE))
+        self._preview_page = max(0, min(page, pages - 1))
+        self.response_body_text.config(state=tk.NORMAL)
+        self.response_body_text.delete(1.0, tk.END)
+        self.response_body_text.insert(tk.END, self._read_body_page(self._preview_page))
+        self.response_body_text.config(state=tk.DISABLED)
+        self.preview_label.config(text=f"Page {self._preview_page + 1}/{pages} of {self._response_size / (1024 * 1024):.1f} MB")
+        self.prev_page_button.config(state=tk.NORMAL if self._preview_page > 0 else tk.DISABLED)
+        self.next_page_button.config(state=tk.NORMAL if self._preview_page < pages - 1 else tk.DISABLED)
+
     def _export_response_json(self):
-        if self._last_response_json is None:
+        if not self._response_is_json:
             messagebox.showwarning("Export JSON", "No JSON response to export.")
             self._update_status("No JSON response to export.", bootstyle="warning")
             return
 
         try:
-            with open("response.json", "w") as f:
-                json.dump(self._last_response_json, f, indent=4)
+            if self._response_body_path:
+                shutil.copyfile(self._response_body_path, "response.json")
+            else:
+                with open("response.json", "w") as f:
+                    json.dump(self._response_json(), f, indent=4)
             self._update_status("Response exported to response.json", bootstyle="success")
         except Exception as e:
             messagebox.showerror("Export Error", f"Failed to export JSON: {e}")
             self._update_status(f"Failed to export JSON: {e}", bootstyle="danger")
     def _export_response_csv(self):
-        if self._last_response_json is None:
+        if not self._response_is_json:
             messagebox.showwarning("Export CSV", "No JSON response to export.")
             self._update_status("No JSON response to export.", bootstyle="warning")
             return
 
-        try:
-            import pandas as pd
-            df = pd.json_normalize(self._last_response_json)
-            df.to_csv("response.csv", index=False)
-            self._update_status("Response exported to response.csv", bootstyle="success")
-        except Exception as e:
-            messagebox.showerror("Export Error", f"Failed to export CSV: {e}")
-            self._update_status(f"Failed to export CSV: {e}", bootstyle="danger")
+        filetypes = [("CSV files", "*.csv")] + ([("Parquet files", "*.parquet")] if pq is not None else [])
+        output_path = filedialog.asksaveasfilename(defaultextension=".csv", initialfile="response.csv", filetypes=filetypes)
+        if not output_path:
+            return
+        records_path = self.export_records_path_var.get().strip()
+        columns = [c.strip() for c in self.export_columns_var.get().split(",") if c.strip()]
+        # A body that is already parsed is reused; a streamed body is read
+        # from its file so it never has to be loaded whole.
+        source = {"data": self._last_response_json} if self._last_response_json is not None else (
+            {"body_path": self._response_body_path} if self._response_body_path else {"data": self._response_json()})
+        records = lambda: iter_json_records(records_path, **source)
+        self.export_csv_button.config(state=tk.DISABLED)
+        self._update_status(f"Exporting to {output_path}...", bootstyle="info")
+
+        def export():
+            try:
+                count, _ = export_records(records, output_path, columns)
+                self._post_to_ui(self._finish_export, output_path, count, None)
+            except Exception as e:
+                self._post_to_ui(self._finish_export, output_path, 0, e)
+
+        threading.Thread(target=export, daemon=True).start()
+
+    def _finish_export(self, output_path, count, error):
+        self.export_csv_button.config(state=tk.NORMAL if self._response_is_json else tk.DISABLED)
+        if error is not None:
+            messagebox.showerror("Export Error", f"Failed to export CSV: {error}")
+            self._update_status(f"Failed to export CSV: {error}", bootstyle="danger")
+        else:
+            self._update_status(f"Exported {count} records to {output_path}", bootstyle="success")
 
     def _update_status(self, message, bootstyle="secondary"):
         self.status_bar.config(text=message, bootstyle=bootstyle)
@@ -372,58 +2431,11 @@ class ApiClientApp:
 
 
     def _parse_key_value_text(self, raw_text):
-        parsed_dict = {}
-        for line in raw_text.splitlines():
-            line = line.strip()
-            if line:
-                parts = line.split(':', 1)
-                if len(parts) == 2:
-                    key = parts[0].strip()
-                    value = parts[1].strip()
-                    parsed_dict[key] = value
-                else:
-                    self._update_status(f"Skipping malformed line: '{line}'. Expected 'Key: Value'.", bootstyle="warning")
+        parsed_dict, malformed = parse_key_value_text(raw_text)
+        for line in malformed:
+            self._update_status(f"Skipping malformed line: '{line}'. Expected 'Key: Value'.", bootstyle="warning")
         return parsed_dict
 
-    def _fetch_virtualstock_orders(self):
-        from requests.auth import HTTPBasicAuth
-
-        api_url = "https://api.virtualstock.com/restapi/v4/orders/"
-        username = "your_username"
-        password = "your_password"
-
-        params = {
-            "limit": 5,
-            "offset": 0,
-            "status": "ORDER"
-        }
-        headers = {
-            "Accept": "application/json"
-        }
-
-        self.orders_output.delete(1.0, tk.END)
-        self._update_status("Fetching Virtualstock orders...", bootstyle="info")
-
-        try:
-            response = requests.get(api_url, params=params, auth=HTTPBasicAuth(username, password), headers=headers, timeout=15)
-            response.raise_for_status()
-            orders = response.json().get("orders", [])
-
-            if not orders:
-                self.orders_output.insert(tk.END, "No new orders found.")
-                self._update_status("No orders found.", bootstyle="warning")
-                return
-
-            formatted = json.dumps(orders, indent=2)
-            self.orders_output.insert(tk.END, formatted)
-            self._update_status(f"Fetched {len(orders)} orders.", bootstyle="success")
-
-        except requests.exceptions.RequestException as e:
-            self.orders_output.insert(tk.END, f"Error fetching orders:\n{e}")
-            self._update_status("Failed to fetch orders.", bootstyle="danger")
-
-
-
     def _change_theme(self, event):
         selected_theme = self.theme_combobox.get()
         self.style.theme_use(selected_theme)
@@ -433,6 +2445,10 @@ class ApiClientApp:
 
 
     def cancel_request(self):
+        # requests cannot abort a call that is waiting for headers; the worker
+        # stops streaming the body and its result is discarded when it arrives.
+        self._cancel_event.set()
+        self._request_token += 1
         self.send_button.config(state=tk.NORMAL)
         self.export_json_button.config(state=tk.DISABLED)
         self.export_csv_button.config(state=tk.DISABLED)
@@ -440,172 +2456,730 @@ class ApiClientApp:
         self._last_response_json = None
         self._update_status("Request cancelled.", bootstyle="warning")
 
+    def _process_ui_queue(self):
+        try:
+            while True:
+                task, args, kwargs = self.ui_queue.get_nowait()
+                task(*args, **kwargs)
+        except queue.Empty:
+            pass
+        finally:
+            self.root.after(100, self._process_ui_queue)
+
+    def _post_to_ui(self, task, *args, **kwargs):
+        self.ui_queue.put((task, args, kwargs))
+
+    def _current_request_data(self):
+        return {
+            "method": self.method_combobox.get(),
+            "url": self.url_entry.get(),
+            "headers": self.headers_text.get(1.0, tk.END).strip(),
+            "query_params": self.query_params_text.get(1.0, tk.END).strip(),
+            "body_type": self.body_type_combobox.get(),
+            "body": self.body_text.get(1.0, tk.END).strip(),
+            "auth_username": self.auth_username_entry.get(),
+            "auth_password": self.auth_password_entry.get()
+        }
+
+    def _session(self, verify, min_pool_size=None):
+        try:
+            pool_size = max(1, self.pool_size_var.get())
+        except tk.TclError:
+            pool_size = self.session_pool.pool_size
+        if pool_size != self.session_pool.pool_size:
+            self.session_pool.close()
+            self.session_pool.pool_size = pool_size
+        return self.session_pool.get(verify, min_pool_size)
+
+    def _reset_connections(self):
+        self.session_pool.close()
+        self._update_status("Connection pools closed.", bootstyle="info")
+
+    def _build_kwargs(self, req_data):
+        for raw in (req_data.get("headers", ""), req_data.get("query_params", "")):
+            self._parse_key_value_text(raw)
+        return build_request_kwargs(req_data, self.timeout_var.get(),
+                                    self.follow_redirects_var.get(), self.ssl_verify_var.get())
+
     def send_request(self):
         self._clear_response_fields()
-        self._update_status("Sending request...", bootstyle="info")
-        self.send_button.config(state=tk.DISABLED)
-        self.export_json_button.config(state=tk.NORMAL)
-        self.export_csv_button.config(state=tk.NORMAL)
         self._last_response_json = None
 
-        method = self.method_combobox.get()
-        url = self.url_entry.get()
-        headers_raw = self.headers_text.get(1.0, tk.END).strip()
-        body_type = self.body_type_combobox.get()
-        request_body_raw = self.body_text.get(1.0, tk.END).strip()
-
-        if not url:
-            messagebox.showerror("Error", "URL cannot be empty.")
-            self._update_status("Error: URL cannot be empty.", bootstyle="danger")
-            self.send_button.config(state=tk.NORMAL)
+        try:
+            kwargs = self._build_kwargs(self._current_request_data())
+        except (ValueError, tk.TclError) as e:
+            messagebox.showerror("Error", str(e))
+            self._update_status(f"Error: {e}", bootstyle="danger")
             return
 
-        headers = self._parse_key_value_text(headers_raw)
-        query_params = self._parse_key_value_text(self.query_params_text.get(1.0, tk.END).strip())
+        self._update_status("Sending request...", bootstyle="info")
+        self.send_button.config(state=tk.DISABLED)
+        self._request_token += 1
+        self._cancel_event = threading.Event()
+        session = self._session(kwargs["verify"])
+        cache = self._http_cache() if self.http_cache_var.get() else None
+        recorder = CassetteRecorder(self.cassette_path_var.get().strip()) if self.record_var.get() else None
+        args = (session, kwargs, self._request_token, self._cancel_event, self.stream_to_disk_var.get(), cache, recorder)
+        threading.Thread(target=self._request_worker, args=args, daemon=True).start()
+
+    def _http_cache(self):
+        if self.http_cache is None:
+            self.http_cache = HttpCache()
+            atexit.register(self.http_cache.close)
+        try:
+            self.http_cache.max_bytes = max(1, self.cache_size_var.get()) * 1024 * 1024
+        except tk.TclError:
+            pass
+        return self.http_cache
+
+    def _clear_http_cache(self):
+        self._http_cache().clear()
+        self._update_status("HTTP cache cleared.", bootstyle="info")
+
+    def _request_worker(self, session, kwargs, token, cancel, stream_to_disk, cache=None, recorder=None):
+        body_path = None
+        send = cache.request if cache is not None else (
+            lambda *args: (*perform_request(*args), None))
+        try:
+            if stream_to_disk:
+                fd, body_path = tempfile.mkstemp(prefix="api_response_", suffix=".body")
+                with os.fdopen(fd, "wb") as sink:
+                    progress = lambda received, expected, elapsed: self._post_to_ui(
+                        self._show_download_progress, token, received, expected, elapsed)
+                    response, timing, cache_state = send(session, kwargs, sink, progress, cancel)
+            else:
+                response, timing, cache_state = send(session, kwargs)
+            if recorder is not None and response.request is not None and not cancel.is_set():
+                self._record_interaction(recorder, response, body_path, timing)
+            self._post_to_ui(self._finish_request, token, response, None, timing, body_path, cache_state, kwargs["method"])
+        except Exception as e:
+            # Anything escaping here (a bad Content-Length, a full temp disk, a
+            # cache error) must still re-enable Send and drop the temp body.
+            if body_path and os.path.exists(body_path):
+                os.remove(body_path)
+            self._post_to_ui(self._finish_request, token, None, e)
 
-        request_data = None
-        json_data = None
+    def _record_interaction(self, recorder, response, body_path, timing):
+        try:
+            body = None
+            if body_path:
+                with open(body_path, "rb") as f:
+                    body = f.read()
+            recorder.record(response, body, timing["total_ms"] if timing else None)
+        except OSError as e:
+            self._post_to_ui(self._update_status, f"Could not record to cassette: {e}", bootstyle="warning")
+
+    def _toggle_stub_server(self):
+        if self.stub_server is not None:
+            self.stub_server.stop()
+            self.stub_server = None
+            self.stub_button.config(text="Start Stub Server")
+            self.stub_status_label.config(text="Stub server stopped.")
+            self._update_status("Stub server stopped.", bootstyle="info")
+            return
+        try:
+            self.stub_server = CassetteServer(self.cassette_path_var.get().strip(), self.stub_port_var.get(),
+                                              self.stub_latency_var.get(), self.stub_jitter_var.get())
+        except (OSError, ValueError, KeyError, tk.TclError) as e:
+            messagebox.showerror("Stub Server", f"Could not start the stub server: {e}")
+            return
+        self.stub_server.start()
+        self.stub_button.config(text="Stop Stub Server")
+        self.stub_status_label.config(text=f"Serving {self.stub_server.count} interactions on {self.stub_server.url}")
+        self._update_status(f"Stub server listening on {self.stub_server.url}", bootstyle="success")
+
+    def _point_at_stub(self):
+        if self.stub_server is None:
+            messagebox.showwarning("Stub Server", "Start the stub server first.")
+            return
+        parts = urlsplit(self.url_entry.get())
+        self.url_entry.delete(0, tk.END)
+        self.url_entry.insert(0, self.stub_server.url + parts._replace(scheme="", netloc="").geturl())
+        self._update_status("Request URL now points at the stub server.", bootstyle="info")
 
-        if method in ["POST", "PUT", "PATCH"]:
-            if body_type == "Raw (JSON)":
-                if request_body_raw:
-                    try:
-                        json_data = json.loads(request_body_raw)
-                    except json.JSONDecodeError as e:
-                        messagebox.showerror("JSON Error", f"Invalid JSON in request body: {e}")
-                        self._update_status("Error: Invalid JSON in request body.", bootstyle="danger")
-                        self.send_button.config(state=tk.NORMAL)
-                        return
-                else:
-                    json_data = {}
-            elif body_type == "Form Data (x-www-form-urlencoded)":
-                request_data = request_body_raw
-                if "Content-Type" not in headers:
-                    headers["Content-Type"] = "application/x-www-form-urlencoded"
-            elif body_type == "None":
-                request_data = None
-                json_data = None
-            else:
-                request_data = request_body_raw
-
-        auth_username = self.auth_username_entry.get()
-        auth_password = self.auth_password_entry.get()
-        auth_tuple = (auth_username, auth_password) if auth_username or auth_password else None
-
-        try:
-            timeout_val = self.timeout_var.get()
-            follow_redirects_val = self.follow_redirects_var.get()
-            ssl_verify_val = self.ssl_verify_var.get()
-
-            response = requests.request(
-                method,
-                url,
-                headers=headers, # Headers should be a dictionary
-                # If you want to send headers as a list of tuples, use headers=[('Key', 'Value')]
-                # If you want to send headers as a dictionary, use headers={'Key': 'Value'}
-                params=query_params,
-                json=json_data, # Use json for JSON body, data for form data
-                # If you want to send a raw string body, use data=request_body_raw
-                # If you want to send a file, use files={'file': open('filename', 'rb')}
-                # If you want to send a multipart form data, use files={'file': ('filename', open('filename', 'rb'), 'application/octet-stream')}
-                # If you want to send a file with a specific content type, use files={'file': ('filename', open('filename', 'rb'), 'application/json')}
-                # If you want to send a file with a specific content type, use files={'file': ('filename', open('filename', 'rb'), 'application/x-www-form-urlencoded')}
-                # If you want to send a file with a specific content type, use files={'file': ('filename', open('filename', 'rb'), 'text/plain')}
-                data=request_data, # Use json for JSON body, data for form data
-                # If you want to send a raw string body, use data=request_body_raw
-                # If you want to send a file, use files={'file': open('filename', 'rb')}
-                # If you want to send a multipart form data, use files={'file': ('filename', open('filename', 'rb'), 'application/octet-stream')}
-                # If you want to send a file with a specific content type, use files={'file': ('filename', open('filename', 'rb'), 'application/json')}
-                # If you want to send a file with a specific content type, use files={'file': ('filename', open('filename', 'rb'), 'application/x-www-form-urlencoded')}
-                # If you want to send a file with a specific content type, use files={'file': ('filename', open('filename', 'rb'), 'text/plain')}
-                # If you want to send a file with a specific content type, use files={'file': ('filename', open('filename', 'rb'), 'application/octet-stream')}
-
-                auth=auth_tuple,
-                timeout=timeout_val, # Timeout for the request
-                # If you want to disable timeout, set this to None
-                # If you want to set a custom timeout, set this to a float value (e.g., 5.0 for 5 seconds)
-                # If you want to set a tuple for connect and read timeouts, use (connect_timeout, read_timeout)
-                # e.g., (5.0, 10.0) for 5 seconds
-                # If you want to set a custom timeout for connect and read, use a tuple like (connect_timeout, read_timeout)
-                # e.g., (5.0, 10.0) for 5 seconds
-
-                allow_redirects=follow_redirects_val,
-                verify=ssl_verify_val   # This is the SSL verification setting
-                # If you want to disable SSL verification, set this to False
-
-            )
-
-            self.status_label.config(text=f"{response.status_code} {response.reason}",
-                                     bootstyle="success" if response.ok else "danger")
-            self._update_status(f"Request completed: {response.status_code} {response.reason}",
-                                bootstyle="success" if response.ok else "danger")
-
-            # Set _last_response_json after response is available
-            if 'application/json' in response.headers.get('Content-Type', '').lower():
-                try:
-                    self._last_response_json = response.json()
-                except Exception:
-                    self._last_response_json = None
+    def _show_download_progress(self, token, received, expected, elapsed):
+        if token != self._request_token:
+            return
+        mb = 1024 * 1024
+        total = f" / {expected / mb:.1f} MB" if expected else " MB"
+        self._update_status(f"Downloading {received / mb:.1f}{total} ({received / mb / elapsed:.1f} MB/s)", bootstyle="info")
+
+    def _finish_request(self, token, response, error, timing=None, body_path=None, cache_state=None, method="GET"):
+        if token != self._request_token:
+            if body_path and os.path.exists(body_path):
+                os.remove(body_path)
+            return
+        try:
+            if error is not None:
+                self._show_request_error(error)
             else:
-                self._last_response_json = None
+                suffix = f" ({cache_state})" if cache_state else ""
+                self.status_label.config(text=f"{response.status_code} {response.reason}{suffix}",
+                                         bootstyle="success" if response.ok else "danger")
+                self._update_status(f"Request completed: {response.status_code} {response.reason}{suffix}",
+                                    bootstyle="success" if response.ok else "danger")
+                self._display_response(response, body_path, timing["bytes"] if timing else None)
+                if timing:
+                    self.timing_label.config(text=format_timing(timing))
+                    self._record_timing(method, response.url, timing)
+                elif cache_state == "cached":
+                    self.timing_label.config(text="served from local cache")
+        finally:
+            self.send_button.config(state=tk.NORMAL)
+            self.export_json_button.config(state=tk.NORMAL if self._response_is_json else tk.DISABLED)
+            self.export_csv_button.config(state=tk.NORMAL if self._response_is_json else tk.DISABLED)
 
-            self.response_headers_text.config(state=tk.NORMAL)
-            self.response_headers_text.delete(1.0, tk.END)
-            for key, value in response.headers.items():
-                self.response_headers_text.insert(tk.END, f"{key}: {value}\n")
-            self.response_headers_text.config(state=tk.DISABLED)
+    def _display_response(self, response, body_path=None, size=None):
+        self._discard_response_body()
+        self._clear_json_tree()
+        self._last_response_json = None
+        self._response_is_json = 'application/json' in response.headers.get('Content-Type', '').lower()
+        if self.notebook.select() == str(self.json_tree_tab):
+            self.root.after_idle(self._load_json_tree)
+        if body_path:
+            self._response_body_path = body_path
+            self._response_size = size if size is not None else os.path.getsize(body_path)
+        else:
+            self._response_body = response.content
+            self._response_size = len(self._response_body)
 
-            self.response_body_text.config(state=tk.NORMAL)
-            self.response_body_text.delete(1.0, tk.END)
-            try:
-                if 'application/json' in response.headers.get('Content-Type', '').lower():
-                    pretty_json = json.dumps(response.json(), indent=2)
-                    self.response_body_text.insert(tk.END, pretty_json)
-                else:
-                    self.response_body_text.insert(tk.END, response.text)
-            except json.JSONDecodeError:
+        self.response_headers_text.config(state=tk.NORMAL)
+        self.response_headers_text.delete(1.0, tk.END)
+        for key, value in response.headers.items():
+            self.response_headers_text.insert(tk.END, f"{key}: {value}\n")
+        self.response_headers_text.config(state=tk.DISABLED)
+
+        if self._response_size > INLINE_BODY_LIMIT:
+            # Large bodies are shown a page at a time instead of being laid
+            # out in the text widget in one go.
+            self._show_body_page(0)
+            return
+
+        self.preview_label.config(text="")
+        self.prev_page_button.config(state=tk.DISABLED)
+        self.next_page_button.config(state=tk.DISABLED)
+        self.response_body_text.config(state=tk.NORMAL)
+        self.response_body_text.delete(1.0, tk.END)
+        parsed = self._response_json()
+        if parsed is not None:
+            self.response_body_text.insert(tk.END, json.dumps(parsed, indent=2))
+        else:
+            if body_path:
+                with open(body_path, "rb") as f:
+                    self.response_body_text.insert(tk.END, f.read().decode("utf-8", errors="replace"))
+            else:
                 self.response_body_text.insert(tk.END, response.text)
-            self.response_body_text.config(state=tk.DISABLED)
+        self.response_body_text.config(state=tk.DISABLED)
 
-        except requests.exceptions.Timeout:
+    def _show_request_error(self, error):
+        if isinstance(error, requests.exceptions.Timeout):
             messagebox.showerror("Request Error", "The request timed out.")
             self._update_status("Error: Request timed out.", bootstyle="danger")
             self.status_label.config(text="Timeout Error", bootstyle="danger")
-        except requests.exceptions.ConnectionError:
+        elif isinstance(error, requests.exceptions.ConnectionError):
             messagebox.showerror("Request Error", "Could not connect to the server. Check URL or internet connection.")
             self._update_status("Error: Connection failed.", bootstyle="danger")
             self.status_label.config(text="Connection Error", bootstyle="danger")
-        except requests.exceptions.HTTPError as e:
-            messagebox.showerror("HTTP Error", f"HTTP error occurred: {e}")
-            self._update_status(f"Error: HTTP {e.response.status_code}", bootstyle="danger")
-            self.status_label.config(text=f"HTTP Error: {e.response.status_code}", bootstyle="danger")
-            if e.response:
-                self.response_headers_text.config(state=tk.NORMAL)
-                self.response_headers_text.delete(1.0, tk.END)
-                for key, value in e.response.headers.items():
-                    self.response_headers_text.insert(tk.END, f"{key}: {value}\n")
-                self.response_headers_text.config(state=tk.DISABLED)
-
-                self.response_body_text.config(state=tk.NORMAL)
-                self.response_body_text.delete(1.0, tk.END)
-                try:
-                    if 'application/json' in e.response.headers.get('Content-Type', '').lower():
-                        pretty_json = json.dumps(e.response.json(), indent=2)
-                        self.response_body_text.insert(tk.END, pretty_json)
-                    else:
-                        self.response_body_text.insert(tk.END, e.response.text)
-                except json.JSONDecodeError:
-                    self.response_body_text.insert(tk.END, e.response.text)
-                self.response_body_text.config(state=tk.DISABLED)
-
-        except requests.exceptions.RequestException as e:
-            messagebox.showerror("Request Error", f"An unexpected error occurred: {e}")
+        elif isinstance(error, requests.exceptions.HTTPError) and error.response is not None:
+            messagebox.showerror("HTTP Error", f"HTTP error occurred: {error}")
+            self._update_status(f"Error: HTTP {error.response.status_code}", bootstyle="danger")
+            self.status_label.config(text=f"HTTP Error: {error.response.status_code}", bootstyle="danger")
+            self._display_response(error.response)
+        else:
+            messagebox.showerror("Request Error", f"An unexpected error occurred: {error}")
             self._update_status("Error: An unexpected request error occurred.", bootstyle="danger")
             self.status_label.config(text="Request Error", bootstyle="danger")
-        finally:
-            self.send_button.config(state=tk.NORMAL)
-            self.export_json_button.config(state=tk.NORMAL if self._last_response_json else tk.DISABLED)
-            self.export_csv_button.config(state=tk.NORMAL if self._last_response_json else tk.DISABLED)
+
+    def _runner_jobs(self):
+        source = self.runner_source_combobox.get()
+        if source == "Current request":
+            requests_data = [self._current_request_data()]
+        else:
+            if source == "Selected saved requests":
+                request_ids = self._selected_request_ids()
+            else:
+                # "All" follows the History tab's current search/folder/tag filter.
+                request_ids = self.request_store.ids(**self._history_filter())
+            requests_data = [self.request_store.get(i) for i in request_ids]
+        if not requests_data:
+            raise ValueError("No saved requests selected.")
+
+        prepared = []
+        for req_data in requests_data:
+            prepared.append((f"{req_data.get('method', 'GET')} {req_data.get('url', '')}", self._build_kwargs(req_data)))
+        iterations = max(1, self.runner_iterations_var.get())
+        return [job for _ in range(iterations) for job in prepared]
+
+    def _choose_runner_data(self):
+        path = filedialog.askopenfilename(filetypes=[("Data files", "*.csv *.jsonl *.ndjson"), ("All files", "*.*")])
+        if path:
+            self.runner_data_var.set(path)
+
+    def start_batch_run(self):
+        try:
+            if self.runner_source_combobox.get().startswith("Current request"):
+                template = self._current_request_data()
+            else:
+                selected_ids = self._selected_request_ids()
+                if not selected_ids:
+                    raise ValueError("Select a saved request on the History tab to use as the template.")
+                template = self.request_store.get(selected_ids[0])
+            data_path = self.runner_data_var.get().strip()
+            results_path = self.runner_results_var.get().strip()
+            if not os.path.isfile(data_path) or not results_path:
+                raise ValueError("Choose an existing data file and a results file.")
+            concurrency = self.runner_concurrency_var.get()
+            retries = max(0, self.runner_retries_var.get())
+        except (ValueError, tk.TclError) as e:
+            messagebox.showerror("Runner", str(e))
+            self._update_status(f"Runner error: {e}", bootstyle="danger")
+            return
+
+        timeout, redirects, verify = self.timeout_var.get(), self.follow_redirects_var.get(), self.ssl_verify_var.get()
+        self.runner_results_tree.delete(*self.runner_results_tree.get_children())
+        self._runner_latencies = []
+        self._runner_errors = 0
+        self._runner_total = "?"
+        self.runner_start_button.config(state=tk.DISABLED)
+        self.runner_stop_button.config(state=tk.NORMAL)
+        self.runner = BatchRun(
+            template, data_path, results_path,
+            build_kwargs=lambda req_data: build_request_kwargs(req_data, timeout, redirects, verify),
+            concurrency=concurrency,
+            retries=retries,
+            on_result=lambda result: self._post_to_ui(self._add_runner_result, result),
+            on_done=lambda summary: self._post_to_ui(self._finish_batch_run, summary),
+            session=self._session(verify, concurrency),
+        )
+        self.runner.start()
+        self._update_status(f"Batch run started from {os.path.basename(data_path)}, concurrency {concurrency}.", bootstyle="info")
+
+    def _finish_batch_run(self, summary):
+        self.runner_start_button.config(state=tk.NORMAL)
+        self.runner_stop_button.config(state=tk.DISABLED)
+        latency = summary["latency_ms"]
+        text = (f"{summary['rows']} rows in {summary['duration_sec']:.2f}s ({summary['rows_per_sec']} rows/s): "
+                f"{summary['succeeded']} ok, {summary['failed']} failed, {summary['retries']} retries "
+                f"on {summary['retried_rows']} rows | statuses {summary['statuses']}")
+        if latency:
+            text += f" | p50 {latency['p50_ms']:.1f} / p99 {latency['p99_ms']:.1f} ms"
+        self.runner_summary_label.config(text=text)
+        if summary["error"]:
+            self._update_status(f"Batch run failed: {summary['error']}", bootstyle="danger")
+        else:
+            self._update_status(f"Batch run {'stopped' if summary['stopped'] else 'finished'}; results in {summary['results_file']}",
+                                bootstyle="warning" if summary["stopped"] or summary["failed"] else "success")
+
+    def start_runner(self):
+        if self.runner_source_combobox.get().endswith("data file"):
+            self.start_batch_run()
+            return
+        try:
+            jobs = self._runner_jobs()
+            concurrency = self.runner_concurrency_var.get()
+        except (ValueError, tk.TclError) as e:
+            messagebox.showerror("Runner", str(e))
+            self._update_status(f"Runner error: {e}", bootstyle="danger")
+            return
+
+        self.runner_results_tree.delete(*self.runner_results_tree.get_children())
+        self._runner_latencies = []
+        self._runner_errors = 0
+        self._runner_total = len(jobs)
+        self.runner_start_button.config(state=tk.DISABLED)
+        self.runner_stop_button.config(state=tk.NORMAL)
+        self.runner = RequestRunner(
+            concurrency,
+            on_result=lambda result: self._post_to_ui(self._add_runner_result, result),
+            on_done=lambda elapsed, stopped: self._post_to_ui(self._finish_runner, elapsed, stopped),
+            session=self._session(self.ssl_verify_var.get(), concurrency),
+        )
+        self.runner.start(jobs)
+        self._update_status(f"Runner started: {len(jobs)} requests, concurrency {concurrency}.", bootstyle="info")
+
+    def stop_runner(self):
+        if self.runner:
+            self.runner.stop()
+            self._update_status("Stopping runner...", bootstyle="warning")
+
+    def _add_runner_result(self, result):
+        self._runner_latencies.append(result["latency_ms"])
+        if result["error"] or result["status"] >= 400:
+            self._runner_errors += 1
+        self.runner_results_tree.insert("", tk.END, values=(
+            result.get("index", result.get("row")), result["label"], result["status"] or result["error"],
+            f"{result['latency_ms']:.1f}", result["bytes"]))
+        children = self.runner_results_tree.get_children()
+        if len(children) > RUNNER_TREE_LIMIT:
+            # Only the most recent rows stay in the table; batch runs keep
+            # the full record in their results file.
+            self.runner_results_tree.delete(*children[:len(children) - RUNNER_TREE_LIMIT])
+        self.runner_summary_label.config(
+            text=f"{len(self._runner_latencies)}/{self._runner_total} done, {self._runner_errors} errors")
+
+    def _finish_runner(self, elapsed, stopped):
+        self.runner_start_button.config(state=tk.NORMAL)
+        self.runner_stop_button.config(state=tk.DISABLED)
+        latencies = sorted(self._runner_latencies)
+        if latencies:
+            summary = (f"{len(latencies)} requests in {elapsed:.2f}s ({len(latencies) / elapsed:.1f} req/s), "
+                       f"{self._runner_errors} errors | latency ms min {latencies[0]:.1f} / "
+                       f"avg {sum(latencies) / len(latencies):.1f} / p50 {latencies[len(latencies) // 2]:.1f} / "
+                       f"max {latencies[-1]:.1f}")
+        else:
+            summary = "No requests completed."
+        self.runner_summary_label.config(text=summary)
+        self._update_status("Runner stopped." if stopped else "Runner finished.",
+                            bootstyle="warning" if stopped else "success")
+
+    def start_load_test(self):
+        try:
+            kwargs = self._build_kwargs(self._current_request_data())
+            target = self.load_target_var.get()
+            duration = self.load_duration_var.get()
+            warmup = self.load_warmup_var.get()
+        except (ValueError, tk.TclError) as e:
+            messagebox.showerror("Load Test", str(e))
+            self._update_status(f"Load test error: {e}", bootstyle="danger")
+            return
+        if target < 1 or duration <= 0 or warmup < 0:
+            messagebox.showerror("Load Test", "Target must be at least 1 and duration greater than zero.")
+            return
+
+        mode = "concurrency" if self.load_mode_combobox.get() == "Fixed concurrency" else "rps"
+        self.load_test_results = None
+        self.load_chart.delete("all")
+        self.load_start_button.config(state=tk.DISABLED)
+        self.load_stop_button.config(state=tk.NORMAL)
+        self.load_export_json_button.config(state=tk.DISABLED)
+        self.load_export_csv_button.config(state=tk.DISABLED)
+        self.load_stats_label.config(text=f"Warming up for {warmup:g}s...")
+        self.load_test = LoadTest(
+            kwargs, mode, target, duration, warmup,
+            on_tick=lambda point, summary: self._post_to_ui(self._update_load_test, point, summary),
+            on_done=lambda summary, timeline: self._post_to_ui(self._finish_load_test, summary, timeline),
+            session=self._session(kwargs["verify"], target if mode == "concurrency" else 256),
+        )
+        self.load_test.start()
+        self._update_status(f"Load test running against {kwargs['url']}", bootstyle="info")
+
+    def stop_load_test(self):
+        if self.load_test:
+            self.load_test.stop()
+            self._update_status("Stopping load test...", bootstyle="warning")
+
+    def _format_load_stats(self, summary, point=None):
+        text = (f"total {summary['count']}  {summary['throughput_rps']:.1f} req/s  "
+                f"errors {summary['error_rate'] * 100:.1f}%\n"
+                f"p50 {summary['p50_ms']:.1f}  p90 {summary['p90_ms']:.1f}  "
+                f"p99 {summary['p99_ms']:.1f}  max {summary['max_ms']:.1f} ms")
+        if point:
+            text += f"\nlast second: {point['rps']} req, p99 {point['p99_ms']:.1f} ms, {point['errors']} errors"
+        return text
+
+    def _update_load_test(self, point, summary):
+        self.load_stats_label.config(text=self._format_load_stats(summary, point))
+        self._draw_load_chart(self.load_test.timeline)
+
+    def _draw_load_chart(self, timeline):
+        canvas = self.load_chart
+        canvas.delete("all")
+        if len(timeline) < 2:
+            return
+        width = max(canvas.winfo_width(), 100)
+        height = max(canvas.winfo_height(), 100)
+        pad = 30
+        series = (("rps", "req/s", "#4caf50"), ("p99_ms", "p99 ms", "#ff9800"), ("error_rate", "error rate", "#f44336"))
+        for i, (key, label, color) in enumerate(series):
+            values = [point[key] for point in timeline]
+            top = max(values) or 1
+            coords = []
+            for n, value in enumerate(values):
+                coords.append(pad + n * (width - 2 * pad) / (len(values) - 1))
+                coords.append(height - pad - value / top * (height - 2 * pad))
+            canvas.create_line(*coords, fill=color, width=2)
+            canvas.create_text(pad + i * 130, 12, text=f"{label} (max {top:.3g})", fill=color, anchor="w")
+        canvas.create_line(pad, height - pad, width - pad, height - pad, fill="#888888")
+        canvas.create_text(width - pad, height - pad + 12, text=f"{timeline[-1]['second']:.0f}s", fill="#888888", anchor="e")
+
+    def _finish_load_test(self, summary, timeline):
+        self.load_test_results = {"summary": summary, "timeline": timeline}
+        self.load_stats_label.config(text=self._format_load_stats(summary))
+        self._draw_load_chart(timeline)
+        self.load_start_button.config(state=tk.NORMAL)
+        self.load_stop_button.config(state=tk.DISABLED)
+        self.load_export_json_button.config(state=tk.NORMAL)
+        self.load_export_csv_button.config(state=tk.NORMAL)
+        self._update_status("Load test finished.", bootstyle="success")
+
+    def _export_load_test(self, fmt):
+        if not self.load_test_results:
+            return
+        path = filedialog.asksaveasfilename(defaultextension=f".{fmt}", initialfile=f"load_test.{fmt}",
+                                            filetypes=[(fmt.upper(), f"*.{fmt}")])
+        if not path:
+            return
+        try:
+            with open(path, "w", newline="") as f:
+                if fmt == "json":
+                    json.dump(self.load_test_results, f, indent=4)
+                else:
+                    timeline = self.load_test_results["timeline"]
+                    writer = csv.DictWriter(f, fieldnames=list(timeline[0]) if timeline else ["second"])
+                    writer.writeheader()
+                    writer.writerows(timeline)
+            self._update_status(f"Load test exported to {path}", bootstyle="success")
+        except Exception as e:
+            messagebox.showerror("Export Error", f"Failed to export load test: {e}")
+            self._update_status(f"Failed to export load test: {e}", bootstyle="danger")
+
+    def _record_timing(self, method, url, timing):
+        # Keyed on the request that was sent: responses rebuilt by the cache
+        # after a 304 have no PreparedRequest attached.
+        parts = urlsplit(url)
+        endpoint = f"{method} {parts.scheme}://{parts.netloc}{parts.path}"
+        history = self.timing_history.setdefault(endpoint, deque(maxlen=TIMING_HISTORY))
+        history.append(timing_phases(timing))
+        self.timing_endpoint_combobox.config(values=sorted(self.timing_history))
+        self.timing_endpoint_combobox.set(endpoint)
+        self._draw_timing_panel()
+
+    def _draw_timing_panel(self):
+        history = list(self.timing_history.get(self.timing_endpoint_combobox.get(), ()))
+        self.timing_tree.delete(*self.timing_tree.get_children())
+        if not history:
+            return
+        fmt = lambda value: "-" if value is None else f"{value:.1f} ms"
+        last = history[-1]
+        rows = [(key, label) for key, label, _ in TIMING_PHASES]
+        rows += [("total_ms", "Total"), ("bytes", "Bytes"), ("wire_bytes", "Bytes on the wire")]
+        for key, label in rows:
+            values = sorted(t[key] for t in history if t.get(key) is not None)
+            median = values[len(values) // 2] if values else None
+            if key in ("bytes", "wire_bytes"):
+                self.timing_tree.insert("", tk.END, values=(label, last.get(key, "-"), median if median is not None else "-"))
+            else:
+                self.timing_tree.insert("", tk.END, values=(label, fmt(last.get(key)), fmt(median)))
+
+        # Stacked bar per call: where each request's time went, oldest left.
+        canvas = self.timing_chart
+        canvas.delete("all")
+        width = max(canvas.winfo_width(), 100)
+        height = max(canvas.winfo_height(), 100)
+        pad = 30
+        top = max(t["total_ms"] for t in history) or 1
+        slot = (width - 2 * pad) / TIMING_HISTORY
+        for n, timing in enumerate(history):
+            x = pad + n * slot
+            y = height - pad
+            for key, label, color in TIMING_PHASES:
+                segment = (timing.get(key) or 0) / top * (height - 2 * pad)
+                if segment > 0:
+                    canvas.create_rectangle(x, y - segment, x + max(slot - 2, 1), y, fill=color, outline="")
+                    y -= segment
+        for i, (key, label, color) in enumerate(TIMING_PHASES):
+            canvas.create_text(pad + (i % 3) * 140, 10 + (i // 3) * 14, text=label, fill=color, anchor="w")
+        canvas.create_line(pad, height - pad, width - pad, height - pad, fill="#888888")
+        canvas.create_text(pad, height - pad + 12, text=f"max {top:.1f} ms", fill="#888888", anchor="w")
+
+    def _apply_pagination_preset(self, event):
+        preset = PAGINATION_PRESETS.get(self.bulk_preset_combobox.get())
+        if not preset:
+            return
+        self.method_combobox.set("GET")
+        self.url_entry.delete(0, tk.END)
+        self.url_entry.insert(0, preset["url"])
+        self.query_params_text.delete(1.0, tk.END)
+        self.query_params_text.insert(tk.END, preset["query_params"])
+        self.headers_text.delete(1.0, tk.END)
+        self.headers_text.insert(tk.END, preset["headers"])
+        self.body_type_combobox.set("None")
+        self.bulk_scheme_combobox.set(preset["scheme"])
+        self.bulk_records_path_var.set(preset["records_path"])
+        self.bulk_position_param_var.set(preset["position_param"])
+        self.bulk_limit_param_var.set(preset["limit_param"])
+        self.bulk_start_var.set(preset["start"])
+        self.bulk_page_size_var.set(preset["page_size"])
+        self._update_status("Preset loaded; enter credentials on the Request tab.", bootstyle="info")
+
+    def _choose_bulk_output(self):
+        path = filedialog.asksaveasfilename(defaultextension=".jsonl",
+                                            filetypes=[("JSON Lines", "*.jsonl"), ("CSV files", "*.csv")])
+        if path:
+            self.bulk_output_var.set(path)
+
+    def start_bulk_fetch(self):
+        try:
+            kwargs = self._build_kwargs(self._current_request_data())
+            page_size = self.bulk_page_size_var.get()
+            concurrency = self.bulk_concurrency_var.get()
+            start = self.bulk_start_var.get()
+        except (ValueError, tk.TclError) as e:
+            messagebox.showerror("Bulk Fetch", str(e))
+            self._update_status(f"Bulk fetch error: {e}", bootstyle="danger")
+            return
+        output_path = self.bulk_output_var.get().strip()
+        scheme = PAGINATION_SCHEMES[self.bulk_scheme_combobox.get()]
+        if page_size < 1 or concurrency < 1 or not output_path:
+            messagebox.showerror("Bulk Fetch", "Page size and concurrency must be at least 1 and an output file is required.")
+            return
+        if scheme == "cursor" and not self.bulk_cursor_path_var.get().strip():
+            messagebox.showerror("Bulk Fetch", "Cursor pagination needs the JSONPath of the next cursor.")
+            return
+
+        self.bulk_fetch = PaginatedFetch(
+            kwargs, scheme, output_path,
+            records_path=self.bulk_records_path_var.get().strip(),
+            page_size=page_size,
+            position_param=self.bulk_position_param_var.get().strip(),
+            limit_param=self.bulk_limit_param_var.get().strip(),
+            start=start,
+            cursor_path=self.bulk_cursor_path_var.get().strip(),
+            total_path=self.bulk_total_path_var.get().strip(),
+            concurrency=concurrency,
+            on_progress=lambda pages, records, elapsed: self._post_to_ui(self._update_bulk_fetch, pages, records, elapsed),
+            on_done=lambda summary, error: self._post_to_ui(self._finish_bulk_fetch, summary, error),
+            session=self._session(kwargs["verify"], concurrency),
+        )
+        resume = os.path.exists(self.bulk_fetch.checkpoint_path) and messagebox.askyesno(
+            "Bulk Fetch", f"An unfinished fetch into {output_path} was found. Resume it?")
+        self.bulk_start_button.config(state=tk.DISABLED)
+        self.bulk_stop_button.config(state=tk.NORMAL)
+        self.bulk_stats_label.config(text="Resuming..." if resume else "Starting...")
+        self.bulk_fetch.start(resume)
+        self._update_status(f"Fetching pages from {kwargs['url']}", bootstyle="info")
+
+    def stop_bulk_fetch(self):
+        if self.bulk_fetch:
+            self.bulk_fetch.stop()
+            self._update_status("Stopping bulk fetch after in-flight pages...", bootstyle="warning")
+
+    def _update_bulk_fetch(self, pages, records, elapsed):
+        rate = records / elapsed if elapsed > 0 else 0.0
+        self.bulk_stats_label.config(text=f"{pages} pages | {records} records | {rate:.0f} records/s | {elapsed:.1f}s")
+
+    def _finish_bulk_fetch(self, summary, error):
+        self.bulk_start_button.config(state=tk.NORMAL)
+        self.bulk_stop_button.config(state=tk.DISABLED)
+        self.bulk_stats_label.config(text=(f"{summary['pages']} pages | {summary['records']} records | "
+                                           f"{summary['records_per_sec']} records/s | {summary['duration_sec']}s"))
+        if error is not None:
+            self._update_status(f"Bulk fetch failed: {error} (start again to resume)", bootstyle="danger")
+        elif summary["complete"]:
+            self._update_status(f"Fetched {summary['records']} records into {summary['output']}", bootstyle="success")
+        else:
+            self._update_status("Bulk fetch stopped; start again to resume.", bootstyle="warning")
+
+    def _clear_json_tree(self):
+        self.json_tree.delete(*self.json_tree.get_children())
+        self._json_tree_nodes = {}
+        self._json_tree_loaded = False
+
+    def _on_tab_changed(self, event):
+        if self.notebook.select() == str(self.json_tree_tab) and not self._json_tree_loaded:
+            self._load_json_tree()
+
+    def _load_json_tree(self):
+        if not self._response_is_json:
+            self._update_status("No JSON response to show.", bootstyle="warning")
+            return
+        self._json_tree_loaded = True
+        if self._last_response_json is not None:
+            self._populate_json_roots([("$", self._last_response_json)])
+            return
+        self._update_status("Parsing JSON response...", bootstyle="info")
+        token = self._request_token
+        body_path, body = self._response_body_path, self._response_body
+
+        # The worker only parses into a local; response state is touched in
+        # _finish_json_parse, after the token shows it is still current.
+        def parse():
+            try:
+                parsed, error = parse_response_body(body_path, body), None
+            except (OSError, ValueError) as e:
+                parsed, error = None, e
+            self._post_to_ui(self._finish_json_parse, token, parsed, error)
+
+        threading.Thread(target=parse, daemon=True).start()
+
+    def _finish_json_parse(self, token, parsed, error=None):
+        if token != self._request_token:
+            return
+        if error is not None or parsed is None:
+            if isinstance(error, ValueError):
+                self._response_is_json = False
+            self._update_status("Response body is not valid JSON.", bootstyle="warning")
+            return
+        self._last_response_json = parsed
+        self._populate_json_roots([("$", parsed)])
+        self._update_status("JSON tree ready.", bootstyle="success")
+
+    def _populate_json_roots(self, items):
+        self.json_tree.delete(*self.json_tree.get_children())
+        self._json_tree_nodes = {}
+        for path, value in items:
+            self._insert_json_node("", path, value)
+        roots = self.json_tree.get_children()
+        if len(roots) == 1:
+            self.json_tree.item(roots[0], open=True)
+            self._expand_json_node(roots[0])
+
+    def _insert_json_node(self, parent, label, value):
+        kind, summary = json_summary(value)
+        iid = self.json_tree.insert(parent, tk.END, text=label, values=(kind, summary))
+        if isinstance(value, (dict, list)) and value:
+            # Placeholder child so the node shows an expander; real children
+            # are created only when the node is opened.
+            self.json_tree.insert(iid, tk.END, text="…")
+            self._json_tree_nodes[iid] = (value, 0)
+        return iid
+
+    def _on_json_tree_open(self, event):
+        iid = self.json_tree.focus()
+        if not iid:
+            return
+        parent = self.json_tree.parent(iid)
+        if iid in self._json_tree_nodes:
+            self._expand_json_node(iid)
+        elif parent in self._json_tree_nodes and self.json_tree.item(iid, "text") == "… more":
+            self.json_tree.delete(iid)
+            self._expand_json_node(parent, append=True)
+
+    def _expand_json_node(self, iid, append=False):
+        value, loaded = self._json_tree_nodes[iid]
+        if loaded and not append:
+            return
+        if not loaded:
+            self.json_tree.delete(*self.json_tree.get_children(iid))
+        end = min(len(value), loaded + JSON_TREE_PAGE)
+        if isinstance(value, dict):
+            for key in itertools.islice(value, loaded, end):
+                self._insert_json_node(iid, str(key), value[key])
+        else:
+            for index in range(loaded, end):
+                self._insert_json_node(iid, f"[{index}]", value[index])
+        if end < len(value):
+            self.json_tree.insert(iid, tk.END, text="… more", values=("", f"{len(value) - end} remaining"))
+        self._json_tree_nodes[iid] = (value, end)
+
+    def _apply_json_filter(self):
+        parsed = self._last_response_json
+        if parsed is None:
+            self._update_status("Open the JSON tree first to parse the response.", bootstyle="warning")
+            return
+        try:
+            matches = json_path_query(parsed, self.json_filter_entry.get())
+        except ValueError as e:
+            messagebox.showerror("JSONPath Error", str(e))
+            return
+        self._populate_json_roots(matches)
+        self._update_status(f"{len(matches)} JSONPath matches.", bootstyle="info")
+
+    def _reset_json_filter(self):
+        self.json_filter_entry.delete(0, tk.END)
+        self.json_filter_entry.insert(0, "$")
+        if self._last_response_json is not None:
+            self._populate_json_roots([("$", self._last_response_json)])
 
 if __name__ == "__main__":
     style = Style(theme="superhero")
@@ -1,17 +1,28 @@
 import asyncio
 import httpx
+import json
+import os
 import pandas as pd
+import random
 import time
+import queue
+import sqlite3
 import threading
 import logging
+from collections import deque
+from email.utils import parsedate_to_datetime
 from pathlib import Path
 from config import API_KEY
 import ttkbootstrap as ttk
 from ttkbootstrap.constants import *
-from tkinter import filedialog, END
+from tkinter import filedialog, messagebox, END
 
 logging.basicConfig(level=logging.INFO)
 
+PROGRESS_INTERVAL = 0.5
+CHECKPOINT_INTERVAL = 5.0
+RETRY_STATUSES = {429, 500, 502, 503, 504}
+
 class FreightRateChecker:
     def __init__(self, api_key=API_KEY):
         self.api_key = api_key
@@ -35,18 +46,224 @@ class FreightRateChecker:
             else:
                 return {"success": False}
 
+class TokenBucket:
+    # Tokens refill continuously at `rate` per second up to `burst`. Waiters
+    # queue on the lock, so requests go out one by one at exactly the rate
+    # once the initial burst is spent.
+    def __init__(self, rate, burst=1):
+        self.rate = rate
+        self.burst = max(1, burst)
+        self.tokens = float(self.burst)
+        self.updated = time.monotonic()
+        self.lock = asyncio.Lock()
+
+    def _refill(self):
+        now = time.monotonic()
+        self.tokens = min(self.burst, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+
+    async def acquire(self, tokens=1):
+        async with self.lock:
+            self._refill()
+            if self.tokens < tokens:
+                await asyncio.sleep((tokens - self.tokens) / self.rate)
+                self._refill()
+            self.tokens -= tokens
+
+def retry_after_seconds(response):
+    value = response.headers.get("Retry-After") if response is not None else None
+    if not value:
+        return None
+    if value.strip().isdigit():
+        return int(value)
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
+
+def is_transient(error):
+    if isinstance(error, httpx.HTTPStatusError):
+        return error.response.status_code in RETRY_STATUSES
+    return isinstance(error, httpx.TransportError)
+
+def is_item_error(error):
+    # Failures one bad item in a batch can cause. Throttling, server and
+    # network errors or rejected credentials would fail every half as well.
+    if isinstance(error, httpx.HTTPStatusError):
+        status = error.response.status_code
+        return 400 <= status < 500 and status not in (401, 403, 407, 429)
+    return isinstance(error, (ValueError, KeyError, TypeError))
+
+class Checkpoint:
+    # Completed lookups are appended to a JSON-lines file next to the output
+    # and flushed every CHECKPOINT_INTERVAL seconds, so an interrupted run can
+    # pick up where it stopped. Errors are not recorded and get retried.
+    def __init__(self, output_path):
+        self.path = Path(str(output_path) + ".checkpoint.jsonl")
+        self.pending = []
+        self.flushed = time.monotonic()
+
+    def exists(self):
+        return self.path.exists()
+
+    def load(self):
+        found = {}
+        if not self.path.exists():
+            return found
+        with open(self.path, "r", encoding="utf-8") as f:
+            for line in f:
+                try:
+                    result = json.loads(line)
+                except ValueError:
+                    # A crash mid-write can leave a torn last line.
+                    continue
+                found[(result["SKU"], result["PostCode"])] = result
+        return found
+
+    def add(self, result):
+        if result["Status"] in ("OK", "Not Found"):
+            self.pending.append(result)
+        if time.monotonic() - self.flushed >= CHECKPOINT_INTERVAL:
+            self.flush()
+
+    def flush(self):
+        self.flushed = time.monotonic()
+        if not self.pending:
+            return
+        with open(self.path, "a", encoding="utf-8") as f:
+            for result in self.pending:
+                f.write(json.dumps(result) + "\n")
+            f.flush()
+            os.fsync(f.fileno())
+        self.pending = []
+
+    def remove(self):
+        self.pending = []
+        self.path.unlink(missing_ok=True)
+
+class RateCache:
+    # Persistent (productCode, postCode) -> result cache. Only definite
+    # answers (OK / Not Found) are stored; errors are always retried.
+    def __init__(self, db_path="freight_rate_cache.db", ttl_hours=24):
+        self.ttl = ttl_hours * 3600
+        self.conn = sqlite3.connect(db_path, check_same_thread=False)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("""
+            CREATE TABLE IF NOT EXISTS rates (
+                product_code TEXT, post_code TEXT, rate REAL, status TEXT, fetched REAL,
+                PRIMARY KEY (product_code, post_code))""")
+        self.conn.commit()
+
+    def lookup(self, keys):
+        found = {}
+        cutoff = time.time() - self.ttl
+        for product_code, post_code in keys:
+            row = self.conn.execute(
+                "SELECT rate, status FROM rates WHERE product_code = ? AND post_code = ? AND fetched >= ?",
+                (product_code, post_code, cutoff)).fetchone()
+            if row:
+                found[(product_code, post_code)] = {"SKU": product_code, "PostCode": post_code,
+                                                    "Rate": row[0], "Status": row[1]}
+        return found
+
+    def put(self, result):
+        if result["Status"] not in ("OK", "Not Found"):
+            return
+        self.conn.execute("INSERT OR REPLACE INTO rates VALUES (?, ?, ?, ?, ?)",
+                          (result["SKU"], result["PostCode"], result["Rate"], result["Status"], time.time()))
+        self.conn.commit()
+
+    def clear(self):
+        self.conn.execute("DELETE FROM rates")
+        self.conn.commit()
+
+    def close(self):
+        self.conn.close()
+
+class ThroughputStats:
+    def __init__(self, total, window=10.0):
+        self.total = total
+        self.window = window
+        self.started = time.monotonic()
+        self.done = 0
+        self.requests = 0
+        self.status_counts = {"OK": 0, "Not Found": 0, "Error": 0}
+        self.cache_hits = 0
+        self.cache_misses = 0
+        self.duplicates = 0
+        self.split_batches = 0
+        self.retries = 0
+        self.resumed = 0
+        self.keys_pending = 0
+        self.keys_fetched = 0
+        self._recent = deque()
+
+    def record_request(self):
+        self.requests += 1
+        self._recent.append(time.monotonic())
+
+    def record_row(self, status):
+        self.done += 1
+        key = "Error" if status.startswith("Error") else status
+        self.status_counts[key] = self.status_counts.get(key, 0) + 1
+
+    def snapshot(self):
+        now = time.monotonic()
+        while self._recent and now - self._recent[0] > self.window:
+            self._recent.popleft()
+        elapsed = now - self.started
+        rows_per_sec = self.done / elapsed if elapsed > 0 else 0.0
+        # ETA counts only the lookups still waiting on the API; cached and
+        # duplicate rows complete instantly and would skew a per-row rate.
+        keys_per_sec = self.keys_fetched / elapsed if elapsed > 0 else 0.0
+        remaining = self.keys_pending - self.keys_fetched
+        return {
+            "done": self.done,
+            "total": self.total,
+            "requests": self.requests,
+            "elapsed_sec": round(elapsed, 1),
+            "rows_per_sec": round(rows_per_sec, 2),
+            "current_rps": round(len(self._recent) / min(self.window, elapsed), 2) if elapsed > 0 else 0.0,
+            "eta_sec": round(remaining / keys_per_sec) if keys_per_sec > 0 else (0 if remaining <= 0 else None),
+            "cache_hits": self.cache_hits,
+            "cache_misses": self.cache_misses,
+            "duplicates": self.duplicates,
+            "split_batches": self.split_batches,
+            "retries": self.retries,
+            "resumed": self.resumed,
+            **self.status_counts,
+        }
+
+def format_stats(stats):
+    eta = f"{stats['eta_sec']}s" if stats["eta_sec"] is not None else "-"
+    return (f"{stats['done']}/{stats['total']} rows | {stats['requests']} requests, {stats['retries']} retries, {stats['split_batches']} batches split | "
+            f"{stats['current_rps']} req/s now, {stats['rows_per_sec']} rows/s overall | "
+            f"OK {stats['OK']} / Not Found {stats['Not Found']} / Error {stats['Error']} | "
+            f"cache {stats['cache_hits']} hits / {stats['cache_misses']} misses, {stats['duplicates']} duplicate rows, {stats['resumed']} resumed | "
+            f"{stats['elapsed_sec']}s elapsed, ETA {eta}")
+
 class FreightRateBulkChecker:
-    def __init__(self, api_key=API_KEY, rate_limit_per_minute=100):
+    def __init__(self, api_key=API_KEY, rate_limit_per_minute=100, burst=1, workers=10, cache_ttl_hours=24, batch_size=1,
+                 max_retries=3, backoff=1.0, max_backoff=60.0):
         self.api_key = api_key
         self.url = "https://api.digital.messagepool.com/soh/dropship"
         self.headers = {
             "Content-Type": "application/json",
             "api-key": self.api_key
         }
-        self.rate_limit = asyncio.Semaphore(rate_limit_per_minute)
-        self.last_reset = time.time()
-        self.calls_made = 0
         self.rate_limit_per_minute = rate_limit_per_minute
+        self.burst = burst
+        self.workers = workers
+        self.cache_ttl_hours = cache_ttl_hours
+        self.batch_size = max(1, batch_size)
+        self.max_retries = max_retries
+        self.backoff = backoff
+        self.max_backoff = max_backoff
+        self.cache = None
+        self.checkpoint = None
+        self.bucket = None
+        self.stats = None
+        self._last_report = 0.0
 
     def create_excel_template(self, save_path="freight_rate_template.xlsx"):
         df = pd.DataFrame(columns=["SKU", "PostCode"])
@@ -54,58 +271,158 @@ class FreightRateBulkChecker:
         return Path(save_path).absolute()
 
     async def _check_one(self, client, sku, post_code):
-        await self._enforce_rate_limit()
-        payload = [{"productCode": sku, "postCode": post_code}]
-        try:
-            response = await client.post(self.url, json=payload, headers=self.headers, timeout=10)
-            response.raise_for_status()
-            data = response.json()
-            if data[0]['deliveryPossible']:
-                return {
-                    "SKU": sku,
-                    "PostCode": post_code,
-                    "Rate": data[0]['deliveryRate'],
-                    "Status": "OK"
-                }
-            else:
-                return {
-                    "SKU": sku,
-                    "PostCode": post_code,
-                    "Rate": None,
-                    "Status": "Not Found"
-                }
-        except Exception as e:
+        results = await self._check_batch(client, [(sku, post_code)])
+        return results[(sku, post_code)]
+
+    def _row_result(self, sku, post_code, item):
+        if item['deliveryPossible']:
+            return {
+                "SKU": sku,
+                "PostCode": post_code,
+                "Rate": item['deliveryRate'],
+                "Status": "OK"
+            }
+        else:
             return {
                 "SKU": sku,
                 "PostCode": post_code,
                 "Rate": None,
-                "Status": f"Error: {str(e)}"
+                "Status": "Not Found"
             }
 
-    async def _enforce_rate_limit(self):
-        async with self.rate_limit:
-            now = time.time()
-            if now - self.last_reset >= 60:
-                self.calls_made = 0
-                self.last_reset = now
-            elif self.calls_made >= self.rate_limit_per_minute:
-                sleep_time = 60 - (now - self.last_reset)
-                await asyncio.sleep(sleep_time)
-                self.calls_made = 0
-                self.last_reset = time.time()
-            self.calls_made += 1
-
-    async def run_bulk_check(self, excel_path, output_path="freight_rate_results.xlsx"):
+    async def _post_batch(self, client, keys):
+        await self.bucket.acquire()
+        self.stats.record_request()
+        payload = [{"productCode": sku, "postCode": post_code} for sku, post_code in keys]
+        response = await client.post(self.url, json=payload, headers=self.headers, timeout=10)
+        response.raise_for_status()
+        data = response.json()
+        if not isinstance(data, list) or len(data) != len(keys):
+            raise ValueError(f"Expected {len(keys)} results, got {len(data) if isinstance(data, list) else 'a non-list'}")
+        # Items are matched back by code when the response echoes them,
+        # otherwise by position.
+        by_key = {(str(item.get("productCode")), str(item.get("postCode"))): item
+                  for item in data if isinstance(item, dict)}
+        items = [by_key[key] for key in keys] if all(key in by_key for key in keys) else data
+        return {key: self._row_result(*key, item) for key, item in zip(keys, items)}
+
+    async def _post_with_retry(self, client, keys):
+        # Connection errors, timeouts and 429/5xx responses are retried with
+        # exponential backoff (full jitter), preferring the server's
+        # Retry-After. Anything else, or running out of retries, raises.
+        for attempt in range(self.max_retries + 1):
+            try:
+                return await self._post_batch(client, keys)
+            except Exception as e:
+                if attempt == self.max_retries or not is_transient(e):
+                    raise
+                response = e.response if isinstance(e, httpx.HTTPStatusError) else None
+                delay = retry_after_seconds(response)
+                if delay is None:
+                    delay = random.uniform(0, self.backoff * 2 ** attempt)
+                self.stats.retries += 1
+                await asyncio.sleep(min(delay, self.max_backoff))
+
+    async def _check_batch(self, client, keys):
+        try:
+            return await self._post_with_retry(client, keys)
+        except Exception as e:
+            if len(keys) == 1 or not is_item_error(e):
+                return {(sku, post_code): {
+                    "SKU": sku,
+                    "PostCode": post_code,
+                    "Rate": None,
+                    "Status": f"Error: {str(e)}"
+                } for sku, post_code in keys}
+            # One bad item fails the whole request, so split the batch and
+            # retry the halves until the failing items are isolated.
+            self.stats.split_batches += 1
+            middle = len(keys) // 2
+            first, second = await asyncio.gather(self._check_batch(client, keys[:middle]),
+                                                 self._check_batch(client, keys[middle:]))
+            return {**first, **second}
+
+    def _fill(self, results, indices, result):
+        for index in indices:
+            results[index] = dict(result)
+            self.stats.record_row(result["Status"])
+
+    async def _worker(self, client, jobs, results, key_rows, on_progress):
+        while True:
+            batch = []
+            while len(batch) < self.batch_size:
+                try:
+                    batch.append(jobs.get_nowait())
+                except asyncio.QueueEmpty:
+                    break
+            if not batch:
+                return
+            for key, result in (await self._check_batch(client, batch)).items():
+                if self.cache:
+                    self.cache.put(result)
+                self.checkpoint.add(result)
+                self.stats.keys_fetched += 1
+                self._fill(results, key_rows[key], result)
+            self._report(on_progress)
+
+    def _report(self, on_progress, force=False):
+        now = time.monotonic()
+        if on_progress and (force or now - self._last_report >= PROGRESS_INTERVAL):
+            self._last_report = now
+            on_progress(self.stats.snapshot())
+
+    def _open_cache(self):
+        if self.cache_ttl_hours <= 0:
+            return None
+        if self.cache is None:
+            self.cache = RateCache(ttl_hours=self.cache_ttl_hours)
+        self.cache.ttl = self.cache_ttl_hours * 3600
+        return self.cache
+
+    async def run_bulk_check(self, excel_path, output_path="freight_rate_results.xlsx", on_progress=None, resume=True):
         df = pd.read_excel(excel_path)
-        tasks = []
-        async with httpx.AsyncClient(verify=False) as client:
-            for _, row in df.iterrows():
-                sku = str(row["SKU"]).strip()
-                post_code = str(row["PostCode"]).strip()
-                tasks.append(self._check_one(client, sku, post_code))
-            results = await asyncio.gather(*tasks)
+        # Rows repeating a (SKU, PostCode) pair share one lookup.
+        key_rows = {}
+        for index, row in enumerate(df.itertuples(index=False)):
+            key_rows.setdefault((str(row.SKU).strip(), str(row.PostCode).strip()), []).append(index)
+        results = [None] * len(df)
+        self.stats = ThroughputStats(len(df))
+        self.stats.duplicates = len(df) - len(key_rows)
+
+        self.checkpoint = Checkpoint(output_path)
+        if not resume:
+            self.checkpoint.remove()
+        resumed = {key: result for key, result in self.checkpoint.load().items() if key in key_rows}
+        for key, result in resumed.items():
+            self._fill(results, key_rows[key], result)
+        self.stats.resumed = len(resumed)
+
+        cache = self._open_cache()
+        cached = cache.lookup(key for key in key_rows if key not in resumed) if cache else {}
+        for key, result in cached.items():
+            self._fill(results, key_rows[key], result)
+        self.stats.cache_hits = len(cached)
+        self.stats.cache_misses = len(key_rows) - len(resumed) - len(cached)
+
+        jobs = asyncio.Queue()
+        for key in key_rows:
+            if key not in cached and key not in resumed:
+                jobs.put_nowait(key)
+        self.stats.keys_pending = jobs.qsize()
+        self.bucket = TokenBucket(self.rate_limit_per_minute / 60, self.burst)
+        self._report(on_progress, force=True)
+        # A fixed pool of workers pulls lookups off the queue; the token
+        # bucket, not the pool size, sets the request rate.
+        limits = httpx.Limits(max_connections=self.workers, max_keepalive_connections=self.workers)
+        try:
+            async with httpx.AsyncClient(verify=False, limits=limits) as client:
+                await asyncio.gather(*(self._worker(client, jobs, results, key_rows, on_progress) for _ in range(self.workers)))
+        finally:
+            self.checkpoint.flush()
+        self._report(on_progress, force=True)
         results_df = pd.DataFrame(results)
         results_df.to_excel(output_path, index=False)
+        self.checkpoint.remove()
         return Path(output_path).absolute()
 
 class FreightRateCheckerUI:
@@ -115,10 +432,18 @@ class FreightRateCheckerUI:
         self.checker = FreightRateChecker()
         self.bulk_checker = FreightRateBulkChecker()
         self.bulk_input_path = None
+        self.ui_queue = queue.Queue()
 
         self.product_code_var = ttk.StringVar()
         self.post_code_var = ttk.StringVar()
         self.result_var = ttk.StringVar(value="Result will appear here...")
+        self.rate_limit_var = ttk.IntVar(value=self.bulk_checker.rate_limit_per_minute)
+        self.burst_var = ttk.IntVar(value=self.bulk_checker.burst)
+        self.workers_var = ttk.IntVar(value=self.bulk_checker.workers)
+        self.cache_ttl_var = ttk.DoubleVar(value=self.bulk_checker.cache_ttl_hours)
+        self.batch_size_var = ttk.IntVar(value=self.bulk_checker.batch_size)
+        self.max_retries_var = ttk.IntVar(value=self.bulk_checker.max_retries)
+        self.stats_var = ttk.StringVar(value="Idle")
 
         container = ttk.Frame(self.root, padding=20)
         container.pack(fill=BOTH, expand=True)
@@ -141,40 +466,81 @@ class FreightRateCheckerUI:
         bulk.pack(fill=X, pady=10)
 
         ttk.Button(bulk, text="⬇ Download Template", command=self.download_template, bootstyle=INFO).grid(row=0, column=0, padx=5, pady=5)
-        ttk.Button(bulk, text="📤 Upload and Run", command=self.upload_and_run_bulk, bootstyle=WARNING).grid(row=0, column=1, padx=5, pady=5)
+        self.run_button = ttk.Button(bulk, text="📤 Upload and Run", command=self.upload_and_run_bulk, bootstyle=WARNING)
+        self.run_button.grid(row=0, column=1, padx=5, pady=5)
+
+        ttk.Label(bulk, text="Requests / minute").grid(row=1, column=0, sticky=W, pady=5)
+        ttk.Entry(bulk, textvariable=self.rate_limit_var, width=10).grid(row=1, column=1, sticky=W, pady=5)
+        ttk.Label(bulk, text="Burst").grid(row=2, column=0, sticky=W, pady=5)
+        ttk.Entry(bulk, textvariable=self.burst_var, width=10).grid(row=2, column=1, sticky=W, pady=5)
+        ttk.Label(bulk, text="Workers").grid(row=3, column=0, sticky=W, pady=5)
+        ttk.Entry(bulk, textvariable=self.workers_var, width=10).grid(row=3, column=1, sticky=W, pady=5)
+
+        ttk.Label(bulk, text="Cache TTL (hours, 0 = off)").grid(row=4, column=0, sticky=W, pady=5)
+        ttk.Entry(bulk, textvariable=self.cache_ttl_var, width=10).grid(row=4, column=1, sticky=W, pady=5)
+        ttk.Button(bulk, text="Clear Cache", command=self.clear_cache, bootstyle=(SECONDARY, OUTLINE)).grid(row=4, column=2, padx=5, pady=5)
+
+        ttk.Label(bulk, text="Items per request").grid(row=5, column=0, sticky=W, pady=5)
+        ttk.Entry(bulk, textvariable=self.batch_size_var, width=10).grid(row=5, column=1, sticky=W, pady=5)
+
+        ttk.Label(bulk, text="Retries (429 / 5xx / network)").grid(row=6, column=0, sticky=W, pady=5)
+        ttk.Entry(bulk, textvariable=self.max_retries_var, width=10).grid(row=6, column=1, sticky=W, pady=5)
+
+        ttk.Label(bulk, textvariable=self.stats_var, wraplength=400).grid(row=7, column=0, columnspan=3, sticky=W, pady=5)
 
         self.log_output = ttk.ScrolledText(container, height=12, wrap="word")
         self.log_output.pack(fill=BOTH, expand=True, pady=(10, 0))
 
-    def log(self, msg):
+        self.root.after(100, self.process_ui_queue)
+
+    def process_ui_queue(self):
+        try:
+            while True:
+                task, args, kwargs = self.ui_queue.get_nowait()
+                task(*args, **kwargs)
+        except queue.Empty:
+            pass
+        finally:
+            self.root.after(100, self.process_ui_queue)
+
+    def _log(self, msg):
         self.log_output.insert(END, msg + '\n')
         self.log_output.see(END)
 
+    def log(self, msg):
+        self.ui_queue.put((self._log, [msg], {}))
+
+    def show_stats(self, stats):
+        self.ui_queue.put((self.stats_var.set, [format_stats(stats)], {}))
+
     def run_async_check(self):
-        threading.Thread(target=self._run_async_check_wrapper, daemon=True).start()
+        args = (self.product_code_var.get().strip(), self.post_code_var.get().strip())
+        threading.Thread(target=self._run_async_check_wrapper, args=args, daemon=True).start()
 
-    def _run_async_check_wrapper(self):
-        asyncio.run(self._fetch_rate())
+    def _run_async_check_wrapper(self, product_code, post_code):
+        asyncio.run(self._fetch_rate(product_code, post_code))
 
-    async def _fetch_rate(self):
-        product_code = self.product_code_var.get().strip()
-        post_code = self.post_code_var.get().strip()
+    async def _fetch_rate(self, product_code, post_code):
         if not product_code or not post_code:
             self.log("⚠️ Please enter both SKU and Post Code.")
             return
         try:
             result = await self.checker.check_freight_rates(product_code, post_code)
             if result["success"]:
-                self.result_label.configure(bootstyle=SUCCESS)
-                self.result_var.set(f"✅ Rate: ${result['rate']}")
+                self.ui_queue.put((self.result_label.configure, [], {"bootstyle": SUCCESS}))
+                self.ui_queue.put((self.result_var.set, [f"✅ Rate: ${result['rate']}"], {}))
                 self.log(f"✅ {product_code} → {post_code} = ${result['rate']}")
             else:
-                self.result_label.configure(bootstyle=DANGER)
-                self.result_var.set("❌ Not found.")
+                self.ui_queue.put((self.result_label.configure, [], {"bootstyle": DANGER}))
+                self.ui_queue.put((self.result_var.set, ["❌ Not found."], {}))
                 self.log(f"❌ No rate found for {product_code} to {post_code}.")
         except Exception as e:
             self.log(f"❌ API Error: {e}")
 
+    def clear_cache(self):
+        (self.bulk_checker.cache or RateCache()).clear()
+        self.log("🧹 Freight rate cache cleared.")
+
     def download_template(self):
         path = filedialog.asksaveasfilename(defaultextension=".xlsx", title="Save Template As", initialfile="freight_rate_template.xlsx")
         if path:
@@ -190,15 +556,36 @@ class FreightRateCheckerUI:
         if not out_path:
             self.log("⚠️ No output file specified.")
             return
-        threading.Thread(target=lambda: asyncio.run(self._run_bulk(in_path, out_path)), daemon=True).start()
+        try:
+            self.bulk_checker.rate_limit_per_minute = max(1, self.rate_limit_var.get())
+            self.bulk_checker.burst = max(1, self.burst_var.get())
+            self.bulk_checker.workers = max(1, self.workers_var.get())
+            self.bulk_checker.cache_ttl_hours = max(0.0, self.cache_ttl_var.get())
+            self.bulk_checker.batch_size = max(1, self.batch_size_var.get())
+            self.bulk_checker.max_retries = max(0, self.max_retries_var.get())
+        except Exception:
+            self.log("⚠️ Rate limit, burst, workers, batch size and retries must be whole numbers and the cache TTL a number.")
+            return
+        resume = True
+        if Checkpoint(out_path).exists():
+            resume = messagebox.askyesno("Resume", "An interrupted run was found for this output file.\nResume it and skip the rows already checked?")
+        # Run state (stats, token bucket, checkpoint) lives on the shared
+        # bulk checker, so only one bulk run may be active at a time.
+        self.run_button.configure(state=DISABLED)
+        threading.Thread(target=lambda: asyncio.run(self._run_bulk(in_path, out_path, resume)), daemon=True).start()
 
-    async def _run_bulk(self, in_path, out_path):
+    async def _run_bulk(self, in_path, out_path, resume=True):
         try:
             self.log(f"⏳ Processing file: {in_path}")
-            result = await self.bulk_checker.run_bulk_check(in_path, out_path)
+            result = await self.bulk_checker.run_bulk_check(in_path, out_path, on_progress=self.show_stats, resume=resume)
             self.log(f"✅ Results saved to: {result}")
+            self.log(f"📊 {format_stats(self.bulk_checker.stats.snapshot())}")
         except Exception as e:
             self.log(f"❌ Bulk check failed: {e}")
+            if self.bulk_checker.checkpoint and self.bulk_checker.checkpoint.exists():
+                self.log(f"💾 Progress kept in {self.bulk_checker.checkpoint.path}; run again to resume.")
+        finally:
+            self.ui_queue.put((self.run_button.configure, [], {"state": NORMAL}))
 
 if __name__ == "__main__":
     app = ttk.Window(themename="cyborg")
@@ -1,49 +1,536 @@
 import os
+import json
+import mmap
+import socket
+import fnmatch
+import time
+import random
+import queue
 import psutil
 import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
 import logging
 from tkinter import messagebox, filedialog
 import ttkbootstrap as ttk
 from ttkbootstrap.constants import *
 
+try:
+    from cryptography.hazmat.primitives.ciphers import Cipher, algorithms, modes
+except ImportError:
+    Cipher = None
+
 logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s")
 
-def secure_delete(file_path, passes=3):
+WIPE_BUFFER_SIZE = 4 * 1024 * 1024
+PROGRESS_INTERVAL = 0.25
+RANDOM = None
+
+SINGLE_PATTERNS = {
+    "random": RANDOM,
+    "zeros": b"\x00",
+    "ones": b"\xff",
+}
+STANDARD_SCHEMES = {
+    "dod": (b"\x00", b"\xff", RANDOM),
+    "dod-ece": (b"\x00", b"\xff", RANDOM, RANDOM, b"\x00", b"\xff", RANDOM),
+}
+WIPE_SCHEMES = list(SINGLE_PATTERNS) + list(STANDARD_SCHEMES)
+
+def wipe_passes(scheme="random", passes=3):
+    if scheme in STANDARD_SCHEMES:
+        return STANDARD_SCHEMES[scheme]
+    return (SINGLE_PATTERNS[scheme],) * passes
+
+class Keystream:
+    # Overwrite data only needs to be unpredictable, not secret, so one
+    # urandom seed per pass drives a user-space generator: AES-CTR when the
+    # cryptography package is available, otherwise the Mersenne Twister.
+    def __init__(self):
+        seed = os.urandom(32)
+        if Cipher is not None:
+            cipher = Cipher(algorithms.AES(seed), modes.CTR(os.urandom(16)))
+            self._encryptor = cipher.encryptor()
+            self._zeros = memoryview(bytes(WIPE_BUFFER_SIZE))
+        else:
+            self._encryptor = None
+            self._rng = random.Random(seed)
+
+    def fill(self, view, n):
+        if self._encryptor is not None:
+            self._encryptor.update_into(self._zeros[:n], view)
+        else:
+            view[:n] = self._rng.randbytes(n)
+
+def overwrite_file(file_path, pass_patterns, progress=None):
+    st = os.stat(file_path)
+    file_size = st.st_size
+    total = file_size * len(pass_patterns)
+    written = 0
+    started = last_report = time.monotonic()
+    # Anonymous mmap gives a page-aligned buffer that is reused for every write;
+    # the extra page is headroom required by the cipher's update_into().
+    buf = mmap.mmap(-1, WIPE_BUFFER_SIZE + mmap.PAGESIZE)
+    view = memoryview(buf)
+    try:
+        with open(file_path, "r+b", buffering=0) as f:
+            for pattern in pass_patterns:
+                keystream = Keystream() if pattern is RANDOM else None
+                if pattern is not RANDOM:
+                    buf.seek(0)
+                    buf.write(pattern * WIPE_BUFFER_SIZE)
+                f.seek(0)
+                remaining = file_size
+                while remaining:
+                    n = min(remaining, WIPE_BUFFER_SIZE)
+                    if keystream is not None:
+                        keystream.fill(view, n)
+                    f.write(view[:n])
+                    remaining -= n
+                    written += n
+                    now = time.monotonic()
+                    if progress and now - last_report >= PROGRESS_INTERVAL:
+                        last_report = now
+                        progress(written, total, written / (now - started))
+                os.fsync(f.fileno())
+    finally:
+        view.release()
+        buf.close()
+    duration = time.monotonic() - started
+    if progress:
+        progress(written, total, written / duration if duration else 0.0)
+    return {
+        "path": file_path,
+        "size": file_size,
+        "passes": len(pass_patterns),
+        "bytes_written": written,
+        "duration_sec": duration,
+        "device": st.st_dev,
+    }
+
+class WipeAuditLog:
+    # Append-only JSON lines, one record per deletion, safe to share between
+    # worker threads.
+    def __init__(self, log_file="secure_delete_audit.jsonl"):
+        self.log_file = log_file
+        self.host = socket.gethostname()
+        self._lock = threading.Lock()
+
+    def record(self, path, size, passes, scheme, bytes_written, duration_sec, device=None, status="ok", error=""):
+        entry = {
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "host": self.host,
+            "device": device,
+            "path": path,
+            "size": size,
+            "passes": passes,
+            "scheme": scheme,
+            "bytes_written": bytes_written,
+            "duration_sec": round(duration_sec, 4),
+            "mb_s": round(bytes_written / (1024 * 1024) / duration_sec, 2) if duration_sec and bytes_written else None,
+            "status": status,
+            "error": error,
+        }
+        line = json.dumps(entry)
+        with self._lock, open(self.log_file, "a", encoding="utf-8") as f:
+            f.write(line + "\n")
+
+    def summary(self):
+        groups = {}
+        if not os.path.exists(self.log_file):
+            return groups
+        with open(self.log_file, encoding="utf-8") as f:
+            for line in f:
+                try:
+                    entry = json.loads(line)
+                except json.JSONDecodeError:
+                    continue
+                g = groups.setdefault((entry["host"], entry["device"]), {
+                    "wipes": 0, "failed": 0, "bytes_written": 0, "duration_sec": 0.0, "slowest_mb_s": None})
+                if entry["status"] != "ok":
+                    g["failed"] += 1
+                    continue
+                g["wipes"] += 1
+                if entry["mb_s"] is not None:
+                    g["bytes_written"] += entry["bytes_written"]
+                    g["duration_sec"] += entry["duration_sec"]
+                    g["slowest_mb_s"] = min(entry["mb_s"], g["slowest_mb_s"] or entry["mb_s"])
+        return groups
+
+def secure_delete(file_path, passes=3, scheme="random", progress=None, audit=None):
     if os.path.exists(file_path):
         try:
-            file_size = os.path.getsize(file_path)
-            with open(file_path, "wb") as f:
-                for _ in range(passes):
-                    f.write(os.urandom(file_size))
-                    f.flush()
-                    os.fsync(f.fileno())
+            stats = overwrite_file(file_path, wipe_passes(scheme, passes), progress)
             os.remove(file_path)
             logging.info(f"Securely deleted: {file_path}")
         except Exception as e:
             logging.error(f"Secure delete failed: {e}")
+            if audit:
+                audit.record(file_path, None, 0, scheme, 0, 0, status="failed", error=str(e))
+            return None
+        # The file is already gone; a failing audit write must not turn a
+        # completed wipe into a reported failure.
+        if audit:
+            try:
+                audit.record(scheme=scheme, **stats)
+            except OSError as e:
+                logging.error(f"Could not write audit entry for {file_path}: {e}")
+        return stats
     else:
         logging.warning(f"File not found: {file_path}")
 
-def terminate_related_processes(file_path):
-    for proc in psutil.process_iter(["pid", "name"]):
+def plain_delete(file_path, audit=None):
+    st = os.stat(file_path)
+    started = time.monotonic()
+    os.remove(file_path)
+    if audit:
         try:
-            for f in proc.open_files():
-                if f.path == file_path:
-                    proc.terminate()
-                    proc.wait()
-        except (psutil.AccessDenied, psutil.NoSuchProcess):
+            audit.record(file_path, st.st_size, 0, "none", 0, time.monotonic() - started, st.st_dev)
+        except OSError as e:
+            logging.error(f"Could not write audit entry for {file_path}: {e}")
+    return st.st_size
+
+class OpenFileIndex:
+    # One scan of the process table maps open paths to pids, so a batch of
+    # deletions does a dictionary lookup per file instead of a full scan.
+    def __init__(self):
+        self._index = {}
+        self.refresh()
+
+    @staticmethod
+    def _key(path):
+        return os.path.normcase(os.path.realpath(path))
+
+    def refresh(self):
+        index = {}
+        if os.path.isdir("/proc/self/fd"):
+            self._scan_proc(index)
+        else:
+            self._scan_psutil(index)
+        for pids in index.values():
+            pids.discard(os.getpid())
+        self._index = index
+
+    def _scan_proc(self, index):
+        for pid in os.listdir("/proc"):
+            if not pid.isdigit():
+                continue
+            fd_dir = f"/proc/{pid}/fd"
+            try:
+                fds = os.listdir(fd_dir)
+            except OSError:
+                continue
+            for fd in fds:
+                try:
+                    target = os.readlink(f"{fd_dir}/{fd}")
+                except OSError:
+                    continue
+                if target.startswith("/"):
+                    index.setdefault(target, set()).add(int(pid))
+
+    def _scan_psutil(self, index):
+        for proc in psutil.process_iter(["pid"]):
+            try:
+                for f in proc.open_files():
+                    index.setdefault(self._key(f.path), set()).add(proc.pid)
+            except (psutil.AccessDenied, psutil.NoSuchProcess):
+                pass
+
+    def pids_for(self, file_path):
+        return self._index.get(self._key(file_path), set())
+
+def terminate_related_processes(file_path, index=None):
+    if index is None:
+        index = OpenFileIndex()
+    for pid in index.pids_for(file_path):
+        try:
+            proc = psutil.Process(pid)
+            proc.terminate()
+            proc.wait(timeout=5)
+        except (psutil.AccessDenied, psutil.NoSuchProcess, psutil.TimeoutExpired):
             pass
 
+def default_shred_workers(path):
+    # Spinning disks thrash under parallel writes; SSDs and network storage
+    # benefit from several requests in flight.
+    workers = min(8, os.cpu_count() or 1)
+    try:
+        dev = os.stat(path).st_dev
+        block = f"/sys/dev/block/{os.major(dev)}:{os.minor(dev)}"
+        for rotational in (f"{block}/queue/rotational", f"{block}/../queue/rotational"):
+            if os.path.exists(rotational):
+                with open(rotational) as f:
+                    if f.read().strip() == "1":
+                        return 2
+                break
+    except (OSError, AttributeError):
+        pass
+    return workers
+
+def shred_file(file_path, secure=True, passes=3, scheme="random", index=None, audit=None):
+    terminate_related_processes(file_path, index)
+    if secure:
+        stats = secure_delete(file_path, passes, scheme, audit=audit)
+        if stats is None:
+            raise OSError(f"Secure delete failed: {file_path}")
+        return stats["size"]
+    return plain_delete(file_path, audit)
+
+class RetentionPolicy:
+    # Decides which files a cleanup may remove from one scandir walk whose
+    # DirEntry stat results are reused for every rule. Without an age or
+    # quota limit every file matching the globs is selected.
+    def __init__(self, max_age_days=0, quota_bytes=0, include=("*",), exclude=()):
+        self.max_age_days = max_age_days
+        self.quota_bytes = quota_bytes
+        self.include = tuple(include) or ("*",)
+        self.exclude = tuple(exclude)
+
+    @staticmethod
+    def _matches(patterns, name, rel):
+        return any(fnmatch.fnmatch(name, p) or fnmatch.fnmatch(rel, p) for p in patterns)
+
+    def scan(self, folder):
+        stack = [folder]
+        while stack:
+            current = stack.pop()
+            try:
+                with os.scandir(current) as it:
+                    for entry in it:
+                        try:
+                            if entry.is_dir(follow_symlinks=False):
+                                stack.append(entry.path)
+                            elif entry.is_file(follow_symlinks=False):
+                                st = entry.stat(follow_symlinks=False)
+                                rel = os.path.relpath(entry.path, folder).replace(os.sep, "/")
+                                yield entry.path, entry.name, rel, st.st_size, st.st_mtime
+                        except OSError:
+                            continue
+            except OSError as e:
+                logging.warning(f"Cannot scan {current}: {e}")
+
+    def plan(self, folder, now=None):
+        now = now or time.time()
+        total_bytes = scanned = 0
+        eligible = []
+        for path, name, rel, size, mtime in self.scan(folder):
+            scanned += 1
+            total_bytes += size
+            if self._matches(self.include, name, rel) and not self._matches(self.exclude, name, rel):
+                eligible.append((path, size, mtime))
+
+        selected = []
+        if not self.max_age_days and not self.quota_bytes:
+            selected = [(path, size, "no retention limit") for path, size, _ in eligible]
+        else:
+            if self.max_age_days:
+                cutoff = now - self.max_age_days * 86400
+                selected = [(path, size, f"older than {self.max_age_days} days")
+                            for path, size, mtime in eligible if mtime < cutoff]
+            remaining = total_bytes - sum(size for _, size, _ in selected)
+            if self.quota_bytes and remaining > self.quota_bytes:
+                aged = {path for path, _, _ in selected}
+                for path, size, _ in sorted(eligible, key=lambda e: e[1], reverse=True):
+                    if remaining <= self.quota_bytes:
+                        break
+                    if path not in aged:
+                        selected.append((path, size, "over quota (largest first)"))
+                        remaining -= size
+
+        return {
+            "selected": selected,
+            "scanned": scanned,
+            "total_bytes": total_bytes,
+            "remaining_bytes": total_bytes - sum(size for _, size, _ in selected),
+        }
+
+def format_retention_report(folder, plan):
+    mb = 1024 * 1024
+    lines = [
+        f"Dry run for {folder}",
+        f"Scanned {plan['scanned']} files ({plan['total_bytes'] / mb:.1f} MB)",
+        f"Would delete {len(plan['selected'])} files, leaving {plan['remaining_bytes'] / mb:.1f} MB",
+        "",
+    ]
+    lines.extend(f"{size / mb:10.2f} MB  {reason:<28} {path}" for path, size, reason in plan["selected"])
+    return "\n".join(lines)
+
+def shred_folder(folder, secure=True, passes=3, scheme="random", workers=None, progress=None, policy=None,
+                 audit=None):
+    started = time.monotonic()
+    links = []
+    if policy is None:
+        files = []
+        for dirpath, _, filenames in os.walk(folder):
+            for name in filenames:
+                path = os.path.join(dirpath, name)
+                # Overwriting through a link would destroy its target, which
+                # may live outside the folder; only the link itself goes.
+                (links if os.path.islink(path) else files).append(path)
+    else:
+        files = [path for path, _, _ in policy.plan(folder)["selected"]]
+
+    workers = workers or default_shred_workers(folder)
+    index = OpenFileIndex()
+    done = failed = total_bytes = 0
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        futures = {pool.submit(shred_file, fp, secure, passes, scheme, index, audit): fp for fp in files}
+        for future in as_completed(futures):
+            done += 1
+            try:
+                total_bytes += future.result()
+            except Exception as e:
+                failed += 1
+                logging.error(f"Failed to delete {futures[future]}: {e}")
+            if progress:
+                progress(done, len(files), total_bytes)
+
+    for path in links:
+        try:
+            os.remove(path)
+        except OSError as e:
+            failed += 1
+            logging.error(f"Failed to remove link {path}: {e}")
+
+    dirs_removed = 0
+    for dirpath, _, _ in os.walk(folder, topdown=False):
+        if os.path.normpath(dirpath) == os.path.normpath(folder):
+            continue
+        try:
+            os.rmdir(dirpath)
+            dirs_removed += 1
+        except OSError:
+            pass
+
+    return {
+        "files": len(files) + len(links) - failed,
+        "failed": failed,
+        "bytes": total_bytes,
+        "dirs_removed": dirs_removed,
+        "duration_sec": time.monotonic() - started,
+    }
+
+FIXED_RATE = "fixed-rate"
+FIXED_DELAY = "fixed-delay"
+
+class CleanupJob:
+    def __init__(self, folder, interval, mode, action):
+        self.folder = folder
+        self.interval = interval
+        self.mode = mode
+        self.action = action
+        self.next_run = time.monotonic() + interval
+        self.running = False
+        self.cancelled = False
+        self.runs = 0
+        self.skipped = 0
+
+class CleanupScheduler:
+    # A single dispatcher thread owns the timetable. Fixed-rate jobs are due
+    # every `interval` seconds from their first slot, so run time does not
+    # cause drift; fixed-delay jobs wait `interval` after each run finishes.
+    # A job that is still running when it comes due again is skipped.
+    def __init__(self, on_skip=None):
+        self.on_skip = on_skip
+        self._jobs = {}
+        self._cond = threading.Condition()
+        self._thread = None
+        self._stopped = True
+
+    def add(self, folder, interval, mode, action):
+        with self._cond:
+            if folder in self._jobs:
+                self._jobs[folder].cancelled = True
+            job = CleanupJob(folder, interval, mode, action)
+            self._jobs[folder] = job
+            self._cond.notify()
+        return job
+
+    def remove(self, folder):
+        with self._cond:
+            job = self._jobs.pop(folder, None)
+            if job:
+                job.cancelled = True
+            self._cond.notify()
+
+    def jobs(self):
+        with self._cond:
+            return list(self._jobs.values())
+
+    def start(self):
+        with self._cond:
+            # Cleared first: a dispatcher stopped but not yet woken re-checks
+            # the flag under this lock and simply keeps running.
+            self._stopped = False
+            if self._thread and self._thread.is_alive():
+                return
+            self._thread = threading.Thread(target=self._loop, daemon=True)
+            self._thread.start()
+
+    def stop(self):
+        with self._cond:
+            self._stopped = True
+            for job in self._jobs.values():
+                job.cancelled = True
+            self._jobs.clear()
+            self._cond.notify()
+
+    def _loop(self):
+        with self._cond:
+            while not self._stopped:
+                now = time.monotonic()
+                for job in list(self._jobs.values()):
+                    if job.next_run is not None and job.next_run <= now:
+                        self._dispatch(job, now)
+                pending = [job.next_run for job in self._jobs.values() if job.next_run is not None]
+                self._cond.wait(max(0.0, min(pending) - time.monotonic()) if pending else None)
+
+    def _dispatch(self, job, now):
+        if job.mode == FIXED_RATE:
+            while job.next_run <= now:
+                job.next_run += job.interval
+        else:
+            job.next_run = None
+        if job.running:
+            job.skipped += 1
+            if self.on_skip:
+                self.on_skip(job)
+            return
+        job.running = True
+        threading.Thread(target=self._run, args=(job,), daemon=True).start()
+
+    def _run(self, job):
+        try:
+            job.action(job.folder)
+        except Exception as e:
+            logging.error(f"Scheduled cleanup of {job.folder} failed: {e}")
+        finally:
+            with self._cond:
+                job.running = False
+                job.runs += 1
+                if job.mode == FIXED_DELAY and not job.cancelled:
+                    job.next_run = time.monotonic() + job.interval
+                self._cond.notify()
+
 class DeleteManagerApp:
     def __init__(self, root):
         self.root = root
         self.root.title("Secure File & Folder Deletion")
-        self.root.geometry("600x500")
+        self.root.geometry("700x700")
         self.path = None
         self.secure = ttk.BooleanVar(value=True)
         self.interval = ttk.IntVar(value=10)
-        self.task = None
+        self.scheme = ttk.StringVar(value="random")
+        self.passes = ttk.IntVar(value=3)
+        self.schedule_mode = ttk.StringVar(value=FIXED_RATE)
+        self.max_age_days = ttk.DoubleVar(value=0)
+        self.quota_mb = ttk.DoubleVar(value=0)
+        self.include_globs = ttk.StringVar(value="*")
+        self.exclude_globs = ttk.StringVar(value="")
+        self.scheduler = CleanupScheduler(on_skip=self.on_job_skipped)
+        self.ui_queue = queue.Queue()
+        self.audit = WipeAuditLog()
         self.build_ui()
+        self.root.after(100, self.process_ui_queue)
 
     def build_ui(self):
         frame = ttk.Frame(self.root, padding=20)
@@ -60,10 +547,32 @@ class DeleteManagerApp:
 
         ttk.Checkbutton(frame, text="Enable Secure Delete", variable=self.secure).pack(pady=10)
 
+        wipe_frame = ttk.Frame(frame)
+        wipe_frame.pack(pady=5)
+        ttk.Label(wipe_frame, text="Wipe Scheme:").pack(side=ttk.LEFT, padx=5)
+        ttk.Combobox(wipe_frame, textvariable=self.scheme, values=WIPE_SCHEMES, state="readonly", width=10).pack(side=ttk.LEFT)
+        ttk.Label(wipe_frame, text="Passes:").pack(side=ttk.LEFT, padx=5)
+        ttk.Spinbox(wipe_frame, textvariable=self.passes, from_=1, to=35, width=5).pack(side=ttk.LEFT)
+
+        retention_frame = ttk.Labelframe(frame, text="Retention Policy (0 = no limit)", padding=10)
+        retention_frame.pack(fill=ttk.X, pady=5)
+        ttk.Label(retention_frame, text="Older than (days):").grid(row=0, column=0, sticky=W, padx=5)
+        ttk.Entry(retention_frame, textvariable=self.max_age_days, width=8).grid(row=0, column=1, sticky=W)
+        ttk.Label(retention_frame, text="Quota (MB):").grid(row=0, column=2, sticky=W, padx=5)
+        ttk.Entry(retention_frame, textvariable=self.quota_mb, width=8).grid(row=0, column=3, sticky=W)
+        ttk.Button(retention_frame, text="Dry Run", command=self.dry_run, bootstyle="info-outline").grid(row=0, column=4, padx=10)
+        ttk.Label(retention_frame, text="Include globs:").grid(row=1, column=0, sticky=W, padx=5, pady=5)
+        ttk.Entry(retention_frame, textvariable=self.include_globs, width=20).grid(row=1, column=1, sticky=W)
+        ttk.Label(retention_frame, text="Exclude globs:").grid(row=1, column=2, sticky=W, padx=5, pady=5)
+        ttk.Entry(retention_frame, textvariable=self.exclude_globs, width=20).grid(row=1, column=3, columnspan=2, sticky=W)
+
         interval_frame = ttk.Frame(frame)
         interval_frame.pack(pady=5)
         ttk.Label(interval_frame, text="Auto-Delete Interval (seconds):").pack(side=ttk.LEFT, padx=5)
         ttk.Entry(interval_frame, textvariable=self.interval, width=10).pack(side=ttk.LEFT)
+        ttk.Label(interval_frame, text="Mode:").pack(side=ttk.LEFT, padx=5)
+        ttk.Combobox(interval_frame, textvariable=self.schedule_mode, values=[FIXED_RATE, FIXED_DELAY],
+                     state="readonly", width=11).pack(side=ttk.LEFT)
 
         button_frame = ttk.Frame(frame)
         button_frame.pack(pady=15)
@@ -71,6 +580,19 @@ class DeleteManagerApp:
         ttk.Button(button_frame, text="Start Auto-Deletion", command=self.start_schedule, bootstyle=SUCCESS).pack(side=ttk.LEFT, padx=10)
         ttk.Button(button_frame, text="Stop Auto-Deletion", command=self.stop_schedule, bootstyle=WARNING).pack(side=ttk.LEFT, padx=10)
 
+        columns = ("folder", "interval", "mode", "runs", "skipped", "last")
+        self.jobs_view = ttk.Treeview(frame, columns=columns, show="headings", height=5)
+        for col, heading, width in zip(columns, ("Folder", "Every (s)", "Mode", "Runs", "Skipped", "Last Result"),
+                                       (220, 70, 80, 50, 60, 200)):
+            self.jobs_view.heading(col, text=heading)
+            self.jobs_view.column(col, width=width, stretch=col in ("folder", "last"))
+        self.jobs_view.pack(fill=ttk.X, pady=5)
+        ttk.Button(frame, text="Remove Selected Schedule", command=self.remove_selected_schedule,
+                   bootstyle="warning-outline").pack()
+        self.last_results = {}
+
+        ttk.Button(frame, text="Audit Summary", command=self.show_audit_summary, bootstyle="info-outline").pack(pady=(10, 0))
+
         self.progress = ttk.Progressbar(frame, mode="indeterminate", length=200)
         self.progress.pack(pady=20)
 
@@ -89,58 +611,165 @@ class DeleteManagerApp:
             self.path = path
             self.path_label.config(text=path)
 
+    def process_ui_queue(self):
+        try:
+            while True:
+                task, args, kwargs = self.ui_queue.get_nowait()
+                task(*args, **kwargs)
+        except queue.Empty:
+            pass
+        finally:
+            self.root.after(100, self.process_ui_queue)
+
+    def _set_status(self, text):
+        self.status_label.config(text=text)
+
+    def set_status(self, text):
+        self.ui_queue.put((self._set_status, [text], {}))
+
+    def _refresh_jobs_view(self):
+        self.jobs_view.delete(*self.jobs_view.get_children())
+        for job in self.scheduler.jobs():
+            self.jobs_view.insert("", ttk.END, iid=job.folder, values=(
+                job.folder, job.interval, job.mode, job.runs, job.skipped, self.last_results.get(job.folder, "")))
+
+    def refresh_jobs_view(self):
+        self.ui_queue.put((self._refresh_jobs_view, [], {}))
+
+    def on_job_skipped(self, job):
+        self.last_results[job.folder] = "Skipped: previous run still active"
+        self.refresh_jobs_view()
+
+    def report_progress(self, done, total, rate):
+        percent = done / total * 100 if total else 100
+        text = f"Status: Wiping {percent:.0f}% @ {rate / (1024 * 1024):.1f} MB/s"
+        self.set_status(text)
+
+    def report_folder_progress(self, done, total, total_bytes):
+        text = f"Status: Shredded {done}/{total} files ({total_bytes / (1024 * 1024):.1f} MB)"
+        self.set_status(text)
+
+    def current_policy(self):
+        split = lambda raw: [g.strip() for g in raw.split(",") if g.strip()]
+        return RetentionPolicy(
+            max_age_days=self.max_age_days.get(),
+            quota_bytes=int(self.quota_mb.get() * 1024 * 1024),
+            include=split(self.include_globs.get()),
+            exclude=split(self.exclude_globs.get()),
+        )
+
+    def dry_run(self):
+        if not self.path or not os.path.isdir(self.path):
+            messagebox.showerror("Invalid", "Select a valid folder for the dry run.")
+            return
+        report = format_retention_report(self.path, self.current_policy().plan(self.path))
+        window = ttk.Toplevel(self.root)
+        window.title("Retention Dry Run")
+        text = ttk.ScrolledText(window, width=110, height=30, wrap="none")
+        text.pack(fill=ttk.BOTH, expand=True)
+        text.insert(ttk.END, report)
+        text.config(state="disabled")
+
+    def show_audit_summary(self):
+        window = ttk.Toplevel(self.root)
+        window.title(f"Wipe Audit Summary - {self.audit.log_file}")
+        columns = ("host", "device", "wipes", "failed", "gb", "avg", "slowest")
+        view = ttk.Treeview(window, columns=columns, show="headings", height=12)
+        for col, heading in zip(columns, ("Host", "Device", "Wipes", "Failed", "GB Written", "Avg MB/s", "Slowest MB/s")):
+            view.heading(col, text=heading)
+            view.column(col, width=100)
+        view.pack(fill=ttk.BOTH, expand=True, padx=10, pady=10)
+        for (host, device), g in sorted(self.audit.summary().items(), key=lambda kv: str(kv[0])):
+            avg = g["bytes_written"] / (1024 * 1024) / g["duration_sec"] if g["duration_sec"] else 0
+            view.insert("", ttk.END, values=(
+                host, device, g["wipes"], g["failed"], f"{g['bytes_written'] / 1024 ** 3:.2f}",
+                f"{avg:.1f}", g["slowest_mb_s"] if g["slowest_mb_s"] is not None else "-"))
+
     def delete_now(self):
-        if not self.path or os.path.isdir(self.path):
-            messagebox.showerror("Invalid", "Select a valid file for deletion.")
+        if not self.path or not os.path.exists(self.path):
+            messagebox.showerror("Invalid", "Select a valid file or folder for deletion.")
             return
+        args = (self.path, self.secure.get(), self.passes.get(), self.scheme.get())
+        if os.path.isdir(self.path):
+            if not messagebox.askyesno("Confirm", f"Shred files in {self.path} selected by the retention policy?"):
+                return
+            args += (self.current_policy(),)
+            threading.Thread(target=self._delete_folder_worker, args=args, daemon=True).start()
+        else:
+            threading.Thread(target=self._delete_file_worker, args=args, daemon=True).start()
+
+    def _delete_folder_worker(self, path, secure, passes, scheme, policy):
+        try:
+            summary = shred_folder(path, secure, passes, scheme, progress=self.report_folder_progress, policy=policy,
+                                   audit=self.audit)
+        except Exception as e:
+            self.set_status(f"Error: {e}")
+            self.ui_queue.put((messagebox.showerror, ["Error", str(e)], {}))
+            return
+        text = (f"Status: Folder cleaned - {summary['files']} files, {summary['failed']} failed "
+                f"in {summary['duration_sec']:.1f}s")
+        self.set_status(text)
+
+    def _delete_file_worker(self, path, secure, passes, scheme):
         try:
-            terminate_related_processes(self.path)
-            if self.secure.get():
-                secure_delete(self.path)
+            terminate_related_processes(path)
+            if secure:
+                secure_delete(path, passes, scheme, self.report_progress, self.audit)
             else:
-                os.remove(self.path)
-            self.status_label.config(text="Status: File deleted")
-            messagebox.showinfo("Success", "File deleted successfully.")
+                plain_delete(path, self.audit)
+            self.set_status("Status: File deleted")
+            self.ui_queue.put((messagebox.showinfo, ["Success", "File deleted successfully."], {}))
         except Exception as e:
-            self.status_label.config(text=f"Error: {e}")
-            messagebox.showerror("Error", str(e))
+            self.set_status(f"Error: {e}")
+            self.ui_queue.put((messagebox.showerror, ["Error", str(e)], {}))
 
     def start_schedule(self):
         if not self.path or not os.path.isdir(self.path):
             messagebox.showerror("Invalid", "Select a valid folder for scheduled deletion.")
             return
+        interval = self.interval.get()
+        if interval <= 0:
+            messagebox.showerror("Invalid", "Interval must be greater than zero.")
+            return
+        settings = (self.secure.get(), self.passes.get(), self.scheme.get(), self.current_policy())
+        self.scheduler.add(self.path, interval, self.schedule_mode.get(),
+                           lambda folder: self.delete_folder_contents(folder, *settings))
+        self.scheduler.start()
         self.progress.start()
         self.status_label.config(text="Status: Auto-deletion running")
-        self.schedule_next()
+        self._refresh_jobs_view()
+
+    def remove_selected_schedule(self):
+        for folder in self.jobs_view.selection():
+            self.scheduler.remove(folder)
+            self.last_results.pop(folder, None)
+        if not self.scheduler.jobs():
+            self.progress.stop()
+            self.status_label.config(text="Status: Auto-deletion stopped")
+        self._refresh_jobs_view()
 
     def stop_schedule(self):
-        if self.task:
-            self.task.cancel()
-            self.task = None
+        if self.scheduler.jobs():
+            self.scheduler.stop()
+            self.last_results.clear()
             self.progress.stop()
             self.status_label.config(text="Status: Auto-deletion stopped")
+            self._refresh_jobs_view()
             messagebox.showinfo("Stopped", "Auto-deletion stopped.")
 
-    def schedule_next(self):
-        self.task = threading.Timer(self.interval.get(), self.delete_folder_contents)
-        self.task.start()
-
-    def delete_folder_contents(self):
+    def delete_folder_contents(self, folder, secure, passes, scheme, policy=None):
         try:
-            for f in os.listdir(self.path):
-                fp = os.path.join(self.path, f)
-                if os.path.isfile(fp):
-                    terminate_related_processes(fp)
-                    if self.secure.get():
-                        secure_delete(fp)
-                    else:
-                        os.remove(fp)
-            self.status_label.config(text="Status: Folder cleaned")
+            summary = shred_folder(folder, secure, passes, scheme, progress=self.report_folder_progress,
+                                   policy=policy, audit=self.audit)
+            self.last_results[folder] = (f"{time.strftime('%H:%M:%S')} cleaned {summary['files']} files, "
+                                         f"{summary['failed']} failed")
+            self.set_status("Status: Folder cleaned")
         except Exception as e:
             logging.error(e)
-            self.status_label.config(text=f"Error: {e}")
+            self.last_results[folder] = f"Error: {e}"
+            self.set_status(f"Error: {e}")
         finally:
-            self.schedule_next()
+            self.refresh_jobs_view()
 
 def launch():
     app = ttk.Window(themename="darkly")
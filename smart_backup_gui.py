@@ -1,12 +1,219 @@
 import os
+import sys
+import json
+import time
+import argparse
 import shutil
+import hashlib
+import threading
 import pandas as pd
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
 from pathlib import Path
 import ttkbootstrap as ttk
 from ttkbootstrap.constants import *
 from tkinter import filedialog, messagebox, scrolledtext, END, N, S, E, W, BOTH
 
+try:
+    import xxhash
+except ImportError:
+    xxhash = None
+
+DEFAULT_CHUNK_SIZE = 50_000
+COPY_BUFFER_SIZE = 1024 * 1024
+MANIFEST_NAME = "backup_manifest.json"
+
+HASH_ALGORITHMS = {"blake2b": lambda: hashlib.blake2b(digest_size=32)}
+if xxhash is not None:
+    HASH_ALGORITHMS["xxh3_128"] = xxhash.xxh3_128
+
+def parse_filter_list(raw):
+    return {e.strip().lower() for e in raw.split(',') if e.strip()}
+
+def is_valid_file(p, exts, excludes):
+    try:
+        path_obj = Path(p)
+        if not path_obj.exists() or path_obj.suffix.lower() not in exts:
+            return False
+        return not any(part.lower() in excludes for part in path_obj.parts)
+    except Exception:
+        return False
+
+def iter_inventory_chunks(csv_file, exts, excludes, chunksize=DEFAULT_CHUNK_SIZE):
+    # Only the path columns are read, as plain strings, one chunk at a time so
+    # memory stays bounded by the chunk size rather than the inventory size.
+    columns = pd.read_csv(csv_file, nrows=0).columns
+    if 'file_path' in columns:
+        usecols = ['file_path']
+    elif {'Path', 'Name'}.issubset(columns):
+        usecols = ['Path', 'Name']
+    else:
+        raise ValueError("CSV must contain either 'file_path' or both 'Path' and 'Name' columns.")
+
+    reader = pd.read_csv(csv_file, usecols=usecols, dtype=str, keep_default_na=False, chunksize=chunksize)
+    for chunk in reader:
+        if 'file_path' in chunk.columns:
+            paths = chunk['file_path'].str.strip()
+        else:
+            paths = pd.Series(
+                [os.path.join(p.strip(), n.strip()) for p, n in zip(chunk['Path'], chunk['Name'])],
+                index=chunk.index, dtype=object)
+        yield paths[paths.map(lambda p: is_valid_file(p, exts, excludes)).astype(bool)]
+
+def copy_and_hash(src, dest, algorithm="blake2b"):
+    # Hash the bytes as they are streamed to the destination so verification
+    # costs no extra read of the source.
+    hasher = HASH_ALGORITHMS[algorithm]()
+    buf = bytearray(COPY_BUFFER_SIZE)
+    view = memoryview(buf)
+    size = 0
+    with open(src, 'rb') as fsrc, open(dest, 'wb') as fdst:
+        while n := fsrc.readinto(buf):
+            hasher.update(view[:n])
+            fdst.write(view[:n])
+            size += n
+    shutil.copystat(src, dest)
+    return hasher.hexdigest(), size
+
+def hash_file(path, algorithm="blake2b"):
+    hasher = HASH_ALGORITHMS[algorithm]()
+    buf = bytearray(COPY_BUFFER_SIZE)
+    view = memoryview(buf)
+    with open(path, 'rb') as f:
+        while n := f.readinto(buf):
+            hasher.update(view[:n])
+    return hasher.hexdigest()
+
+def write_manifest(backup_folder, entries, algorithm):
+    manifest = {
+        "algorithm": algorithm,
+        "created": datetime.now().isoformat(timespec="seconds"),
+        "files": entries,
+    }
+    with open(Path(backup_folder) / MANIFEST_NAME, 'w', encoding='utf-8') as f:
+        json.dump(manifest, f, indent=2)
+
+def verify_backup(backup_folder, workers=None):
+    backup_folder = Path(backup_folder)
+    with open(backup_folder / MANIFEST_NAME, encoding='utf-8') as f:
+        manifest = json.load(f)
+    algorithm = manifest["algorithm"]
+    if algorithm not in HASH_ALGORITHMS:
+        raise ValueError(f"Manifest uses unsupported hash algorithm '{algorithm}'.")
+
+    ok, mismatched, missing, unreadable = [], [], [], []
+    workers = workers or min(32, (os.cpu_count() or 1) * 2)
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        futures = {pool.submit(hash_file, backup_folder / rel, algorithm): rel
+                   for rel in manifest["files"]}
+        for future in as_completed(futures):
+            rel = futures[future]
+            try:
+                digest = future.result()
+            except FileNotFoundError:
+                missing.append(rel)
+                continue
+            except OSError as e:
+                unreadable.append((rel, e))
+                continue
+            if digest == manifest["files"][rel]["hash"]:
+                ok.append(rel)
+            else:
+                mismatched.append(rel)
+    return ok, mismatched, missing, unreadable
+
+def copy_file(src, backup_folder, manifest=None, algorithm="blake2b", log=print):
+    src = Path(src)
+    try:
+        rel = src.relative_to(src.anchor)
+        dest = backup_folder / rel
+        dest.parent.mkdir(parents=True, exist_ok=True)
+        if manifest is None:
+            shutil.copy2(src, dest)
+            size = dest.stat().st_size
+        else:
+            digest, size = copy_and_hash(src, dest, algorithm)
+            manifest[rel.as_posix()] = {"size": size, "hash": digest}
+        log(f"✅ Copied: {src}")
+        return size, None
+    except PermissionError as pe:
+        log(f"🔒 Permission denied: {src} => {pe}")
+        return None, pe
+    except Exception as e:
+        log(f"❌ Error copying {src}: {e}")
+        return None, e
+
+def run_backup_job(paths, backup_root, algorithm=None, log=print):
+    # Shared by the window and the headless runner. Passing a hash algorithm
+    # enables the checksum manifest. Returns a JSON-serialisable run report.
+    started = datetime.now()
+    now = started.strftime("%Y%m%d_%H%M%S")
+    backup_name = f"python-files-{now}"
+    backup_folder = Path(backup_root) / backup_name
+    zip_path = Path(backup_root) / f"{backup_name}.zip"
+    backup_folder.mkdir(parents=True, exist_ok=True)
+
+    matched = copied = total_bytes = 0
+    failures = []
+    manifest = {} if algorithm else None
+
+    try:
+        for src in paths:
+            matched += 1
+            size, error = copy_file(src, backup_folder, manifest, algorithm, log)
+            if error is None:
+                copied += 1
+                total_bytes += size
+            else:
+                failures.append({"path": str(src), "error": str(error)})
+    except Exception as e:
+        log(f"❌ Error loading CSV: {e}")
+        failures.append({"path": None, "error": f"Error loading CSV: {e}"})
+
+    report = {
+        "started": started.isoformat(timespec="seconds"),
+        "backup_folder": str(backup_folder),
+        "zip_path": None,
+        "manifest": None,
+        "files_matched": matched,
+        "files_copied": copied,
+        "bytes_copied": total_bytes,
+        "failures": failures,
+    }
+
+    if not matched:
+        log("⚠️ No valid files to back up.")
+        backup_folder.rmdir()
+    else:
+        if manifest is not None:
+            try:
+                write_manifest(backup_folder, manifest, algorithm)
+                report["manifest"] = str(backup_folder / MANIFEST_NAME)
+                log(f"🧮 Manifest written: {backup_folder / MANIFEST_NAME}")
+            except Exception as e:
+                log(f"❌ Manifest creation failed: {e}")
+                failures.append({"path": str(backup_folder / MANIFEST_NAME), "error": str(e)})
+
+        try:
+            shutil.make_archive(str(zip_path).replace('.zip', ''), 'zip', backup_folder)
+            report["zip_path"] = str(zip_path)
+            log(f"📦 ZIP created: {zip_path}")
+        except Exception as e:
+            log(f"❌ ZIP creation failed: {e}")
+            failures.append({"path": str(zip_path), "error": str(e)})
+
+        log("--- Summary ---")
+        log(f"✅ Copied: {copied}")
+        log(f"⚠️ Skipped: {matched - copied}")
+        log(f"❌ Failed: {matched - copied}")
+
+    duration = (datetime.now() - started).total_seconds()
+    report["files_failed"] = matched - copied
+    report["duration_sec"] = round(duration, 3)
+    report["throughput_mb_s"] = round(total_bytes / (1024 * 1024) / duration, 2) if duration else None
+    report["success"] = not failures
+    return report
+
 class BackupApp:
     def __init__(self, root):
         self.root = root
@@ -15,6 +222,10 @@ class BackupApp:
         self.backup_path = ttk.StringVar(value="C:/Backups")
         self.ext_filter = ttk.StringVar(value=".py,.vba,.md,.docx,.xlsx,.pdf,.ps1")
         self.exclude_filter = ttk.StringVar(value=".git,venv,__pycache__")
+        self.streaming = ttk.BooleanVar(value=False)
+        self.chunk_size = ttk.IntVar(value=DEFAULT_CHUNK_SIZE)
+        self.verify = ttk.BooleanVar(value=False)
+        self.hash_algorithm = ttk.StringVar(value="blake2b")
         self.setup_ui()
 
     def setup_ui(self):
@@ -24,7 +235,7 @@ class BackupApp:
         self.root.rowconfigure(0, weight=1)
 
         frm.columnconfigure(1, weight=1)
-        frm.rowconfigure(7, weight=1)
+        frm.rowconfigure(8, weight=1)
 
         ttk.Label(frm, text="CSV File:").grid(row=0, column=0, sticky=W)
         ttk.Entry(frm, textvariable=self.csv_path, width=60).grid(row=0, column=1)
@@ -40,12 +251,25 @@ class BackupApp:
         ttk.Label(frm, text="Exclude folders (comma-separated):").grid(row=4, column=0, columnspan=2, sticky=W)
         ttk.Entry(frm, textvariable=self.exclude_filter, width=60).grid(row=5, column=0, columnspan=2, sticky=W)
 
-        ttk.Button(frm, text="Preview Backup", bootstyle=INFO, command=self.preview_backup).grid(row=6, column=0, pady=10)
-        ttk.Button(frm, text="Run Backup", bootstyle=SUCCESS, command=self.run_backup).grid(row=6, column=1, pady=10, sticky=E)
-        ttk.Button(frm, text="Exit", bootstyle=DANGER, command=self.root.quit).grid(row=6, column=2, pady=10)
+        stream_frm = ttk.Frame(frm)
+        stream_frm.grid(row=6, column=0, columnspan=3, sticky=W, pady=(10, 0))
+        ttk.Checkbutton(stream_frm, text="Stream CSV in chunks (large inventories)", variable=self.streaming).pack(side=LEFT)
+        ttk.Label(stream_frm, text="Rows per chunk:").pack(side=LEFT, padx=(15, 5))
+        ttk.Entry(stream_frm, textvariable=self.chunk_size, width=10).pack(side=LEFT)
+        ttk.Checkbutton(stream_frm, text="Verify (checksum manifest)", variable=self.verify).pack(side=LEFT, padx=(15, 5))
+        ttk.Combobox(stream_frm, textvariable=self.hash_algorithm, values=list(HASH_ALGORITHMS),
+                     state="readonly", width=10).pack(side=LEFT)
+
+        ttk.Button(frm, text="Preview Backup", bootstyle=INFO, command=self.preview_backup).grid(row=7, column=0, pady=10)
+        action_frm = ttk.Frame(frm)
+        action_frm.grid(row=7, column=1, pady=10, sticky=E+W)
+        self.verify_button = ttk.Button(action_frm, text="Verify Backup", bootstyle=SECONDARY, command=self.verify_archive)
+        self.verify_button.pack(side=LEFT)
+        ttk.Button(action_frm, text="Run Backup", bootstyle=SUCCESS, command=self.run_backup).pack(side=RIGHT)
+        ttk.Button(frm, text="Exit", bootstyle=DANGER, command=self.root.quit).grid(row=7, column=2, pady=10)
 
         self.log_output = scrolledtext.ScrolledText(frm, height=20, wrap='word', font=('Courier New', 10))
-        self.log_output.grid(row=7, column=0, columnspan=3, sticky=N+S+E+W)
+        self.log_output.grid(row=8, column=0, columnspan=3, sticky=N+S+E+W)
         self.log_output.insert(END, "Welcome to the Smart Backup Tool!\n")
         self.log_output.insert(END, "Please select a CSV file and a backup folder.\n")
         self.log_output.insert(END, "You can filter files by extensions and exclude specific folders.\n")
@@ -78,35 +302,47 @@ class BackupApp:
                 else:
                     raise ValueError("CSV must contain either 'file_path' or both 'Path' and 'Name' columns.")
 
-            exts = {e.strip().lower() for e in self.ext_filter.get().split(',') if e.strip()}
-            excludes = {e.strip().lower() for e in self.exclude_filter.get().split(',') if e.strip()}
+            exts = parse_filter_list(self.ext_filter.get())
+            excludes = parse_filter_list(self.exclude_filter.get())
             df['file_path'] = df['file_path'].astype(str).str.strip()
 
-            def is_valid_file(p):
-                try:
-                    path_obj = Path(p)
-                    if not path_obj.exists() or path_obj.suffix.lower() not in exts:
-                        return False
-                    return not any(part.lower() in excludes for part in path_obj.parts)
-                except Exception:
-                    return False
-
-            df['valid'] = df['file_path'].apply(is_valid_file)
+            df['valid'] = df['file_path'].apply(lambda p: is_valid_file(p, exts, excludes))
             return df[df['valid']].copy(), exts
 
         except Exception as e:
             self.log(f"❌ Error loading CSV: {e}")
             return None, None
 
+    def iter_valid_paths(self):
+        csv_file = Path(self.csv_path.get())
+        exts = parse_filter_list(self.ext_filter.get())
+        excludes = parse_filter_list(self.exclude_filter.get())
+        chunksize = max(1, self.chunk_size.get())
+        for paths in iter_inventory_chunks(csv_file, exts, excludes, chunksize):
+            yield from paths
+
     def preview_backup(self):
         self.log_output.delete(1.0, END)
-        df, _ = self.load_csv_and_filter()
-        if df is None or df.empty:
-            self.log("⚠️ No valid files found.")
-            return
+        if self.streaming.get():
+            total_files = total_size = 0
+            try:
+                for p in self.iter_valid_paths():
+                    total_files += 1
+                    total_size += Path(p).stat().st_size
+            except Exception as e:
+                self.log(f"❌ Error loading CSV: {e}")
+                return
+            if not total_files:
+                self.log("⚠️ No valid files found.")
+                return
+        else:
+            df, _ = self.load_csv_and_filter()
+            if df is None or df.empty:
+                self.log("⚠️ No valid files found.")
+                return
+            total_files = len(df)
+            total_size = sum(Path(p).stat().st_size for p in df['file_path'])
 
-        total_files = len(df)
-        total_size = sum(Path(p).stat().st_size for p in df['file_path'])
         size_mb = total_size / (1024 * 1024)
         self.log(f"🔍 Preview:")
         self.log(f"🧾 Files matched: {total_files}")
@@ -119,48 +355,114 @@ class BackupApp:
             messagebox.showerror("Error", "Invalid Backup path.")
             return
 
-        df, _ = self.load_csv_and_filter()
-        if df is None or df.empty:
-            self.log("⚠️ No valid files to back up.")
-            return
-
-        now = datetime.now().strftime("%Y%m%d_%H%M%S")
-        backup_name = f"python-files-{now}"
-        backup_folder = backup_root / backup_name
-        zip_path = backup_root / f"{backup_name}.zip"
-        backup_folder.mkdir(parents=True, exist_ok=True)
+        if self.streaming.get():
+            paths = self.iter_valid_paths()
+        else:
+            df, _ = self.load_csv_and_filter()
+            if df is None or df.empty:
+                self.log("⚠️ No valid files to back up.")
+                return
+            paths = df['file_path']
 
-        copied = skipped = failed = 0
+        algorithm = self.hash_algorithm.get() if self.verify.get() else None
+        run_backup_job(paths, backup_root, algorithm, log=self.log)
 
-        for _, row in df.iterrows():
-            try:
-                src = Path(row['file_path'])
-                rel_path = src.drive + src.as_posix()[2:]
-                rel = Path(rel_path).relative_to(Path(src.drive + "/"))
-                dest = backup_folder / rel
-                dest.parent.mkdir(parents=True, exist_ok=True)
-                shutil.copy2(src, dest)
-                copied += 1
-                self.log(f"✅ Copied: {src}")
-            except PermissionError as pe:
-                failed += 1
-                self.log(f"🔒 Permission denied: {src} => {pe}")
-            except Exception as e:
-                failed += 1
-                self.log(f"❌ Error copying {src}: {e}")
+    def verify_archive(self):
+        folder = filedialog.askdirectory(title="Select Backup Folder")
+        if not folder:
+            return
+        self.log_output.delete(1.0, END)
+        if not (Path(folder) / MANIFEST_NAME).exists():
+            messagebox.showerror("Error", f"No {MANIFEST_NAME} found in the selected folder.")
+            return
+        self.log(f"🔎 Verifying: {folder}")
+        self.verify_button.configure(state=DISABLED)
+        threading.Thread(target=self._verify_worker, args=(folder,), daemon=True).start()
 
+    def _verify_worker(self, folder):
+        # Hashing a large backup takes a while; keep it off the Tk thread and
+        # hand the outcome back through root.after.
         try:
-            shutil.make_archive(str(zip_path).replace('.zip', ''), 'zip', backup_folder)
-            self.log(f"📦 ZIP created: {zip_path}")
+            result = verify_backup(folder)
         except Exception as e:
-            self.log(f"❌ ZIP creation failed: {e}")
+            self.root.after(0, self._show_verify_result, None, e)
+            return
+        self.root.after(0, self._show_verify_result, result, None)
+
+    def _show_verify_result(self, result, error):
+        self.verify_button.configure(state=NORMAL)
+        if error is not None:
+            self.log(f"❌ Verification failed: {error}")
+            return
+
+        ok, mismatched, missing, unreadable = result
+        for rel in mismatched:
+            self.log(f"❌ Checksum mismatch: {rel}")
+        for rel in missing:
+            self.log(f"⚠️ Missing: {rel}")
+        for rel, e in unreadable:
+            self.log(f"🔒 Unreadable: {rel} => {e}")
+        self.log("--- Verification ---")
+        self.log(f"✅ Verified: {len(ok)}")
+        self.log(f"❌ Mismatched: {len(mismatched)}")
+        self.log(f"⚠️ Missing: {len(missing)}")
+        self.log(f"🔒 Unreadable: {len(unreadable)}")
+
+def run_headless(args):
+    backup_root = Path(args.dest)
+    if not backup_root.is_dir():
+        print(f"❌ Invalid Backup path: {backup_root}", file=sys.stderr)
+        return 2
+
+    exts = parse_filter_list(args.ext)
+    excludes = parse_filter_list(args.exclude)
+    paths = (p for chunk in iter_inventory_chunks(args.csv, exts, excludes, args.chunk_size) for p in chunk)
+    log = (lambda msg: None) if args.quiet else (lambda msg: print(msg, flush=True))
+    report = run_backup_job(paths, backup_root, args.hash if args.verify else None, log=log)
+    report["csv"] = str(Path(args.csv).absolute())
+
+    if args.report:
+        report_path = Path(args.report)
+    else:
+        report_path = backup_root / f"backup_report_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
+    with open(report_path, 'w', encoding='utf-8') as f:
+        json.dump(report, f, indent=2)
+    print(f"🧾 Report written: {report_path}", flush=True)
+    return 0 if report["success"] else 1
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Run the Smart Backup pipeline without the window.")
+    parser.add_argument("--csv", required=True, help="Inventory CSV with 'file_path' or 'Path' + 'Name' columns")
+    parser.add_argument("--dest", required=True, help="Backup root folder")
+    parser.add_argument("--ext", default=".py,.vba,.md,.docx,.xlsx,.pdf,.ps1", help="Extensions to include (comma-separated)")
+    parser.add_argument("--exclude", default=".git,venv,__pycache__", help="Folders to exclude (comma-separated)")
+    parser.add_argument("--chunk-size", type=int, default=DEFAULT_CHUNK_SIZE, help="CSV rows read per chunk")
+    parser.add_argument("--verify", action="store_true", help="Write a checksum manifest while copying")
+    parser.add_argument("--hash", default="blake2b", choices=list(HASH_ALGORITHMS), help="Checksum algorithm for --verify")
+    parser.add_argument("--report", help="JSON report path (default: backup_report_<timestamp>.json in --dest)")
+    parser.add_argument("--every", type=float, help="Keep running and start a backup every N seconds")
+    parser.add_argument("--quiet", action="store_true", help="Only print the report location")
+    args = parser.parse_args(argv)
+
+    if not args.every:
+        return run_headless(args)
 
-        self.log("--- Summary ---")
-        self.log(f"✅ Copied: {copied}")
-        self.log(f"⚠️ Skipped: {len(df) - copied}")
-        self.log(f"❌ Failed: {failed}")
+    exit_code = 0
+    next_run = time.monotonic()
+    try:
+        while True:
+            exit_code = run_headless(args)
+            next_run += args.every
+            # Fixed-rate schedule: skip missed slots instead of running back to back.
+            while next_run <= time.monotonic():
+                next_run += args.every
+            time.sleep(next_run - time.monotonic())
+    except KeyboardInterrupt:
+        return exit_code
 
 if __name__ == '__main__':
+    if len(sys.argv) > 1:
+        sys.exit(main())
     app = ttk.Window(themename="darkly", size=(600, 400))
     BackupApp(app)
     app.mainloop()